@@ -0,0 +1 @@
+Add the "auto" integrator method, which selects the ODE method from a short pilot run of the system.
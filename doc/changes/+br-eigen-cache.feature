@@ -0,0 +1 @@
+Add the "eigen_cache" and "eigen_tol" options of `BRSolver` to reuse the eigen-decompositions of time-dependent Hamiltonians.
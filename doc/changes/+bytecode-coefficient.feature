@@ -0,0 +1 @@
+String coefficients that are not compiled are evaluated by a bytecode interpreter when possible (new `use_bytecode` compilation option).
@@ -0,0 +1 @@
+Coefficients can be evaluated over an array of times. Add `CoefficientBank` to interpolate many arrays sharing one tlist.
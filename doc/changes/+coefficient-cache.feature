@@ -0,0 +1 @@
+Add a shared cache of compiled string coefficients, set with `qutip.settings.coeff_cache`, and `python -m qutip warm-coeff-cache` to fill it.
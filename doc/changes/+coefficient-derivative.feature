@@ -0,0 +1 @@
+Add `Coefficient.derivative` and `QobjEvo.derivative`.
@@ -0,0 +1 @@
+Add `Coefficient.optimize` to fold and fuse trees of coefficients. `QobjEvo.compress` uses it.
@@ -0,0 +1 @@
+Add `compile_coefficients` to compile many string coefficients in one module. `QobjEvo` uses it for multiple string coefficients and accepts `compile_opt`.
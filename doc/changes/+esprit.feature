@@ -0,0 +1 @@
+Add `BosonicEnvironment.approx_by_esprit` to decompose correlation functions into exponents with the ESPRIT method.
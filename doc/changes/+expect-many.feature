@@ -0,0 +1 @@
+Add `data.ExpectMany` and `data.expect_many` to compute many expectation values in one pass over the state. Results use it for `Qobj` e_ops.
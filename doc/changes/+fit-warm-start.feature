@@ -0,0 +1 @@
+Add the `warm_start` and `jac` options to `iterated_fit`. Environment fits use them to converge faster.
@@ -0,0 +1 @@
+Add the `ado_threshold` option of `HEOMSolver` to drop unimportant ADOs, and the "ado_filter" option to filter small ADOs during matrix-free evolutions.
@@ -0,0 +1 @@
+Support `HEOMSolver` in `correlation_3op`.
@@ -0,0 +1 @@
+Add the `matrix_free` option to `HEOMSolver` to evolve the hierarchy without building the RHS matrix.
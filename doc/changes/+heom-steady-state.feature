@@ -0,0 +1 @@
+Add the "gmres", "lgmres" and "bicgstab" methods to `HEOMSolver.steady_state`, with a block-Jacobi preconditioner and warm start.
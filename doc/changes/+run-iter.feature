@@ -0,0 +1 @@
+Add `run_iter` to solvers to yield the states or expectation values as the evolution progresses.
@@ -0,0 +1 @@
+Add `Event` to detect conditions during `Solver.run`, with optional terminal events stopping the evolution.
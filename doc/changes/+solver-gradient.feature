@@ -0,0 +1 @@
+Add `gradient` to `SESolver` and `MESolver` to compute the derivatives of an expectation value with respect to args using the adjoint method.
@@ -0,0 +1 @@
+Add the "state_storage" solver option to write stored states to disk. "store_states" also accepts an integer to only store every k-th state.
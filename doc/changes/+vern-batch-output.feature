@@ -0,0 +1 @@
+Add the "batch_output" option to the vern7 and vern9 integrators to compute expectation values from the dense output of each step.
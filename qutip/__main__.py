@@ -0,0 +1,70 @@
+"""
+Command line interface of QuTiP.
+
+``python -m qutip about``
+    Print information about the installation.
+
+``python -m qutip warm-coeff-cache [FILES] [--pickle FILES] [--args ARGS]``
+    Compile string coefficients and publish them to the shared cache of
+    compiled coefficients, ``qutip.settings.coeff_cache``.
+"""
+import argparse
+import ast
+import pickle
+import sys
+
+
+def _warm_coeff_cache(options):
+    import qutip
+    from qutip.core.coefficient import warm_coefficient_cache
+    if options.cache:
+        qutip.settings.coeff_cache = options.cache
+    bases = []
+    for file_name in options.files:
+        # One coefficient string per line.
+        with open(file_name) as file:
+            bases += [line.strip() for line in file if line.strip()]
+    objects = []
+    for file_name in options.pickle:
+        with open(file_name, "rb") as file:
+            objects.append(pickle.load(file))
+    args = ast.literal_eval(options.args) if options.args else {}
+    modules = warm_coefficient_cache(bases, args=args, objects=objects)
+    print(f"{len(modules)} modules in {qutip.settings.coeff_cache}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m qutip")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("about", help="information about the installation")
+    warm = commands.add_parser(
+        "warm-coeff-cache",
+        help="compile string coefficients into the shared cache",
+    )
+    warm.add_argument(
+        "files", nargs="*",
+        help="files with one coefficient string per line",
+    )
+    warm.add_argument(
+        "--pickle", nargs="*", default=[],
+        help="pickled solvers or QobjEvo using string coefficients",
+    )
+    warm.add_argument(
+        "--args", default="",
+        help="dict of the coefficients' arguments, e.g. \"{'w': 1.}\"",
+    )
+    warm.add_argument(
+        "--cache",
+        help="cache folder, default to the QUTIP_COEFF_CACHE variable",
+    )
+    options = parser.parse_args(argv)
+    if options.command == "about":
+        import qutip
+        qutip.about()
+    elif options.command == "warm-coeff-cache":
+        _warm_coeff_cache(options)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@ cimport cython
 
 import qutip.core.data as _data
 from qutip.core.data cimport Dense, CSR, Data, idxint, csr
+from qutip.core.data.base import idxint_dtype
 from qutip.core.cy.qobjevo cimport QobjEvo
 from qutip.core.cy.coefficient cimport Coefficient
 from qutip.core.cy._element cimport _BaseElement, _MapElement, _ProdElement
@@ -23,6 +24,58 @@ cpdef enum TensorType:
     DATA = 2
 
 
+cdef tuple _secular_windows(double[:, ::1] skew, double cutoff):
+    """
+    Find the pairs of Bohr frequencies within the secular cutoff without
+    comparing all of them.
+
+    Return ``(freqs, order, start, stop)``: the flattened frequencies
+    ``skew[a, b]``, the order sorting them and, for each pair ``a * N + b``,
+    the slice ``order[start:stop]`` of the pairs whose frequency is close to
+    its own. Pairs on the border of the window must still be checked
+    against the cutoff.
+    """
+    freqs = np.asarray(skew).ravel()
+    order = np.argsort(freqs, kind="stable")
+    sorted_freqs = freqs[order]
+    start = np.searchsorted(sorted_freqs, freqs - cutoff, side="left")
+    stop = np.searchsorted(sorted_freqs, freqs + cutoff, side="right")
+    return (
+        freqs,
+        order.astype(idxint_dtype),
+        start.astype(idxint_dtype),
+        stop.astype(idxint_dtype),
+    )
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef CSR _secular_mask(double[:, ::1] skew, double cutoff):
+    """
+    Mask of the elements of the tensor kept by the secular approximation.
+    """
+    cdef size_t nrows = skew.shape[0], p, j
+    cdef idxint q
+    cdef double[::1] freqs
+    cdef idxint[::1] order, start, stop
+    cdef vector[idxint] coo_rows, coo_cols
+    cdef vector[double complex] coo_data
+
+    freqs, order, start, stop = _secular_windows(skew, cutoff)
+    for p in range(nrows * nrows):
+        for j in range(start[p], stop[p]):
+            q = order[j]
+            if fabs(freqs[p] - freqs[q]) < cutoff:
+                coo_rows.push_back(p)
+                coo_cols.push_back(q)
+                coo_data.push_back(1.)
+
+    return csr.from_coo_pointers(
+        coo_rows.data(), coo_cols.data(), coo_data.data(),
+        nrows*nrows, nrows*nrows, coo_rows.size()
+    )
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cpdef Data _br_term_data(Data A, double[:, ::1] spectrum,
@@ -31,8 +84,7 @@ cpdef Data _br_term_data(Data A, double[:, ::1] spectrum,
     Compute the contribution of A to the Bloch Redfield tensor.
     Computation are done using dispatched function.
     """
-    cdef object cutoff_arr
-    cdef int nrows = A.shape[0], a, b, c, d
+    cdef int nrows = A.shape[0]
     cdef Data S, I, AS, AST, out, C
     cdef type cls = type(A)
 
@@ -49,17 +101,7 @@ cpdef Data _br_term_data(Data A, double[:, ::1] spectrum,
     if cutoff == np.inf:
         return out
 
-    # The cutoff_arr should be sparse most of the time, but it depend on the
-    # cutoff and we cannot easily guess a nnz to make it efficiently...
-    # But there is probably room from improvement.
-    cutoff_arr = np.zeros((nrows*nrows, nrows*nrows), dtype=np.complex128)
-    for a in range(nrows):
-        for b in range(nrows):
-            for c in range(nrows):
-                for d in range(nrows):
-                    if fabs(skew[a, b] - skew[c, d]) < cutoff:
-                        cutoff_arr[a * nrows + b, c * nrows + d] = 1.
-    C = _data.to(cls, _data.Dense(cutoff_arr, copy=False))
+    C = _data.to(cls, _secular_mask(skew, cutoff))
     return _data.multiply(out, C)
 
 
@@ -124,10 +166,11 @@ cpdef CSR _br_term_sparse(Data A, double[:, :] spectrum,
     Create it as coo pointers and return as CSR.
     """
     cdef size_t nrows = A.shape[0]
-    cdef size_t a, b, c, d, k, d_min # matrix indexing variables
-    cdef double complex elem, ac_elem, bd_elem
+    cdef size_t a, b, c, d, k, p, q, j # matrix indexing variables
+    cdef double complex elem
     cdef double complex[:,:] A_mat, ac_term, bd_term
-    cdef double dskew
+    cdef double[::1] freqs
+    cdef idxint[::1] order, start, stop
     cdef object np2term
     cdef vector[idxint] coo_rows, coo_cols
     cdef vector[double complex] coo_data
@@ -150,32 +193,28 @@ cpdef CSR _br_term_sparse(Data A, double[:, :] spectrum,
             elif skew[a, b] > cutoff:
                 break
 
-    # skew[a,b] = w[a] - w[b]
-    # (w[a] - w[b] - w[c] + w[d]) < cutoff
-    # w's are sorted so we can skip part of the loop.
-    for a in range(nrows):
-        for b in range(nrows):
-            d_min = 0
-            for c in range(nrows):
-                if skew[a, b] - skew[c, nrows-1] <= -cutoff:
-                    break
-                for d in range(d_min, nrows):
-                    dskew = skew[a, b] - skew[c, d]
-                    if -dskew > cutoff:
-                        d_min = d
-                    elif fabs(dskew) < cutoff:
-                        elem = (A_mat[a, c] * A_mat[d, b]) * 0.5
-                        elem *= (spectrum[c, a] + spectrum[d, b])
-                        if a == c:
-                            elem -= 0.5 * ac_term[d, b]
-                        if b == d:
-                            elem -= 0.5 * bd_term[a, c]
-                        if elem != 0:
-                            coo_rows.push_back(a * nrows + b)
-                            coo_cols.push_back(c * nrows + d)
-                            coo_data.push_back(elem)
-                    elif dskew >= cutoff:
-                        break
+    # Only visit the pairs (c, d) with a Bohr frequency within the cutoff of
+    # the one of (a, b), found by sorting the frequencies.
+    freqs, order, start, stop = _secular_windows(skew, cutoff)
+    for p in range(nrows * nrows):
+        a = p // nrows
+        b = p % nrows
+        for j in range(start[p], stop[p]):
+            q = order[j]
+            if fabs(freqs[p] - freqs[q]) >= cutoff:
+                continue
+            c = q // nrows
+            d = q % nrows
+            elem = (A_mat[a, c] * A_mat[d, b]) * 0.5
+            elem *= (spectrum[c, a] + spectrum[d, b])
+            if a == c:
+                elem -= 0.5 * ac_term[d, b]
+            if b == d:
+                elem -= 0.5 * bd_term[a, c]
+            if elem != 0:
+                coo_rows.push_back(p)
+                coo_cols.push_back(q)
+                coo_data.push_back(elem)
 
     return csr.from_coo_pointers(
         coo_rows.data(), coo_cols.data(), coo_data.data(),
@@ -209,6 +248,12 @@ cdef class _BlochRedfieldElement(_BaseElement):
     cdef readonly double[:, ::1] spectrum
     cdef readonly bint eig_basis
     cdef readonly TensorType tensortype
+    # Tensor in the eigen basis at the time of the last call.
+    cdef double _t_cache
+    cdef Data _BR_eig_cache
+
+    def __cinit__(self, *args, **kwargs):
+        self._t_cache = np.nan
 
     def __init__(self, H, a_op, spectra, sec_cutoff, eig_basis=False,
                  dtype=None):
@@ -268,31 +313,39 @@ cdef class _BlochRedfieldElement(_BaseElement):
         raise ValueError('Invalid tensortype')
 
     cpdef object qobj(self, t):
-        return Qobj(self.data(t), dims=self.dims, copy=False, superrep="super")
+        # The data can be the cached tensor, which must not be shared.
+        return Qobj(self.data(t), dims=self.dims, copy=True, superrep="super")
 
     cpdef object coeff(self, t):
         return 1.
 
-    cpdef Data data(self, t):
-        cdef size_t i
+    cdef Data _compute_br_eig(self, double t):
+        "Compute the tensor in the eigen basis"
         cdef double cutoff = self.sec_cutoff * self._compute_spectrum(t)
         A_eig = self.H.to_eigbasis(t, self.a_op._call(t))
-        BR_eig = self._br_term(A_eig, cutoff)
+        return self._br_term(A_eig, cutoff)
+
+    cdef Data _br_eig(self, double t):
+        "Return the tensor in the eigen basis, reused when t is unchanged."
+        if t != self._t_cache:
+            self._BR_eig_cache = self._compute_br_eig(t)
+            self._t_cache = t
+        return self._BR_eig_cache
+
+    cpdef Data data(self, t):
+        cdef Data BR_eig = self._br_eig(t)
         if self.eig_basis:
             return BR_eig
         return self.H.from_eigbasis(t, BR_eig)
 
     cdef Data matmul_data_t(self, t, Data state, Data out=None):
-        cdef size_t i
-        cdef double cutoff = self.sec_cutoff * self._compute_spectrum(t)
-        cdef Data A_eig, BR_eig
+        cdef Data BR_eig
 
         if not self.eig_basis:
             state = self.H.to_eigbasis(t, state)
         if not self.eig_basis and out is not None:
             out = self.H.to_eigbasis(t, out)
-        A_eig = self.H.to_eigbasis(t, self.a_op._call(t))
-        BR_eig = self._br_term(A_eig, cutoff)
+        BR_eig = self._br_eig(t)
         out = _data.add(_data.matmul(BR_eig, state, dtype=type(state)), out, dtype=type(state))
         if not self.eig_basis:
             out = self.H.from_eigbasis(t, out)
@@ -304,8 +357,7 @@ cdef class _BlochRedfieldElement(_BaseElement):
     def replace_arguments(self, args, cache=None):
         if cache is None:
             return _BlochRedfieldElement(
-                _EigenBasisTransform(QobjEvo(self.H.oper, args=args),
-                                     type(self.H.oper) is CSR),
+                self.H._replace_arguments(args),
                 QobjEvo(self.a_op, args=args),
                 self.spectra,
                 self.sec_cutoff
@@ -317,8 +369,7 @@ cdef class _BlochRedfieldElement(_BaseElement):
             if old is self.H:
                 H = new
         if H is None:
-            H = _EigenBasisTransform(QobjEvo(self.H.oper, args=args),
-                                     type(self.H.oper) is CSR)
+            H = self.H._replace_arguments(args)
         new = _BlochRedfieldElement(
             H, QobjEvo(self.a_op, args=args),
             self.spectra.replace_arguments(**args), self.sec_cutoff
@@ -347,8 +398,7 @@ cpdef Data _br_cterm_data(Data A, Data B, double[:, ::1] spectrum,
     Compute the contribution of A to the Bloch Redfield tensor.
     Computation are done using dispatched function.
     """
-    cdef object cutoff_arr
-    cdef int nrows = A.shape[0], a, b, c, d
+    cdef int nrows = A.shape[0]
     cdef Data S, I, P1, P2, P3, P4
     cdef type cls = type(A)
 
@@ -365,17 +415,7 @@ cpdef Data _br_cterm_data(Data A, Data B, double[:, ::1] spectrum,
     if cutoff == np.inf:
         return out
 
-    # The cutoff_arr should be sparse most of the time, but it depend on the
-    # cutoff and we cannot easily guess a nnz to make it efficiently...
-    # But there is probably room from improvement.
-    cutoff_arr = np.zeros((nrows*nrows, nrows*nrows), dtype=np.complex128)
-    for a in range(nrows):
-        for b in range(nrows):
-            for c in range(nrows):
-                for d in range(nrows):
-                    if fabs(skew[a, b] - skew[c, d]) < cutoff:
-                        cutoff_arr[a * nrows + b, c * nrows + d] = 1.
-    C = _data.to(cls, _data.Dense(cutoff_arr, copy=False))
+    C = _data.to(cls, _secular_mask(skew, cutoff))
     return _data.multiply(out, C)
 
 
@@ -444,10 +484,11 @@ cpdef CSR _br_cterm_sparse(Data A, Data B, double[:, :] spectrum,
     Create it as coo pointers and return as CSR.
     """
     cdef size_t nrows = A.shape[0]
-    cdef size_t a, b, c, d, k, d_min # matrix indexing variables
-    cdef double complex elem, ac_elem, bd_elem
-    cdef double complex[:,:] A_mat, ac_term, bd_term
-    cdef double dskew
+    cdef size_t a, b, c, d, k, p, q, j # matrix indexing variables
+    cdef double complex elem
+    cdef double complex[:,:] A_mat, B_mat, ac_term, bd_term
+    cdef double[::1] freqs
+    cdef idxint[::1] order, start, stop
     cdef object np2term
     cdef vector[idxint] coo_rows, coo_cols
     cdef vector[double complex] coo_data
@@ -475,32 +516,28 @@ cpdef CSR _br_cterm_sparse(Data A, Data B, double[:, :] spectrum,
             elif skew[a, b] > cutoff:
                 break
 
-    # skew[a,b] = w[a] - w[b]
-    # (w[a] - w[b] - w[c] + w[d]) < cutoff
-    # w's are sorted so we can skip part of the loop.
-    for a in range(nrows):
-        for b in range(nrows):
-            d_min = 0
-            for c in range(nrows):
-                if skew[a, b] - skew[c, nrows-1] <= -cutoff:
-                    break
-                for d in range(d_min, nrows):
-                    dskew = skew[a, b] - skew[c, d]
-                    if -dskew > cutoff:
-                        d_min = d
-                    elif fabs(dskew) < cutoff:
-                        elem = (B_mat[a, c] * A_mat[d, b]) * 0.5
-                        elem *= (spectrum[c, a] + spectrum[d, b])
-                        if a == c:
-                            elem -= 0.5 * ac_term[d, b]
-                        if b == d:
-                            elem -= 0.5 * bd_term[a, c]
-                        if elem != 0:
-                            coo_rows.push_back(a * nrows + b)
-                            coo_cols.push_back(c * nrows + d)
-                            coo_data.push_back(elem)
-                    elif dskew >= cutoff:
-                        break
+    # Only visit the pairs (c, d) with a Bohr frequency within the cutoff of
+    # the one of (a, b), found by sorting the frequencies.
+    freqs, order, start, stop = _secular_windows(skew, cutoff)
+    for p in range(nrows * nrows):
+        a = p // nrows
+        b = p % nrows
+        for j in range(start[p], stop[p]):
+            q = order[j]
+            if fabs(freqs[p] - freqs[q]) >= cutoff:
+                continue
+            c = q // nrows
+            d = q % nrows
+            elem = (B_mat[a, c] * A_mat[d, b]) * 0.5
+            elem *= (spectrum[c, a] + spectrum[d, b])
+            if a == c:
+                elem -= 0.5 * ac_term[d, b]
+            if b == d:
+                elem -= 0.5 * bd_term[a, c]
+            if elem != 0:
+                coo_rows.push_back(p)
+                coo_cols.push_back(q)
+                coo_data.push_back(elem)
 
     return csr.from_coo_pointers(
         coo_rows.data(), coo_cols.data(), coo_data.data(),
@@ -568,38 +605,17 @@ cdef class _BlochRedfieldCrossElement(_BlochRedfieldElement):
             return _br_cterm_sparse(A_eig, B_eig, self.spectrum, self.skew, cutoff)
         raise ValueError('Invalid tensortype')
 
-    cpdef Data data(self, t):
-        cdef size_t i
+    cdef Data _compute_br_eig(self, double t):
+        "Compute the tensor in the eigen basis"
         cdef double cutoff = self.sec_cutoff * self._compute_spectrum(t)
         cdef Data A_eig = self.H.to_eigbasis(t, self.a_op._call(t))
         cdef Data B_eig = self.H.to_eigbasis(t, self.b_op._call(t))
-        cdef Data BR_eig = self._br_cterm(A_eig, B_eig, cutoff)
-        if self.eig_basis:
-            return BR_eig
-        return self.H.from_eigbasis(t, BR_eig)
-
-    cdef Data matmul_data_t(self, t, Data state, Data out=None):
-        cdef size_t i
-        cdef double cutoff = self.sec_cutoff * self._compute_spectrum(t)
-        cdef Data A_eig, B_eig, BR_eig
-
-        if not self.eig_basis:
-            state = self.H.to_eigbasis(t, state)
-        if not self.eig_basis and out is not None:
-            out = self.H.to_eigbasis(t, out)
-        A_eig = self.H.to_eigbasis(t, self.a_op._call(t))
-        B_eig = self.H.to_eigbasis(t, self.a_op._call(t))
-        BR_eig = self._br_cterm(A_eig, B_eig, cutoff)
-        out = _data.add(_data.matmul(BR_eig, state), out)
-        if not self.eig_basis:
-            out = self.H.from_eigbasis(t, out)
-        return out
+        return self._br_cterm(A_eig, B_eig, cutoff)
 
     def replace_arguments(self, args, cache=None):
         if cache is None:
             return _BlochRedfieldCrossElement(
-                _EigenBasisTransform(QobjEvo(self.H.oper, args=args),
-                                     type(self.H.oper) is CSR),
+                self.H._replace_arguments(args),
                 QobjEvo(self.a_op, args=args),
                 QobjEvo(self.b_op, args=args),
                 self.spectra,
@@ -613,8 +629,7 @@ cdef class _BlochRedfieldCrossElement(_BlochRedfieldElement):
             if old is self.H:
                 H = new
         if H is None:
-            H = _EigenBasisTransform(QobjEvo(self.H.oper, args=args),
-                                     type(self.H.oper) is CSR)
+            H = self.H._replace_arguments(args)
         new = _BlochRedfieldElement(
             H, QobjEvo(self.a_op, args=args), QobjEvo(self.b_op, args=args),
             self.spectra.replace_arguments(**args), self.sec_cutoff
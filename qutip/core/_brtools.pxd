@@ -12,12 +12,15 @@ cpdef Data matmul_var_data(Data left, Data right, int transleft, int transright)
 
 cdef class _EigenBasisTransform:
     cdef:
-        QobjEvo oper
+        readonly QobjEvo oper
         int size
         readonly bint isconstant
+        readonly int cache_size
+        readonly double eigen_tol
         double _t
         object _eigvals  # np.ndarray
         Data _evecs, _evecs_inv
+        object _cache  # OrderedDict {t: (eigvals, evecs)}
 
     cpdef object eigenvalues(self, double t)
     cpdef Data evecs(self, double t)
@@ -27,6 +30,7 @@ cdef class _EigenBasisTransform:
 
     cdef Data _inv(self, double t)
     cdef void _compute_eigen(self, double t) except *
+    cdef object _perturbed_eigen(self, double t, object oper)
 
     cdef Data _S_converter(self, double t)
     cdef Data _S_converter_inverse(self, double t)
@@ -5,6 +5,7 @@ from libc.float cimport DBL_MAX
 cimport numpy as cnp
 import numpy as np
 import warnings
+from collections import OrderedDict
 
 cimport cython
 
@@ -193,8 +194,23 @@ cdef class _EigenBasisTransform:
 
     sparse : bool [False]
         Deprecated
+
+    cache_size : int [8]
+        For time-dependent operators, number of eigen-decompositions kept,
+        keyed by time. Adaptive ODE integrators evaluate the same times
+        multiple times, in rejected steps and between the solver's calls.
+
+    eigen_tol : float [0.]
+        When positive, the eigen-decomposition at a new time is obtained by
+        perturbation from the closest cached one instead of a full
+        diagonalization when the operator is almost diagonal in the cached
+        eigenbasis: all its off-diagonal elements must be smaller than
+        ``eigen_tol`` times the difference of the corresponding diagonal
+        elements. The error on the eigenvalues and eigenvectors is of the
+        order ``eigen_tol**2``.
     """
-    def __init__(self, QobjEvo oper, bint sparse=False):
+    def __init__(self, QobjEvo oper, bint sparse=False, int cache_size=8,
+                 double eigen_tol=0.):
         if oper.dims[0] != oper.dims[1]:
             raise ValueError
         if type(oper(0).data) in (_data.CSR, _data.Dia) and not sparse:
@@ -207,6 +223,9 @@ cdef class _EigenBasisTransform:
         self.oper = oper
         self.isconstant = oper.isconstant
         self.size = oper.shape[0]
+        self.cache_size = cache_size
+        self.eigen_tol = eigen_tol
+        self._cache = OrderedDict()
 
         if oper.isconstant:
             self._eigvals, self._evecs = _data.eigs(
@@ -219,6 +238,15 @@ cdef class _EigenBasisTransform:
         self._t = np.nan
         self._evecs_inv = None
 
+    def _replace_arguments(self, args):
+        """
+        Copy of the transform, with new arguments for the operator.
+        """
+        return _EigenBasisTransform(
+            QobjEvo(self.oper, args=args),
+            cache_size=self.cache_size, eigen_tol=self.eigen_tol
+        )
+
     def as_Qobj(self):
         """Make an Qobj or QobjEvo of the eigenvectors."""
         if self.isconstant:
@@ -227,12 +255,63 @@ cdef class _EigenBasisTransform:
             return QobjEvo(_eigen_qevo(self.oper))
 
     cdef void _compute_eigen(self, double t) except *:
-        if self._t != t and not self.isconstant:
-            self._t = t
-            self._evecs_inv = None
-            self._eigvals, self._evecs = _data.eigs(
-                _data.to(Dense, self.oper._call(t)), True, True
-            )
+        if self._t == t or self.isconstant:
+            return
+        self._t = t
+        self._evecs_inv = None
+        if t in self._cache:
+            self._cache.move_to_end(t)
+            self._eigvals, self._evecs, _ = self._cache[t]
+            return
+
+        oper = _data.to(Dense, self.oper._call(t))
+        eigen = None
+        if self.eigen_tol > 0:
+            eigen = self._perturbed_eigen(t, oper)
+        if eigen is None:
+            eigen = _data.eigs(oper, True, True) + (True,)
+        self._eigvals, self._evecs, _ = eigen
+
+        if self.cache_size > 0:
+            self._cache[t] = eigen
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    cdef object _perturbed_eigen(self, double t, object oper):
+        """
+        Eigen-decomposition of ``oper`` by perturbation from the cached exact
+        one at the closest time. Return ``None`` if ``oper`` is not close
+        enough to diagonal in that basis.
+        """
+        # Perturbed eigenvectors are only orthonormal up to second order, they
+        # are not used as reference so errors do not accumulate.
+        references = [
+            t_cached for t_cached, (_, _, exact) in self._cache.items()
+            if exact
+        ]
+        if not references:
+            return None
+        t_ref = min(references, key=lambda t_cached: abs(t_cached - t))
+        self._cache.move_to_end(t_ref)
+        evecs = self._cache[t_ref][1].to_array()
+        rotated = evecs.conj().T @ oper.to_array() @ evecs
+        diag = rotated.diagonal().real
+        coupling = rotated.copy()
+        np.fill_diagonal(coupling, 0.)
+        gaps = diag[np.newaxis, :] - diag[:, np.newaxis]
+        if np.any(np.abs(coupling) > self.eigen_tol * np.abs(gaps)):
+            return None
+        # Only exactly uncoupled pairs can pass with a null gap.
+        np.fill_diagonal(gaps, 1.)
+        gaps[gaps == 0] = 1.
+        mixing = coupling / gaps
+        eigvals = diag + np.sum(np.abs(coupling)**2 / gaps, axis=0)
+        # ``mixing`` is anti-hermitian: the new basis is orthonormal up to
+        # second order, as the perturbation.
+        evecs = evecs + evecs @ mixing
+        evecs /= np.linalg.norm(evecs, axis=0)
+        order = np.argsort(eigvals)
+        return eigvals[order], _data.Dense(evecs[:, order], copy=False), False
 
     cpdef object eigenvalues(self, double t):
         """
@@ -125,8 +125,14 @@ def bloch_redfield_tensor(
         Hamiltonian basis and the eigenvectors of the Hamiltonian as hstacked
         column.
     """
+    if isinstance(H, _EigenBasisTransform):
+        H_transform = H
+        H = H.oper
+    else:
+        H_transform = _EigenBasisTransform(
+            QobjEvo(H), sparse=sparse_eigensolver
+        )
     R = liouvillian(H, c_ops)
-    H_transform = _EigenBasisTransform(QobjEvo(H), sparse=sparse_eigensolver)
 
     if fock_basis:
         for (a_op, spectra) in a_ops:
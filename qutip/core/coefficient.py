@@ -7,6 +7,9 @@ import scipy
 import scipy.interpolate
 import os
 import sys
+import platform
+import sysconfig
+import shutil
 import re
 import dis
 import hashlib
@@ -23,17 +26,20 @@ except ImportError:
     pass
 
 from ..settings import settings as qset
+from ..version import short_version as qutip_version
 from .options import QutipOptions
 from .data import Data
 from .cy.coefficient import (
     Coefficient, InterCoefficient, FunctionCoefficient, StrFunctionCoefficient,
-    ConjCoefficient, NormCoefficient, ConstantCoefficient
+    StrBytecodeCoefficient, ConjCoefficient, NormCoefficient,
+    ConstantCoefficient, CoefficientBank, FusedCoefficient
 )
 from qutip.typing import CoefficientLike
 
 
 __all__ = ["coefficient", "CompilationOptions", "Coefficient",
-           "clean_compiled_coefficient"]
+           "CoefficientBank", "clean_compiled_coefficient",
+           "compile_coefficients", "warm_coefficient_cache"]
 
 
 class StringParsingWarning(Warning):
@@ -245,6 +251,11 @@ class CompilationOptions(QutipOptions):
     use_cython: bool
         Whether to compile strings as cython code or use python's ``exec``.
 
+    use_bytecode: bool [True]
+        When strings are not compiled, whether to evaluate simple arithmetic
+        expressions with a bytecode interpreter instead of python's ``exec``.
+        It does not need a compiler and is much faster than ``exec``.
+
     recompile : bool
         Do not use previously made files but build a new one.
 
@@ -284,6 +295,11 @@ class CompilationOptions(QutipOptions):
 
     build_dir: str [None]
         cythonize's build_dir.
+
+    shared_cache_size: float [1024]
+        Maximum size, in MB, of the shared cache of compiled coefficients set
+        by ``qutip.settings.coeff_cache``. The least recently used
+        coefficients are removed when it is exceeded.
     """
     _link_flags = ""
     _compiler_flags = ""
@@ -306,6 +322,7 @@ class CompilationOptions(QutipOptions):
 
     _options = {
         "use_cython": _use_cython,
+        "use_bytecode": True,
         "try_parse": True,
         "static_types": True,
         "accept_int": None,
@@ -316,6 +333,7 @@ class CompilationOptions(QutipOptions):
         "extra_import": "",
         "clean_on_error": True,
         "build_dir": None,
+        "shared_cache_size": 1024,
     }
     _settings_name = "compile"
 
@@ -325,7 +343,7 @@ qset.compile = CompilationOptions()
 
 
 # Version number of the Coefficient
-COEFF_VERSION = "1.2"
+COEFF_VERSION = "1.4"
 
 try:
     root = os.path.join(qset.tmproot, f"qutip_coeffs_{COEFF_VERSION}")
@@ -344,7 +362,6 @@ def clean_compiled_coefficient(all=False):
         If not `all`, it will remove only previous version.
     """
     import glob
-    import shutil
     tmproot = qset.tmproot
     active = qset.coeffroot
     folders = glob.glob(os.path.join(tmproot, 'qutip_coeffs_') + "*")
@@ -357,6 +374,209 @@ def clean_compiled_coefficient(all=False):
     qset.coeffroot = qset.coeffroot
 
 
+# Folder of the shared cache used for this ABI, for each cache root.
+_COEFF_CACHE_DIRS = {}
+
+
+def _coeff_cache_dir():
+    """
+    Return the folder of the shared cache of compiled coefficients for the
+    current python, Cython and compiler ABI, or ``None`` if there is no
+    cache. The folder is added to the import path.
+    """
+    root = qset.coeff_cache
+    if not root:
+        return None
+    if root not in _COEFF_CACHE_DIRS:
+        try:
+            import Cython
+            cython_version = Cython.__version__
+        except ImportError:
+            cython_version = None
+        abi = "|".join(str(part) for part in [
+            sys.implementation.cache_tag,
+            sysconfig.get_config_var("EXT_SUFFIX"),
+            sysconfig.get_config_var("CC"),
+            platform.machine(),
+            cython_version,
+            np.__version__,
+            qutip_version,
+            COEFF_VERSION,
+        ])
+        hash_ = hashlib.sha256(bytes(abi, encoding='utf8'))
+        path = os.path.join(root, "abi_" + hash_.hexdigest()[:16])
+        try:
+            os.makedirs(path, exist_ok=True)
+        except OSError:
+            # Read-only cache without coefficients for this ABI.
+            return None
+        if path not in sys.path:
+            # After ``coeffroot``: locally compiled files are used first.
+            sys.path.append(path)
+        _COEFF_CACHE_DIRS[root] = path
+    return _COEFF_CACHE_DIRS[root]
+
+
+def _cache_file_names(module_names):
+    """ Importable files of the compiled coefficient modules. """
+    ext = sysconfig.get_config_var("EXT_SUFFIX")
+    for name in module_names:
+        for suffix in [".py", ext]:
+            if os.path.exists(os.path.join(qset.coeffroot, name + suffix)):
+                yield name + suffix
+
+
+def _publish_to_cache(module_names):
+    """
+    Copy compiled coefficient modules from ``coeffroot`` to the shared cache.
+    Files are written under a temporary name and then renamed, so other
+    processes never import a partially written file.
+    """
+    path = _coeff_cache_dir()
+    if path is None or not os.access(path, os.W_OK):
+        return
+    for file_name in _cache_file_names(module_names):
+        dest = os.path.join(path, file_name)
+        if os.path.exists(dest):
+            continue
+        tmp = f"{dest}.tmp{os.getpid()}"
+        try:
+            shutil.copyfile(os.path.join(qset.coeffroot, file_name), tmp)
+            os.replace(tmp, dest)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+    _evict_from_cache(path, qset.compile['shared_cache_size'] * 2**20)
+
+
+def _evict_from_cache(path, max_size):
+    """
+    Remove the least recently used files of the cache folder ``path`` until
+    its size is under ``max_size`` bytes. Use time is tracked with the files'
+    modification time, updated by :func:`_touch_cached`.
+    """
+    entries = []
+    for entry in os.scandir(path):
+        if entry.is_file() and ".tmp" not in entry.name:
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, file in sorted(entries):
+        if total <= max_size:
+            break
+        try:
+            os.remove(file)
+            total -= size
+        except OSError:
+            pass
+
+
+def _touch_cached(module):
+    """
+    Mark the files of a coefficient module imported from the shared cache as
+    recently used.
+    """
+    path = _coeff_cache_dir()
+    if path is None:
+        return
+    files = [module.__file__]
+    batch = sys.modules.get(module.StrCoefficient.__module__, module)
+    if batch is not module:
+        files.append(batch.__file__)
+    for file in files:
+        if file and os.path.dirname(file) == path:
+            try:
+                os.utime(file)
+            except OSError:
+                # Read-only cache
+                pass
+
+
+def _coefficient_modules(obj, seen=None):
+    """
+    Return the names of the modules of the compiled string coefficients used
+    by ``obj``, which can be a :obj:`.Coefficient`, :obj:`.QobjEvo`, solver,
+    or containers of these.
+    """
+    from .cy.qobjevo import QobjEvo
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return set()
+    seen.add(id(obj))
+    modules = set()
+    if isinstance(obj, Coefficient):
+        cls = type(obj)
+        if cls.__module__.startswith("qtcoeff_"):
+            modules.add(cls.__module__)
+            if cls.__name__ != "StrCoefficient":
+                # Class of a batch, also publish the module pointing to it.
+                modules.add("qtcoeff" + cls.__name__[len("StrCoefficient"):])
+    elif isinstance(obj, QobjEvo):
+        for part in obj.to_list():
+            if isinstance(part, list):
+                modules |= _coefficient_modules(part[1], seen)
+    elif isinstance(obj, (list, tuple, set)):
+        for item in obj:
+            modules |= _coefficient_modules(item, seen)
+    elif isinstance(obj, dict):
+        for item in obj.values():
+            modules |= _coefficient_modules(item, seen)
+    elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+        for item in vars(obj).values():
+            modules |= _coefficient_modules(item, seen)
+    return modules
+
+
+def warm_coefficient_cache(
+    bases: list[str] = (),
+    *,
+    args: dict = {},
+    objects: list = (),
+    compile_opt: CompilationOptions = None,
+) -> list[str]:
+    """
+    Compile string coefficients and publish them to the shared cache set by
+    ``qutip.settings.coeff_cache``, so that other machines using the same
+    cache do not need to compile them.
+
+    Also available from the command line: ``python -m qutip
+    warm-coeff-cache``.
+
+    Parameters
+    ----------
+    bases : list of str
+        String coefficients to compile.
+
+    args : dict, optional
+        Dictionary of arguments used by the strings.
+
+    objects : list, optional
+        Objects using compiled string coefficients, such as :obj:`.QobjEvo`
+        or solvers, e.g. loaded from pickles. The coefficients they use are
+        published.
+
+    compile_opt : CompilationOptions, optional
+        Sets of options for the compilation of string based coefficients.
+
+    Returns
+    -------
+    modules : list of str
+        Name of the compiled modules in the cache.
+    """
+    if _coeff_cache_dir() is None:
+        raise ValueError("No shared cache: set `qutip.settings.coeff_cache`.")
+    compile_coefficients(
+        list(bases), args=args, compile_opt=compile_opt
+    )
+    coeffs = [
+        coefficient(base, args=args, compile_opt=compile_opt)
+        for base in bases
+    ]
+    modules = _coefficient_modules([coeffs, list(objects)])
+    _publish_to_cache(modules)
+    return sorted(modules)
+
+
 def proj(x):
     if np.isfinite(x):
         return (x)
@@ -419,16 +639,16 @@ def coeff_from_str(base, args, args_ctypes, compile_opt=None, **_):
         if WARN_MISSING_MODULE[0]:
             warnings.warn(
                 "`cython`, `setuptools` and `filelock` are required for "
-                "compilation of string coefficents. Falling back on `eval`.")
+                "compilation of string coefficents. Falling back on an "
+                "interpreter.")
             # Only warns once.
             WARN_MISSING_MODULE[0] = 0
-        return StrFunctionCoefficient(base, args)
+        return _uncompiled_str_coefficient(base, args, compile_opt)
     # Parsing tries to make the code in common pattern
     parsed, variables, constants, raw = try_parse(base, args,
                                                   args_ctypes, compile_opt)
     # Once parsed, the code should be unique enough to get a filename
-    hash_ = hashlib.sha256(bytes(parsed, encoding='utf8'))
-    file_name = "qtcoeff_" + hash_.hexdigest()[:30]
+    file_name = _coeff_file_name(parsed)
     # See if it already exist and import it.
     if not compile_opt['recompile']:
         coeff = try_import(file_name, parsed)
@@ -443,7 +663,7 @@ def coeff_from_str(base, args, args_ctypes, compile_opt=None, **_):
             pass
     if coeff is None:
         # We don't use cython or compilation failed
-        return StrFunctionCoefficient(base, args)
+        return _uncompiled_str_coefficient(base, args, compile_opt)
     keys = [key for _, key, _ in variables]
     const = [fromstr(val) for _, val, _ in constants]
     return coeff(base, keys, const, args)
@@ -452,10 +672,137 @@ def coeff_from_str(base, args, args_ctypes, compile_opt=None, **_):
 coefficient_builders[str] = coeff_from_str
 
 
+def _uncompiled_str_coefficient(base, args, compile_opt):
+    """
+    String coefficient evaluated without Cython: use the bytecode
+    interpreter when the expression allows it, python's ``exec`` otherwise.
+    """
+    if compile_opt['use_bytecode'] and not compile_opt['extra_import']:
+        try:
+            return StrBytecodeCoefficient(base, args)
+        except (ValueError, SyntaxError):
+            pass
+    return StrFunctionCoefficient(base, args)
+
+
+def _coeff_file_name(parsed):
+    """ Name of the module of the compiled string coefficient. """
+    hash_ = hashlib.sha256(bytes(parsed, encoding='utf8'))
+    return "qtcoeff_" + hash_.hexdigest()[:30]
+
+
+def compile_coefficients(
+    bases: list[str],
+    *,
+    args: dict = {},
+    args_ctypes: dict = {},
+    compile_opt: CompilationOptions = None,
+) -> None:
+    """
+    Compile many string coefficients at once.
+
+    The strings which were not already compiled are written in a single
+    Cython module which is compiled once, instead of building one extension
+    per string. Following calls to :func:`coefficient` with these strings
+    use the compiled code.
+
+    :obj:`.QobjEvo` uses it when created with multiple string coefficients.
+    It can also be called before creating a solver with all the strings used
+    by its Hamiltonian and collapse operators.
+
+    Parameters
+    ----------
+    bases : list of str
+        The string coefficients to compile.
+
+    args : dict, optional
+        Dictionary of arguments used by the strings.
+
+    args_ctypes : dict, optional
+        C type for the args.
+
+    compile_opt : CompilationOptions, optional
+        Sets of options for the compilation of string based coefficients.
+    """
+    if compile_opt is None:
+        compile_opt = qset.compile
+    if not compile_opt['use_cython'] or not qset.coeff_write_ok:
+        return
+    pending = {}
+    for base in bases:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", StringParsingWarning)
+                parsed, variables, constants, raw = try_parse(
+                    base, args, args_ctypes, compile_opt
+                )
+        except Exception:
+            # Invalid strings raise when the coefficient is created.
+            continue
+        file_name = _coeff_file_name(parsed)
+        if file_name in pending:
+            continue
+        if not compile_opt['recompile'] and try_import(file_name, parsed):
+            continue
+        pending[file_name] = (parsed, variables, constants, raw)
+    if len(pending) < 2:
+        # A single string is compiled as usual when the coefficient is made.
+        return
+
+    hash_ = hashlib.sha256(bytes("".join(pending), encoding='utf8'))
+    module_name = "qtcoeff_batch_" + hash_.hexdigest()[:30]
+    code = make_cy_header(compile_opt)
+    for file_name, (parsed, variables, constants, raw) in pending.items():
+        code += make_cy_class(
+            parsed, variables, constants, raw,
+            "StrCoefficient" + file_name[len("qtcoeff"):]
+        )
+    try:
+        _build_extension(code, module_name, compile_opt)
+    except PermissionError:
+        return
+    except Exception:
+        # One string failing to compile must not prevent the others from
+        # being compiled: build them one at a time.
+        for file_name, (parsed, variables, constants, raw) in pending.items():
+            code = make_cy_code(parsed, variables, constants, raw, compile_opt)
+            try:
+                compile_code(code, file_name, parsed, compile_opt)
+            except Exception:
+                # The error is raised when the coefficient is created.
+                pass
+        return
+
+    # Each string gets a module importing its class from the batch so that it
+    # is found by ``try_import`` as if it was compiled alone. The modules are
+    # written under a temporary name, then moved, so that other processes
+    # never import a partially written file.
+    for file_name, (parsed, *_) in pending.items():
+        dest = os.path.join(qset.coeffroot, file_name + ".py")
+        tmp = f"{dest}.tmp{os.getpid()}"
+        try:
+            with open(tmp, "w") as f:
+                f.write(
+                    "# This file is generated automatically by QuTiP.\n"
+                    f"from {module_name} import "
+                    f"StrCoefficient{file_name[len('qtcoeff'):]} "
+                    "as StrCoefficient\n"
+                    f"parsed_code = {parsed!r}\n"
+                )
+            os.replace(tmp, dest)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+    importlib.invalidate_caches()
+    _publish_to_cache([module_name, *pending])
+
+
 def try_import(file_name, parsed_in):
     """ Import the compiled coefficient if existing and check for
     name collision.
     """
+    # Make the shared cache importable.
+    _coeff_cache_dir()
     try:
         mod = importlib.import_module(file_name)
     except ModuleNotFoundError:
@@ -464,15 +811,16 @@ def try_import(file_name, parsed_in):
 
     if mod.parsed_code == parsed_in:
         # Coefficient found!
+        _touch_cached(mod)
         return mod.StrCoefficient
     else:
         raise ValueError("string hash collision, change the string "
                          "or clean files in qutip.settings.coeffroot")
 
 
-def make_cy_code(code, variables, constants, raw, compile_opt):
+def make_cy_class(code, variables, constants, raw, class_name):
     """
-    Generate the code for the string coefficients.
+    Generate the code of the Cython class for a string coefficient.
     """
     cdef_cte = ""
     init_cte = ""
@@ -503,24 +851,10 @@ def make_cy_code(code, variables, constants, raw, compile_opt):
         if raw:
             call_var += "        cdef {} {} = {}\n".format(ctype, val, name)
 
-    code = f"""#cython: language_level=3
-# This file is generated automatically by QuTiP.
-
-import numpy as np
-import scipy.special as spe
-from scipy.special cimport cython_special
-cimport cython
-from qutip.core.cy.coefficient cimport Coefficient
-from qutip.core.cy.math cimport erf, zerf
-from qutip.core.cy.complex_math cimport *
-from qutip.core.data cimport Data
-cdef double pi = 3.14159265358979323
-{compile_opt['extra_import']}
-
-parsed_code = "{code}"
+    return f"""
 
 @cython.auto_pickle(True)
-cdef class StrCoefficient(Coefficient):
+cdef class {class_name}(Coefficient):
     \"\"\"
     String compiled as a :obj:`.Coefficient` using cython.
     \"\"\"
@@ -530,12 +864,14 @@ cdef class StrCoefficient(Coefficient):
 
     def __init__(self, base, var, cte, args):
         self.codeString = base
+        self.args = args
 {init_cte}{init_var}{init_arg}
 
     cpdef Coefficient copy(self):
         \"\"\"Return a copy of the :obj:`.Coefficient`.\"\"\"
-        cdef StrCoefficient out = StrCoefficient.__new__(StrCoefficient)
+        cdef {class_name} out = {class_name}.__new__({class_name})
         out.codeString = self.codeString
+        out.args = self.args
 {copy_cte}{copy_var}
         return out
 
@@ -554,25 +890,76 @@ cdef class StrCoefficient(Coefficient):
         **kwargs
             Arguments to replace.
         \"\"\"
-        cdef StrCoefficient out
+        cdef {class_name} out
 
         if _args:
             kwargs.update(_args)
         if kwargs:
             out = self.copy()
+            out.args = {{**self.args, **kwargs}}
 {replace_var}
             return out
         return self
 
+    def derivative(self, arg=None):
+        \"\"\"
+        Return a :obj:`.Coefficient` of the derivative of this one with
+        respect to time, or to the argument ``arg`` if given.
+        \"\"\"
+        from qutip.core.coefficient import coefficient
+        from qutip.core.cy.coefficient import _str_derivative
+        return coefficient(
+            _str_derivative(self.codeString, self.args, arg), args=self.args
+        )
+
     @cython.initializedcheck(False)
     @cython.cdivision(True)
     cdef complex _call(self, double t) except *:
 {call_var}        return {code}
 """
-    return code
+
+
+def make_cy_header(compile_opt):
+    """
+    Generate the header of a Cython module of string coefficients.
+    """
+    return f"""#cython: language_level=3
+# This file is generated automatically by QuTiP.
+
+import numpy as np
+import scipy.special as spe
+from scipy.special cimport cython_special
+cimport cython
+from qutip.core.cy.coefficient cimport Coefficient
+from qutip.core.cy.math cimport erf, zerf
+from qutip.core.cy.complex_math cimport *
+from qutip.core.data cimport Data
+cdef double pi = 3.14159265358979323
+{compile_opt['extra_import']}
+"""
+
+
+def make_cy_code(code, variables, constants, raw, compile_opt):
+    """
+    Generate the code for the string coefficients.
+    """
+    return (
+        make_cy_header(compile_opt)
+        + f'parsed_code = "{code}"\n'
+        + make_cy_class(code, variables, constants, raw, "StrCoefficient")
+    )
 
 
 def compile_code(code, file_name, parsed, c_opt):
+    _build_extension(code, file_name, c_opt)
+    coeff = try_import(file_name, parsed)
+    if coeff is not None:
+        _publish_to_cache([file_name])
+    return coeff
+
+
+def _build_extension(code, file_name, c_opt):
+    """ Write the code to ``file_name.pyx`` and compile it in place. """
     pwd = os.getcwd()
     os.chdir(qset.coeffroot)
     # Files with the same name, but differents extension than the pyx file, are
@@ -615,7 +1002,6 @@ def compile_code(code, file_name, parsed, c_opt):
     finally:
         lock.release()
         os.chdir(pwd)
-    return try_import(file_name, parsed)
 
 
 # %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
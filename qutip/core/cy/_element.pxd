@@ -25,7 +25,8 @@ cdef class _EvoElement(_BaseElement):
 cdef class _FuncElement(_BaseElement):
     cdef readonly object _func
     cdef readonly dict _args
-    cdef readonly tuple _previous
+    cdef double _t_previous
+    cdef object _qobj_previous
     cdef readonly bint _f_pythonic
     cdef readonly set _f_parameters
 
@@ -455,7 +455,13 @@ cdef class _FuncElement(_BaseElement):
         self._args = args
         self._f_pythonic = _f_pythonic
         self._f_parameters = _f_parameters
-        self._previous = (Nan, None)
+        self._t_previous = Nan
+        self._qobj_previous = None
+
+    @property
+    def _previous(self):
+        """ Time and value of the last call. """
+        return (self._t_previous, self._qobj_previous)
 
     def __mul__(left, right):
         cdef _MapElement out
@@ -472,16 +478,15 @@ cdef class _FuncElement(_BaseElement):
         return self.qobj(t).data
 
     cpdef object qobj(self, t):
-        cdef double _t
         cdef object _qobj
-        _t, _qobj = self._previous
-        if t == _t:
-            return _qobj
+        if t == self._t_previous:
+            return self._qobj_previous
         if self._f_pythonic:
             _qobj = self._func(t, **self._args)
         else:
             _qobj = self._func(t, self._args)
-        self._previous = (t, _qobj)
+        self._t_previous = t
+        self._qobj_previous = _qobj
         return _qobj
 
     cpdef object coeff(self, t):
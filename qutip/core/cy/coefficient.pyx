@@ -1,7 +1,9 @@
 #cython: language_level=3
 #cython: c_api_binop_methods=True
 
+import ast
 import inspect
+import numbers
 import pickle
 import scipy
 from scipy.interpolate import make_interp_spline
@@ -9,6 +11,8 @@ import numpy as np
 cimport numpy as cnp
 cimport cython
 import qutip
+from qutip.core.cy cimport complex_math as cmath
+from qutip.core.cy.math cimport zerf
 
 cdef extern from "<complex>" namespace "std" nogil:
     double complex conj(double complex x)
@@ -17,7 +21,8 @@ cdef extern from "<complex>" namespace "std" nogil:
 
 __all__ = [
     "Coefficient",  "InterCoefficient", "FunctionCoefficient",
-    "StrFunctionCoefficient", "ConjCoefficient", "NormCoefficient"
+    "StrFunctionCoefficient", "StrBytecodeCoefficient", "ConjCoefficient",
+    "NormCoefficient", "FusedCoefficient", "CoefficientBank"
 ]
 
 
@@ -121,17 +126,40 @@ cdef class Coefficient:
 
         **kwargs
             Arguments to overwrite for this call.
+
+        Returns
+        -------
+        complex or np.ndarray
+            The value of the coefficient. If ``t`` is an array, an array of
+            the same shape with the value at each time.
         """
+        cdef Coefficient coeff = self
         if _args is not None or kwargs:
-            return (<Coefficient> self.replace_arguments(_args,
-                                                         **kwargs))._call(t)
-        return self._call(t)
+            coeff = <Coefficient> self.replace_arguments(_args, **kwargs)
+        if np.ndim(t):
+            return coeff._call_array(np.asarray(t, dtype=np.float64))
+        return coeff._call(t)
 
     cdef double complex _call(self, double t) except *:
         """Core computation of the :obj:`.Coefficient`."""
         # All Coefficient sub-classes should overwrite this or __call__
         return complex(self(t))
 
+    @cython.wraparound(False)
+    @cython.boundscheck(False)
+    def _call_array(self, t):
+        """
+        Compute the coefficient at each time of the float array ``t``.
+        Sub-classes may override this with a vectorized computation.
+        """
+        cdef double[::1] times = np.ascontiguousarray(t).ravel()
+        cdef size_t i
+        out = np.empty(times.shape[0], dtype=np.complex128)
+        cdef double complex[::1] out_view = out
+        for i in range(times.shape[0]):
+            out_view[i] = self._call(times[i])
+        return out.reshape(t.shape)
+
     def __add__(left, right):
         if (
             isinstance(left, InterCoefficient)
@@ -163,6 +191,42 @@ cdef class Coefficient:
         """ Return a :obj:`.Coefficient` being the norm of this"""
         return NormCoefficient(self)
 
+    def derivative(self, arg=None):
+        """
+        Return a :obj:`.Coefficient` of the derivative of this one with
+        respect to time, or to the argument ``arg`` if given.
+
+        Available for interpolated coefficients, coefficients defined by
+        strings using differentiable functions, constants and sums, products,
+        conjugates and norms of these.
+
+        Parameters
+        ----------
+        arg : str, optional
+            Name of the argument, in ``args``, with respect to which to take
+            the derivative. The time derivative is returned by default.
+        """
+        raise NotImplementedError(
+            f"The derivative of {type(self).__name__} is not available."
+        )
+
+    def optimize(self):
+        """
+        Return an equivalent :obj:`.Coefficient` that is faster to evaluate.
+
+        Sums, products, conjugates and norms of coefficients are simplified:
+        operations on constants are evaluated and interpolations sharing the
+        same times are merged. The remaining tree of operations is evaluated
+        as a single :obj:`FusedCoefficient` in which coefficients defined by
+        simple string expressions are inlined.
+        """
+        cdef Coefficient out = _fold(self)
+        if isinstance(out, (
+            SumCoefficient, MulCoefficient, ConjCoefficient, NormCoefficient
+        )):
+            out = FusedCoefficient(out)
+        return out
+
 
 @cython.auto_pickle(True)
 cdef class FunctionCoefficient(Coefficient):
@@ -215,6 +279,8 @@ cdef class FunctionCoefficient(Coefficient):
     def __call__(self, t, dict _args=None, **kwargs):
         if _args is not None or kwargs:
             return self.replace_arguments(_args, **kwargs)(t)
+        if np.ndim(t):
+            return self._call_array(np.asarray(t, dtype=np.float64))
         if self._f_pythonic:
             return self.func(t, **self.args)
         return self.func(t, self.args)
@@ -267,6 +333,191 @@ def proj(x):
         return np.inf + 0j * np.imag(x)
 
 
+def _ast_name(name):
+    return ast.Name(name, ast.Load())
+
+
+def _ast_call(name, node):
+    return ast.Call(_ast_name(name), [node], [])
+
+
+def _ast_add(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return ast.BinOp(left, ast.Add(), right)
+
+
+def _ast_neg(node):
+    if node is None:
+        return None
+    return ast.UnaryOp(ast.USub(), node)
+
+
+def _ast_mul(left, right):
+    if left is None or right is None:
+        return None
+    if isinstance(left, ast.Constant) and left.value == 1:
+        return right
+    if isinstance(right, ast.Constant) and right.value == 1:
+        return left
+    return ast.BinOp(left, ast.Mult(), right)
+
+
+def _ast_div(left, right):
+    if left is None:
+        return None
+    return ast.BinOp(left, ast.Div(), right)
+
+
+def _ast_pow(node, power):
+    return ast.BinOp(node, ast.Pow(), power)
+
+
+def _ast_inv_sqrt(node):
+    return _ast_div(ast.Constant(1), _ast_call("sqrt", node))
+
+
+def _ast_square(node):
+    return _ast_pow(node, ast.Constant(2))
+
+
+# Derivative of the functions usable in string coefficients, as a function
+# of their argument's node.
+_STR_DERIVATIVES = {
+    "sin": lambda u: _ast_call("cos", u),
+    "cos": lambda u: _ast_neg(_ast_call("sin", u)),
+    "tan": lambda u: _ast_div(
+        ast.Constant(1), _ast_square(_ast_call("cos", u))),
+    "exp": lambda u: _ast_call("exp", u),
+    "log": lambda u: _ast_div(ast.Constant(1), u),
+    "log10": lambda u: _ast_div(
+        ast.Constant(1), _ast_mul(u, _ast_call("log", ast.Constant(10)))),
+    "sqrt": lambda u: _ast_div(ast.Constant(0.5), _ast_call("sqrt", u)),
+    "sinh": lambda u: _ast_call("cosh", u),
+    "cosh": lambda u: _ast_call("sinh", u),
+    "tanh": lambda u: _ast_div(
+        ast.Constant(1), _ast_square(_ast_call("cosh", u))),
+    "asin": lambda u: _ast_inv_sqrt(
+        ast.BinOp(ast.Constant(1), ast.Sub(), _ast_square(u))),
+    "acos": lambda u: _ast_neg(_ast_inv_sqrt(
+        ast.BinOp(ast.Constant(1), ast.Sub(), _ast_square(u)))),
+    "atan": lambda u: _ast_div(
+        ast.Constant(1), _ast_add(ast.Constant(1), _ast_square(u))),
+    "asinh": lambda u: _ast_inv_sqrt(
+        _ast_add(_ast_square(u), ast.Constant(1))),
+    "acosh": lambda u: _ast_inv_sqrt(
+        ast.BinOp(_ast_square(u), ast.Sub(), ast.Constant(1))),
+    "atanh": lambda u: _ast_div(
+        ast.Constant(1),
+        ast.BinOp(ast.Constant(1), ast.Sub(), _ast_square(u))),
+    "erf": lambda u: _ast_mul(
+        _ast_div(ast.Constant(2), _ast_call("sqrt", _ast_name("pi"))),
+        _ast_call("exp", _ast_neg(_ast_square(u)))),
+}
+_STR_DERIVATIVES["zerf"] = _STR_DERIVATIVES["erf"]
+
+
+def _ast_derivative(node, args, var):
+    """
+    Derivative of the expression ``node`` with respect to the variable
+    ``var``, ``None`` if it does not depend on it.
+    """
+    if not any(
+        isinstance(sub, ast.Name) and sub.id == var
+        for sub in ast.walk(node)
+    ):
+        return None
+    if isinstance(node, ast.Name):
+        return ast.Constant(1)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return _ast_neg(_ast_derivative(node.operand, args, var))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.UAdd):
+        return _ast_derivative(node.operand, args, var)
+    if isinstance(node, ast.BinOp):
+        u, v = node.left, node.right
+        du = _ast_derivative(u, args, var)
+        dv = _ast_derivative(v, args, var)
+        if isinstance(node.op, ast.Add):
+            return _ast_add(du, dv)
+        if isinstance(node.op, ast.Sub):
+            if dv is None:
+                return du
+            if du is None:
+                return _ast_neg(dv)
+            return ast.BinOp(du, ast.Sub(), dv)
+        if isinstance(node.op, ast.Mult):
+            return _ast_add(_ast_mul(du, v), _ast_mul(u, dv))
+        if isinstance(node.op, ast.Div):
+            dv_term = _ast_div(_ast_mul(u, dv), _ast_square(v))
+            if dv_term is None:
+                return _ast_div(du, v)
+            if du is None:
+                return _ast_neg(dv_term)
+            return ast.BinOp(_ast_div(du, v), ast.Sub(), dv_term)
+        if isinstance(node.op, ast.Pow):
+            if dv is None:
+                # d(u**n) = n * u**(n-1) * du
+                return _ast_mul(
+                    _ast_mul(v, _ast_pow(
+                        u, ast.BinOp(v, ast.Sub(), ast.Constant(1)))),
+                    du
+                )
+            # d(u**v) = u**v * (dv * log(u) + v * du / u)
+            return _ast_mul(node, _ast_add(
+                _ast_mul(dv, _ast_call("log", u)),
+                _ast_div(_ast_mul(v, du), u)
+            ))
+    if (
+        isinstance(node, ast.Call)
+        and len(node.args) == 1
+        and not node.keywords
+    ):
+        name = None
+        if isinstance(node.func, ast.Name) and node.func.id not in args:
+            name = node.func.id
+        elif (
+            isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "np"
+            and node.func.attr in _BYTECODE_NP_FUNCS
+        ):
+            name = _BYTECODE_NP_FUNCS[node.func.attr]
+        u = node.args[0]
+        du = _ast_derivative(u, args, var)
+        if name in _STR_DERIVATIVES:
+            return _ast_mul(_STR_DERIVATIVES[name](u), du)
+        if name in ["real", "imag", "conj"]:
+            # The variable is real: these are linear.
+            return _ast_call(name, du)
+        if name == "norm":
+            return _ast_mul(ast.Constant(2), _ast_call(
+                "real", _ast_mul(_ast_call("conj", u), du)))
+        if name == "abs":
+            return _ast_div(
+                _ast_call("real", _ast_mul(_ast_call("conj", u), du)),
+                _ast_call("abs", u)
+            )
+        if name == "arg":
+            return _ast_call("imag", _ast_div(du, u))
+    raise ValueError(f"Can't differentiate: {ast.unparse(node)}")
+
+
+def _str_derivative(base, args, arg=None):
+    """
+    Return the derivative of the string expression ``base`` with respect to
+    ``t`` or the argument ``arg``. Raise a ``ValueError`` if it uses an
+    unsupported syntax or function.
+    """
+    var = "t" if arg is None else arg
+    tree = ast.parse(base.strip(), mode="eval").body
+    derivative = _ast_derivative(tree, args, var)
+    if derivative is None:
+        return "0"
+    return ast.unparse(derivative)
+
+
 cdef class StrFunctionCoefficient(Coefficient):
     """
     A :obj:`.Coefficient` defined by a string containing a simple Python
@@ -354,6 +605,15 @@ def coeff(t, args):
     def __reduce__(self):
         return (StrFunctionCoefficient, (self.base, self.args))
 
+    def derivative(self, arg=None):
+        """
+        Return a :obj:`.Coefficient` of the derivative of this one with
+        respect to time, or to the argument ``arg`` if given.
+        """
+        return StrFunctionCoefficient(
+            _str_derivative(self.base, self.args, arg), self.args
+        )
+
     def replace_arguments(self, _args=None, **kwargs):
         """
         Replace the arguments (``args``) of a coefficient.
@@ -379,6 +639,468 @@ def coeff(t, args):
         return self
 
 
+# Instructions of the StrBytecodeCoefficient interpreter.
+cdef enum:
+    _OP_CONST
+    _OP_T
+    _OP_ARG
+    _OP_ADD
+    _OP_SUB
+    _OP_MUL
+    _OP_DIV
+    _OP_POW
+    _OP_NEG
+    _OP_FUNC
+    _OP_COEFF
+
+_BYTECODE_BINOPS = {
+    ast.Add: _OP_ADD,
+    ast.Sub: _OP_SUB,
+    ast.Mult: _OP_MUL,
+    ast.Div: _OP_DIV,
+    ast.Pow: _OP_POW,
+}
+
+_BYTECODE_FUNCS = [
+    "sin", "cos", "tan", "asin", "acos", "atan", "sinh", "cosh", "tanh",
+    "asinh", "acosh", "atanh", "exp", "log", "log10", "sqrt", "real", "imag",
+    "conj", "abs", "norm", "arg", "proj", "erf", "zerf",
+]
+
+# Numpy names of the supported functions when used as ``np.func``.
+_BYTECODE_NP_FUNCS = {
+    **{name: name for name in _BYTECODE_FUNCS if hasattr(np, name)},
+    "arcsin": "asin", "arccos": "acos", "arctan": "atan",
+    "arcsinh": "asinh", "arccosh": "acosh", "arctanh": "atanh",
+    "conjugate": "conj", "angle": "arg",
+}
+
+
+def _str_to_bytecode(base, args):
+    """
+    Translate the string expression ``base`` into instructions for the
+    :obj:`StrBytecodeCoefficient` interpreter.
+
+    Return the instructions as pairs of (operation, operand), the constants,
+    the names of the args used and the stack size needed. Raise a
+    ``ValueError`` if the expression uses unsupported syntax or non-numeric
+    args.
+    """
+    code = []
+    consts = []
+    keys = []
+    depth = [0, 0]
+
+    def push(op, operand=0):
+        code.extend([op, operand])
+        depth[0] += 1
+        depth[1] = max(depth)
+
+    def function_name(node):
+        if isinstance(node, ast.Name) and node.id not in args:
+            if node.id in _BYTECODE_FUNCS:
+                return node.id
+        elif (
+            isinstance(node, ast.Attribute)
+            and isinstance(node.value, ast.Name)
+            and node.value.id == "np"
+            and "np" not in args
+            and node.attr in _BYTECODE_NP_FUNCS
+        ):
+            return _BYTECODE_NP_FUNCS[node.attr]
+        raise ValueError("Unsupported function")
+
+    def emit(node):
+        if (
+            isinstance(node, ast.Constant)
+            and isinstance(node.value, numbers.Number)
+            and not isinstance(node.value, bool)
+        ):
+            push(_OP_CONST, len(consts))
+            consts.append(node.value)
+        elif isinstance(node, ast.Name):
+            if node.id in args:
+                if not isinstance(args[node.id], numbers.Number):
+                    raise ValueError(f"Unsupported argument: {node.id}")
+                if node.id not in keys:
+                    keys.append(node.id)
+                push(_OP_ARG, keys.index(node.id))
+            elif node.id == "t":
+                push(_OP_T)
+            elif node.id == "pi":
+                push(_OP_CONST, len(consts))
+                consts.append(np.pi)
+            else:
+                raise ValueError(f"Unknown name: {node.id}")
+        elif (
+            isinstance(node, ast.BinOp)
+            and type(node.op) in _BYTECODE_BINOPS
+        ):
+            emit(node.left)
+            emit(node.right)
+            code.extend([_BYTECODE_BINOPS[type(node.op)], 0])
+            depth[0] -= 1
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            emit(node.operand)
+            code.extend([_OP_NEG, 0])
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.UAdd):
+            emit(node.operand)
+        elif (
+            isinstance(node, ast.Call)
+            and len(node.args) == 1
+            and not node.keywords
+        ):
+            name = function_name(node.func)
+            emit(node.args[0])
+            code.extend([_OP_FUNC, _BYTECODE_FUNCS.index(name)])
+        else:
+            raise ValueError(f"Unsupported expression: {ast.dump(node)}")
+
+    emit(ast.parse(base.strip(), mode="eval").body)
+    return code, consts, keys, depth[1]
+
+
+cdef double complex _bytecode_func(int func, double complex x) except *:
+    if func == 0:
+        return cmath.sin(x)
+    elif func == 1:
+        return cmath.cos(x)
+    elif func == 2:
+        return cmath.tan(x)
+    elif func == 3:
+        return cmath.asin(x)
+    elif func == 4:
+        return cmath.acos(x)
+    elif func == 5:
+        return cmath.atan(x)
+    elif func == 6:
+        return cmath.sinh(x)
+    elif func == 7:
+        return cmath.cosh(x)
+    elif func == 8:
+        return cmath.tanh(x)
+    elif func == 9:
+        return cmath.asinh(x)
+    elif func == 10:
+        return cmath.acosh(x)
+    elif func == 11:
+        return cmath.atanh(x)
+    elif func == 12:
+        return cmath.exp(x)
+    elif func == 13:
+        return cmath.log(x)
+    elif func == 14:
+        return cmath.log10(x)
+    elif func == 15:
+        return cmath.sqrt(x)
+    elif func == 16:
+        return cmath.real(x)
+    elif func == 17:
+        return cmath.imag(x)
+    elif func == 18:
+        return cmath.conj(x)
+    elif func == 19:
+        return cmath.abs(x)
+    elif func == 20:
+        return cmath.norm(x)
+    elif func == 21:
+        return cmath.arg(x)
+    elif func == 22:
+        return cmath.proj(x)
+    # erf and zerf
+    return zerf(x)
+
+
+@cython.cdivision(True)
+cdef inline double complex _bytecode_pow(double complex x, double complex y):
+    cdef int n, i
+    cdef double complex out = 1.
+    if y.imag == 0 and -64 <= y.real <= 64 and y.real == <int>y.real:
+        # Integer powers by repeated multiplication, as exact as python's.
+        n = <int>y.real
+        for i in range(n if n > 0 else -n):
+            out *= x
+        return out if n >= 0 else 1. / out
+    return x ** y
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.initializedcheck(False)
+@cython.cdivision(True)
+cdef double complex _run_bytecode(
+    int[::1] code, double complex[::1] consts, double complex[::1] argvals,
+    double complex[::1] stack, list coeffs, double t
+) except *:
+    """
+    Stack interpreter of the instructions produced by :func:`_str_to_bytecode`
+    and :func:`_tree_to_bytecode`. ``coeffs`` are the coefficients called by
+    ``_OP_COEFF`` instructions.
+    """
+    cdef size_t pc = 0, sp = 0
+    cdef size_t n = code.shape[0]
+    cdef int op, operand
+    cdef double complex x
+    while pc < n:
+        op = code[pc]
+        operand = code[pc + 1]
+        pc += 2
+        if op == _OP_CONST:
+            stack[sp] = consts[operand]
+            sp += 1
+        elif op == _OP_T:
+            stack[sp] = t
+            sp += 1
+        elif op == _OP_ARG:
+            stack[sp] = argvals[operand]
+            sp += 1
+        elif op == _OP_COEFF:
+            stack[sp] = (<Coefficient> coeffs[operand])._call(t)
+            sp += 1
+        elif op == _OP_NEG:
+            stack[sp - 1] = -stack[sp - 1]
+        elif op == _OP_FUNC:
+            stack[sp - 1] = _bytecode_func(operand, stack[sp - 1])
+        else:
+            sp -= 1
+            x = stack[sp]
+            if op == _OP_ADD:
+                stack[sp - 1] = stack[sp - 1] + x
+            elif op == _OP_SUB:
+                stack[sp - 1] = stack[sp - 1] - x
+            elif op == _OP_MUL:
+                stack[sp - 1] = stack[sp - 1] * x
+            elif op == _OP_DIV:
+                stack[sp - 1] = stack[sp - 1] / x
+            else:
+                stack[sp - 1] = _bytecode_pow(stack[sp - 1], x)
+    return stack[0]
+
+
+cdef class StrBytecodeCoefficient(Coefficient):
+    """
+    A :obj:`.Coefficient` defined by a string containing a simple
+    arithmetic expression, evaluated without a compiler.
+
+    The expression is translated once into instructions for a small stack
+    based interpreter written in Cython, so evaluation involves no Python
+    call. It is used for string coefficients when Cython compilation is not
+    available. All operations use complex arithmetic.
+
+    Only numbers, ``t``, ``pi``, numeric arguments, the operators
+    ``+ - * / **`` and the functions ``sin``, ``cos``, ``tan``, ``asin``,
+    ``acos``, ``atan``, ``sinh``, ``cosh``, ``tanh``, ``asinh``, ``acosh``,
+    ``atanh``, ``exp``, ``log``, ``log10``, ``sqrt``, ``real``, ``imag``,
+    ``conj``, ``abs``, ``norm``, ``arg``, ``proj``, ``erf`` and ``zerf``
+    (also as ``np.func``) are supported. Other expressions raise a
+    ``ValueError`` and should use :obj:`StrFunctionCoefficient`.
+
+    Parameters
+    ----------
+    base : str
+        A string representing an arithmetic expression.
+
+    args : dict
+        A dictionary of variable used in the code string. It may include unused
+        variables.
+    """
+    cdef str base
+    cdef int[::1] code
+    cdef double complex[::1] consts
+    cdef double complex[::1] argvals
+    cdef double complex[::1] stack
+
+    def __init__(self, base, dict args, **_):
+        code, consts, keys, depth = _str_to_bytecode(base, args)
+        self.base = base
+        self.args = args
+        self.code = np.array(code, dtype=np.intc)
+        self.consts = np.array(consts + [0], dtype=np.complex128)
+        self.argvals = np.array(
+            [args[key] for key in keys] + [0], dtype=np.complex128
+        )
+        self.stack = np.zeros(depth, dtype=np.complex128)
+
+    cdef double complex _call(self, double t) except *:
+        return _run_bytecode(
+            self.code, self.consts, self.argvals, self.stack, None, t
+        )
+
+    cpdef Coefficient copy(self):
+        """Return a copy of the :obj:`.Coefficient`."""
+        return StrBytecodeCoefficient(self.base, self.args.copy())
+
+    def __reduce__(self):
+        return (StrBytecodeCoefficient, (self.base, self.args))
+
+    def derivative(self, arg=None):
+        """
+        Return a :obj:`.Coefficient` of the derivative of this one with
+        respect to time, or to the argument ``arg`` if given.
+        """
+        return StrBytecodeCoefficient(
+            _str_derivative(self.base, self.args, arg), self.args
+        )
+
+    def replace_arguments(self, _args=None, **kwargs):
+        """
+        Replace the arguments (``args``) of a coefficient.
+
+        Returns a new :obj:`.Coefficient` if the coefficient has arguments, or
+        the original coefficient if it does not. Arguments to replace may be
+        supplied either in a dictionary as the first position argument, or
+        passed as keywords, or as a combination of the two. Arguments not
+        replaced retain their previous values.
+
+        Parameters
+        ----------
+        _args : dict
+            Dictionary of arguments to replace.
+
+        **kwargs
+            Arguments to replace.
+        """
+        if _args:
+            kwargs.update(_args)
+        if not kwargs:
+            return self
+        args = {**self.args, **kwargs}
+        try:
+            return StrBytecodeCoefficient(self.base, args)
+        except ValueError:
+            # New arguments are not numbers.
+            return StrFunctionCoefficient(self.base, args)
+
+
+def _interpolation_poly(coeff_arr, tlist, order, boundary_conditions):
+    """
+    Compute the polynomials interpolating ``coeff_arr`` in each interval of
+    ``tlist``. ``coeff_arr`` can hold many arrays to interpolate along its
+    first dimension.
+
+    Return the times of the interval boundaries, which may include knots added
+    by scipy, and the polynomials coefficients, from the highest order, with
+    shape ``(*coeff_arr.shape[:-1], order + 1, len(tlist))``.
+    """
+    if order == 0:
+        poly = coeff_arr[..., np.newaxis, :]
+    elif order == 1:
+        poly = np.stack([
+                np.diff(coeff_arr, append=-1) / np.diff(tlist, append=-1),
+                coeff_arr
+            ], axis=-2)
+    else:
+        # Use scipy to compute the spline and transform it to polynomes
+        # as used in scipy's PPoly which is easier for us to use.
+        spline = make_interp_spline(tlist, coeff_arr, k=order,
+                                    bc_type=boundary_conditions, axis=-1)
+        # Scipy can move knots, we add them to tlist
+        tlist = np.sort(np.unique(np.concatenate([spline.t, tlist])))
+        a = np.arange(spline.k+1)
+        a[0] = 1
+        fact = np.cumprod(a)
+        poly = np.stack([
+            spline(tlist, i) / fact[i]
+            for i in range(spline.k, -1, -1)
+        ], axis=-2)
+    return tlist, poly
+
+
+def _evaluate_poly(tlist, poly, t):
+    """
+    Evaluate the interpolation polynomials ``poly``, as returned by
+    :func:`_interpolation_poly`, at each time of the array ``t``.
+    """
+    idx = np.clip(np.searchsorted(tlist, t, side="right") - 1,
+                  0, len(tlist) - 1)
+    factor = t - tlist[idx]
+    out = poly[..., 0, idx]
+    for i in range(1, poly.shape[-2]):
+        out = out * factor + poly[..., i, idx]
+    out = np.where(t <= tlist[0], poly[..., -1, :1], out)
+    return np.where(t >= tlist[-1], poly[..., -1, -1:], out)
+
+
+cdef class _TimeGrid:
+    """
+    Times at which interpolated coefficients are tabulated.
+
+    The grid finds the interval containing a given time and remembers the last
+    lookup, so that coefficients sharing a grid only search once per time.
+    """
+    cdef double[::1] tlist
+    cdef readonly double dt
+    cdef double t_last
+    cdef size_t idx_last
+
+    def __init__(self, np_tlist, dt=None):
+        self.tlist = np_tlist
+        diff = np.diff(np_tlist)
+        if dt is not None:
+            self.dt = dt
+        elif len(diff) >= 1 and np.allclose(diff[0], diff):
+            self.dt = diff[0]
+        else:
+            self.dt = 0
+        self.t_last = np.nan
+        self.idx_last = 0
+
+    @cython.wraparound(False)
+    @cython.boundscheck(False)
+    cdef size_t _hunt(self, double x):
+        # Search for the interval starting from the last one found: the
+        # integrators call coefficients with nearly monotonous times, so the
+        # interval is usually the same or a close one.
+        cdef size_t low = self.idx_last
+        cdef size_t high
+        cdef size_t step = 1
+        cdef size_t n = self.tlist.shape[0]
+        cdef size_t middle
+        if x >= self.tlist[low]:
+            if low + 1 == n or x < self.tlist[low + 1]:
+                return low
+            # Expand the bracket upward until it contains x.
+            high = low + 1
+            while high < n and x >= self.tlist[high]:
+                low = high
+                high = low + step
+                step *= 2
+            if high > n:
+                high = n
+        else:
+            high = low
+            # Expand the bracket downward until it contains x.
+            while high > step and x < self.tlist[high - step]:
+                high -= step
+                step *= 2
+            low = high - step if high > step else 0
+        while low + 1 < high:
+            middle = (low + high) // 2
+            if x < self.tlist[middle]:
+                high = middle
+            else:
+                low = middle
+        return low
+
+    @cython.cdivision(True)
+    cdef size_t index(self, double t):
+        """
+        Return the index of the interval containing ``t``, which must be
+        within the grid.
+
+        Uniform grids are indexed directly, others are searched starting
+        from the interval of the previous call.
+        """
+        if t == self.t_last:
+            return self.idx_last
+        if self.dt:
+            self.idx_last = <size_t>((t - self.tlist[0]) / self.dt)
+        else:
+            self.idx_last = self._hunt(t)
+        self.t_last = t
+        return self.idx_last
+
+
 cdef class InterCoefficient(Coefficient):
     """
     A :obj:`.Coefficient` built from an interpolation of a numpy array.
@@ -407,6 +1129,7 @@ cdef class InterCoefficient(Coefficient):
     cdef double[::1] tlist
     cdef complex[:, :] poly
     cdef object np_arrays
+    cdef _TimeGrid grid
 
     def __init__(self, coeff_arr, tlist, int order, boundary_conditions, **_):
         tlist = np.array(tlist, dtype=np.float64)
@@ -421,64 +1144,20 @@ cdef class InterCoefficient(Coefficient):
             raise ValueError("order must be a positive integer")
 
         order = min(order, len(tlist) - 1)
+        tlist, poly = _interpolation_poly(
+            coeff_arr, tlist, order, boundary_conditions
+        )
+        self._prepare(tlist, poly)
 
-        if order == 0:
-            coeff_arr = coeff_arr.reshape((1, -1))
-        elif order == 1:
-            coeff_arr = np.vstack([
-                    np.diff(coeff_arr, append=-1) / np.diff(tlist, append=-1),
-                    coeff_arr
-                ])
-        elif order >= 2:
-            # Use scipy to compute the spline and transform it to polynomes
-            # as used in scipy's PPoly which is easier for us to use.
-            spline = make_interp_spline(tlist, coeff_arr, k=order,
-                                        bc_type=boundary_conditions)
-            # Scipy can move knots, we add them to tlist
-            tlist = np.sort(np.unique(np.concatenate([spline.t, tlist])))
-            a = np.arange(spline.k+1)
-            a[0] = 1
-            fact = np.cumprod(a)
-            coeff_arr = np.concatenate([
-                spline(tlist, i) / fact[i]
-                for i in range(spline.k, -1, -1)
-            ]).reshape((spline.k+1, -1))
-
-        self._prepare(tlist, coeff_arr)
-
-    def _prepare(self, np_tlist, np_poly, dt=None):
+    def _prepare(self, np_tlist, np_poly, dt=None, _TimeGrid grid=None):
         self.np_arrays = (np_tlist, np_poly)
         self.tlist = np_tlist
         self.poly = np_poly
         self.order = self.poly.shape[0] - 1
-        diff = np.diff(self.np_arrays[0])
-        if dt is not None:
-            self.dt = dt
-        elif len(diff) >= 1 and np.allclose(diff[0], diff):
-            self.dt = diff[0]
-        else:
-            self.dt = 0
-
-    @cython.wraparound(False)
-    @cython.boundscheck(False)
-    @cython.cdivision(True)
-    cdef size_t _binary_search(self, double x):
-        # Binary search for the interval
-        # return the indice of the of the biggest element where t <= x
-        cdef size_t low = 0
-        cdef size_t high = self.tlist.shape[0]
-        cdef size_t middle
-        cdef size_t count = 0
-        while low+1 != high and count < 64:
-            middle = (low + high)//2
-            if x < self.tlist[middle]:
-                high = middle
-            else:
-                low = middle
-            # We keep a count to be sure that it never get into an infinit loop
-            # even if tlist has an unexpected format.
-            count += 1
-        return low
+        if grid is None:
+            grid = _TimeGrid(np_tlist, dt)
+        self.grid = grid
+        self.dt = grid.dt
 
     @cython.initializedcheck(False)
     @cython.cdivision(True)
@@ -491,10 +1170,7 @@ cdef class InterCoefficient(Coefficient):
             return self.poly[-1, 0]
         elif t >= self.tlist[-1]:
             return self.poly[-1, -1]
-        if self.dt:
-            idx = <size_t>((t - self.tlist[0]) / self.dt)
-        else:
-            idx = self._binary_search(t)
+        idx = self.grid.index(t)
         if self.order == 0:
             out = self.poly[0, idx]
         else:
@@ -506,6 +1182,9 @@ cdef class InterCoefficient(Coefficient):
                 out += slice[i]
         return out
 
+    def _call_array(self, t):
+        return _evaluate_poly(*self.np_arrays, t)
+
     def __reduce__(self):
         return (InterCoefficient.restore, (*self.np_arrays, self.dt))
 
@@ -535,6 +1214,27 @@ cdef class InterCoefficient(Coefficient):
         """Return a copy of the :obj:`.Coefficient`."""
         return InterCoefficient.restore(*self.np_arrays, self.dt)
 
+    def derivative(self, arg=None):
+        """
+        Return a :obj:`.Coefficient` of the derivative of this one with
+        respect to time, or to the argument ``arg`` if given.
+
+        The derivative of the interpolating polynomials is exact. The
+        interpolation is constant outside ``tlist``, where the derivative is
+        zero. Interpolations do not depend on arguments.
+        """
+        if arg is not None or self.order == 0:
+            return ConstantCoefficient(0)
+        tlist, poly = self.np_arrays
+        powers = np.arange(self.order, 0, -1)[:, np.newaxis]
+        dpoly = poly[:-1] * powers
+        # The last polynomial is only used after ``tlist[-1]``. Before
+        # ``tlist[0]``, add an interval with a null polynomial.
+        dpoly[:, -1] = 0
+        dpoly = np.concatenate([np.zeros((self.order, 1)), dpoly], axis=1)
+        tlist = np.concatenate([[2 * tlist[0] - tlist[1]], tlist])
+        return InterCoefficient.restore(tlist, dpoly, self.dt or None)
+
 
 cdef Coefficient add_inter(InterCoefficient left, InterCoefficient right):
     """ Add two array coefficient with matching tlist into one."""
@@ -553,6 +1253,83 @@ cdef Coefficient add_inter(InterCoefficient left, InterCoefficient right):
         return SumCoefficient(left, right)
 
 
+class CoefficientBank:
+    """
+    Many interpolated coefficients sharing the same ``tlist``.
+
+    The coefficients of the bank are :obj:`.InterCoefficient` sharing their
+    time grid: when they are evaluated at the same time, for example in the
+    terms of a :obj:`.QobjEvo` with many control channels, the interval
+    containing that time is searched only once. The bank can also evaluate
+    all coefficients at once.
+
+    Examples
+    --------
+    >>> bank = CoefficientBank(pulses, tlist)
+    >>> H = QobjEvo([H0] + [[op, c] for op, c in zip(controls, bank)])
+
+    Parameters
+    ----------
+    coeff_arrs : np.ndarray
+        2D array of coefficient values to interpolate, with one row per
+        coefficient.
+
+    tlist : np.ndarray
+        An array of times corresponding to each column of ``coeff_arrs``. The
+        times must be increasing, but do not need to be uniformly spaced.
+
+    order : int, default: 3
+        Order of the interpolation. Order ``0`` uses the previous (i.e. left)
+        value. The order will be reduced to ``len(tlist) - 1`` if it is larger.
+
+    boundary_conditions : 2-Tuple, str or None, optional
+        Boundary conditions for spline evaluation. Correspond to `bc_type` of
+        scipy.interpolate.make_interp_spline.
+    """
+    def __init__(self, coeff_arrs, tlist, order=3, boundary_conditions=None):
+        tlist = np.array(tlist, dtype=np.float64)
+        coeff_arrs = np.array(coeff_arrs, dtype=np.complex128)
+
+        if coeff_arrs.ndim != 2:
+            raise ValueError("The arrays to interpolate must be a 2D array")
+        if coeff_arrs.shape[1:] != tlist.shape:
+            raise ValueError("tlist must be the same len "
+                             "as the arrays to interpolate")
+        if order < 0:
+            raise ValueError("order must be a positive integer")
+
+        order = min(order, len(tlist) - 1)
+        self.tlist, self.poly = _interpolation_poly(
+            coeff_arrs, tlist, order, boundary_conditions
+        )
+        grid = _TimeGrid(self.tlist)
+        self.coefficients = []
+        for poly in self.poly:
+            coeff = InterCoefficient.__new__(InterCoefficient)
+            coeff._prepare(self.tlist, poly, grid=grid)
+            self.coefficients.append(coeff)
+
+    def __len__(self):
+        return len(self.coefficients)
+
+    def __getitem__(self, idx):
+        return self.coefficients[idx]
+
+    def __iter__(self):
+        return iter(self.coefficients)
+
+    def __call__(self, t):
+        """
+        Return the value of every coefficient at time ``t``. If ``t`` is an
+        array, the output has shape ``(len(self), *t.shape)``.
+        """
+        t = np.asarray(t, dtype=np.float64)
+        if t.ndim == 0:
+            return _evaluate_poly(self.tlist, self.poly, t[np.newaxis])[:, 0]
+        out = _evaluate_poly(self.tlist, self.poly, t.ravel())
+        return out.reshape((len(self),) + t.shape)
+
+
 @cython.auto_pickle(True)
 cdef class SumCoefficient(Coefficient):
     """
@@ -577,6 +1354,15 @@ cdef class SumCoefficient(Coefficient):
         """Return a copy of the :obj:`.Coefficient`."""
         return SumCoefficient(self.first.copy(), self.second.copy())
 
+    def derivative(self, arg=None):
+        """
+        Return a :obj:`.Coefficient` of the derivative of this one with
+        respect to time, or to the argument ``arg`` if given.
+        """
+        return _fold(SumCoefficient(
+            self.first.derivative(arg), self.second.derivative(arg)
+        ))
+
     def replace_arguments(self, _args=None, **kwargs):
         """
         Replace the arguments (``args``) of a coefficient.
@@ -625,6 +1411,16 @@ cdef class MulCoefficient(Coefficient):
         """Return a copy of the :obj:`.Coefficient`."""
         return MulCoefficient(self.first.copy(), self.second.copy())
 
+    def derivative(self, arg=None):
+        """
+        Return a :obj:`.Coefficient` of the derivative of this one with
+        respect to time, or to the argument ``arg`` if given.
+        """
+        return _fold(SumCoefficient(
+            MulCoefficient(self.first.derivative(arg), self.second),
+            MulCoefficient(self.first, self.second.derivative(arg)),
+        ))
+
     def replace_arguments(self, _args=None, **kwargs):
         """
         Replace the arguments (``args``) of a coefficient.
@@ -669,6 +1465,15 @@ cdef class ConjCoefficient(Coefficient):
         """Return a copy of the :obj:`.Coefficient`."""
         return ConjCoefficient(self.base.copy())
 
+    def derivative(self, arg=None):
+        """
+        Return a :obj:`.Coefficient` of the derivative of this one with
+        respect to time, or to the argument ``arg`` if given.
+        """
+        # The variable is real: the derivative of the conjugate is the
+        # conjugate of the derivative.
+        return _fold(ConjCoefficient(self.base.derivative(arg)))
+
     def replace_arguments(self, _args=None, **kwargs):
         """
         Replace the arguments (``args``) of a coefficient.
@@ -735,6 +1540,17 @@ cdef class NormCoefficient(Coefficient):
         """Return a copy of the :obj:`.Coefficient`."""
         return NormCoefficient(self.base.copy())
 
+    def derivative(self, arg=None):
+        """
+        Return a :obj:`.Coefficient` of the derivative of this one with
+        respect to time, or to the argument ``arg`` if given.
+        """
+        cdef Coefficient derivative = self.base.derivative(arg)
+        return _fold(SumCoefficient(
+            MulCoefficient(ConjCoefficient(self.base), derivative),
+            MulCoefficient(self.base, ConjCoefficient(derivative)),
+        ))
+
 
 @cython.auto_pickle(True)
 cdef class ConstantCoefficient(Coefficient):
@@ -774,3 +1590,316 @@ cdef class ConstantCoefficient(Coefficient):
     cpdef Coefficient copy(self):
         """Return a copy of the :obj:`.Coefficient`."""
         return self
+
+    def derivative(self, arg=None):
+        """
+        Return a :obj:`.Coefficient` of the derivative of this one with
+        respect to time, or to the argument ``arg`` if given.
+        """
+        return ConstantCoefficient(0)
+
+
+cdef object _const_value(Coefficient coeff):
+    """ Value of a constant coefficient, ``None`` for other coefficients. """
+    if isinstance(coeff, ConstantCoefficient):
+        return (<ConstantCoefficient> coeff).value
+    return None
+
+
+cdef bint _same_grid(InterCoefficient left, InterCoefficient right):
+    return (
+        left.np_arrays[0].shape == right.np_arrays[0].shape
+        and np.allclose(left.np_arrays[0], right.np_arrays[0],
+                        rtol=1e-15, atol=1e-15)
+    )
+
+
+cdef Coefficient _fold_mul(Coefficient first, Coefficient second):
+    """ Simplify the product of two folded coefficients. """
+    cdef InterCoefficient inter
+    value = _const_value(first)
+    if value is None:
+        first, second = second, first
+        value = _const_value(first)
+    if value is not None:
+        other = _const_value(second)
+        if other is not None or value == 0:
+            return ConstantCoefficient(value * (other or 0))
+        if value == 1:
+            return second
+        if isinstance(second, InterCoefficient):
+            # Interpolations are linear in the interpolated values.
+            inter = second
+            return InterCoefficient.restore(
+                inter.np_arrays[0], inter.np_arrays[1] * value, inter.dt
+            )
+        if isinstance(second, MulCoefficient):
+            # c1 * (c2 * f) -> (c1 * c2) * f
+            for inner, other in [
+                ((<MulCoefficient> second).first,
+                 (<MulCoefficient> second).second),
+                ((<MulCoefficient> second).second,
+                 (<MulCoefficient> second).first),
+            ]:
+                if _const_value(inner) is not None:
+                    return _fold_mul(
+                        ConstantCoefficient(value * _const_value(inner)),
+                        other
+                    )
+    elif (
+        isinstance(first, InterCoefficient)
+        and isinstance(second, InterCoefficient)
+        and (<InterCoefficient> first).order == 0
+        and (<InterCoefficient> second).order == 0
+        and _same_grid(first, second)
+    ):
+        # Step functions on the same grid stay step functions.
+        inter = first
+        return InterCoefficient.restore(
+            inter.np_arrays[0],
+            inter.np_arrays[1] * (<InterCoefficient> second).np_arrays[1],
+            inter.dt
+        )
+    return MulCoefficient(first, second)
+
+
+cdef Coefficient _fold(Coefficient coeff):
+    """
+    Simplify a tree of :obj:`SumCoefficient`, :obj:`MulCoefficient`,
+    :obj:`ConjCoefficient` and :obj:`NormCoefficient`: evaluate operations on
+    constants, remove neutral terms and merge interpolations sharing the same
+    times.
+    """
+    cdef Coefficient first, second
+    cdef InterCoefficient inter
+    if isinstance(coeff, FusedCoefficient):
+        return _fold((<FusedCoefficient> coeff).source)
+    if isinstance(coeff, SumCoefficient):
+        first = _fold((<SumCoefficient> coeff).first)
+        second = _fold((<SumCoefficient> coeff).second)
+        if _const_value(first) is not None:
+            first, second = second, first
+        value = _const_value(second)
+        if value is not None:
+            if _const_value(first) is not None:
+                return ConstantCoefficient(_const_value(first) + value)
+            if value == 0:
+                return first
+        if (
+            isinstance(first, InterCoefficient)
+            and isinstance(second, InterCoefficient)
+        ):
+            return add_inter(first, second)
+        return SumCoefficient(first, second)
+    if isinstance(coeff, MulCoefficient):
+        return _fold_mul(
+            _fold((<MulCoefficient> coeff).first),
+            _fold((<MulCoefficient> coeff).second),
+        )
+    if isinstance(coeff, ConjCoefficient):
+        first = _fold((<ConjCoefficient> coeff).base)
+        if _const_value(first) is not None:
+            return ConstantCoefficient(_const_value(first).conjugate())
+        if isinstance(first, ConjCoefficient):
+            return (<ConjCoefficient> first).base
+        if isinstance(first, InterCoefficient):
+            # Times are real: the conjugate of the polynomials is exact.
+            inter = first
+            return InterCoefficient.restore(
+                inter.np_arrays[0], inter.np_arrays[1].conj(), inter.dt
+            )
+        return ConjCoefficient(first)
+    if isinstance(coeff, NormCoefficient):
+        first = _fold((<NormCoefficient> coeff).base)
+        if _const_value(first) is not None:
+            return ConstantCoefficient(abs(_const_value(first))**2)
+        return NormCoefficient(first)
+    return coeff
+
+
+def _tree_to_bytecode(
+    Coefficient coeff, list code, list consts, list argvals, list coeffs
+):
+    """
+    Append the instructions computing ``coeff`` to ``code``. Coefficients
+    defined by strings are inlined, other leaves of the tree are called
+    from the interpreter.
+
+    Return the stack size needed.
+    """
+    if isinstance(coeff, (SumCoefficient, MulCoefficient)):
+        if isinstance(coeff, SumCoefficient):
+            first = (<SumCoefficient> coeff).first
+            second = (<SumCoefficient> coeff).second
+            op = _OP_ADD
+        else:
+            first = (<MulCoefficient> coeff).first
+            second = (<MulCoefficient> coeff).second
+            op = _OP_MUL
+        depth = _tree_to_bytecode(first, code, consts, argvals, coeffs)
+        depth = max(
+            depth,
+            _tree_to_bytecode(second, code, consts, argvals, coeffs) + 1
+        )
+        code.extend([op, 0])
+        return depth
+    if isinstance(coeff, (ConjCoefficient, NormCoefficient)):
+        if isinstance(coeff, ConjCoefficient):
+            base = (<ConjCoefficient> coeff).base
+            func = _BYTECODE_FUNCS.index("conj")
+        else:
+            base = (<NormCoefficient> coeff).base
+            func = _BYTECODE_FUNCS.index("norm")
+        depth = _tree_to_bytecode(base, code, consts, argvals, coeffs)
+        code.extend([_OP_FUNC, func])
+        return depth
+    if isinstance(coeff, ConstantCoefficient):
+        code.extend([_OP_CONST, len(consts)])
+        consts.append((<ConstantCoefficient> coeff).value)
+        return 1
+    base = None
+    if isinstance(coeff, StrFunctionCoefficient):
+        base = (<StrFunctionCoefficient> coeff).base
+    elif isinstance(coeff, StrBytecodeCoefficient):
+        base = (<StrBytecodeCoefficient> coeff).base
+    if base is not None:
+        try:
+            sub_code, sub_consts, keys, depth = _str_to_bytecode(
+                base, coeff.args
+            )
+        except ValueError:
+            pass
+        else:
+            # Relocate the constants and arguments of the expression.
+            for i in range(0, len(sub_code), 2):
+                if sub_code[i] == _OP_CONST:
+                    sub_code[i + 1] += len(consts)
+                elif sub_code[i] == _OP_ARG:
+                    sub_code[i + 1] += len(argvals)
+            code.extend(sub_code)
+            consts.extend(sub_consts)
+            argvals.extend(coeff.args[key] for key in keys)
+            return depth
+    code.extend([_OP_COEFF, len(coeffs)])
+    coeffs.append(coeff)
+    return 1
+
+
+cdef class FusedCoefficient(Coefficient):
+    """
+    A tree of sums, products, conjugates and norms of coefficients evaluated
+    as a single kernel.
+
+    The tree is translated into instructions for the interpreter used by
+    :obj:`StrBytecodeCoefficient`. Constants and coefficients defined by
+    simple string expressions are inlined, other coefficients of the tree are
+    called directly from the interpreter. This avoids walking the tree of
+    coefficients at each call.
+
+    :obj:`FusedCoefficient` is returned by :meth:`Coefficient.optimize`.
+
+    Parameters
+    ----------
+    source : :obj:`.Coefficient`
+        The tree of coefficients to evaluate.
+    """
+    cdef readonly Coefficient source
+    cdef int[::1] code
+    cdef double complex[::1] consts
+    cdef double complex[::1] argvals
+    cdef double complex[::1] stack
+    cdef list coeffs
+
+    def __init__(self, Coefficient source):
+        code, consts, argvals, coeffs = [], [], [], []
+        depth = _tree_to_bytecode(source, code, consts, argvals, coeffs)
+        self.source = source
+        self.code = np.array(code, dtype=np.intc)
+        self.consts = np.array(consts + [0], dtype=np.complex128)
+        self.argvals = np.array(argvals + [0], dtype=np.complex128)
+        self.stack = np.zeros(depth, dtype=np.complex128)
+        self.coeffs = coeffs
+
+    cdef double complex _call(self, double t) except *:
+        return _run_bytecode(
+            self.code, self.consts, self.argvals, self.stack, self.coeffs, t
+        )
+
+    cpdef Coefficient copy(self):
+        """Return a copy of the :obj:`.Coefficient`."""
+        return FusedCoefficient(self.source.copy())
+
+    def __reduce__(self):
+        return (FusedCoefficient, (self.source,))
+
+    def derivative(self, arg=None):
+        """
+        Return a :obj:`.Coefficient` of the derivative of this one with
+        respect to time, or to the argument ``arg`` if given.
+        """
+        return self.source.derivative(arg).optimize()
+
+    def replace_arguments(self, _args=None, **kwargs):
+        """
+        Replace the arguments (``args``) of a coefficient.
+
+        Returns a new :obj:`.Coefficient` if the coefficient has arguments, or
+        the original coefficient if it does not. Arguments to replace may be
+        supplied either in a dictionary as the first position argument, or
+        passed as keywords, or as a combination of the two. Arguments not
+        replaced retain their previous values.
+
+        Parameters
+        ----------
+        _args : dict
+            Dictionary of arguments to replace.
+
+        **kwargs
+            Arguments to replace.
+        """
+        return FusedCoefficient(
+            self.source.replace_arguments(_args, **kwargs)
+        )
+
+
+@cython.auto_pickle(True)
+cdef class _ReversedCoefficient(Coefficient):
+    """
+    A :obj:`.Coefficient` evaluated backward in time from ``t_end``:
+    ``coeff(t_end - t)``. Used for backward evolutions with the integrators.
+    """
+    cdef Coefficient base
+    cdef double t_end
+
+    def __init__(self, Coefficient base, double t_end):
+        self.base = base
+        self.t_end = t_end
+
+    cdef double complex _call(self, double t) except *:
+        return self.base._call(self.t_end - t)
+
+    cpdef Coefficient copy(self):
+        """Return a copy of the :obj:`.Coefficient`."""
+        return _ReversedCoefficient(self.base.copy(), self.t_end)
+
+    def replace_arguments(self, _args=None, **kwargs):
+        """
+        Replace the arguments (``args``) of a coefficient.
+
+        Returns a new :obj:`.Coefficient` if the coefficient has arguments, or
+        the original coefficient if it does not. Arguments to replace may be
+        supplied either in a dictionary as the first position argument, or
+        passed as keywords, or as a combination of the two. Arguments not
+        replaced retain their previous values.
+
+        Parameters
+        ----------
+        _args : dict
+            Dictionary of arguments to replace.
+
+        **kwargs
+            Arguments to replace.
+        """
+        return _ReversedCoefficient(
+            self.base.replace_arguments(_args, **kwargs), self.t_end
+        )
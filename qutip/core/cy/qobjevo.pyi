@@ -34,6 +34,7 @@ class QobjEvo:
         tlist: ArrayLike = None,
         order: int = 3,
         boundary_conditions: tuple | str = None,
+        compile_opt: dict = None,
     ) -> None: ...
     @overload
     def arguments(self, new_args: dict[str, Any]) -> None: ...
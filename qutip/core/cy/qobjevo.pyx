@@ -10,7 +10,10 @@ import qutip
 from .. import Qobj
 from .. import data as _data
 from ..dimensions import Dimensions
-from ..coefficient import coefficient, CompilationOptions
+from ..coefficient import (
+    coefficient, CompilationOptions, compile_coefficients
+)
+from .coefficient import ConstantCoefficient, _ReversedCoefficient
 from ._element import *
 from qutip.settings import settings
 
@@ -105,6 +108,10 @@ cdef class QobjEvo:
         Refer to Scipy's documentation for further details:
         https://docs.scipy.org/doc/scipy/reference/generated/scipy.interpolate.make_interp_spline.html
 
+    compile_opt : CompilationOptions, optional
+        Sets of options for the compilation of string based coefficients.
+        See :func:`.coefficient`.
+
     Attributes
     ----------
     dims : list
@@ -188,7 +195,8 @@ cdef class QobjEvo:
     """
     def __init__(QobjEvo self, Q_object, args=None, *, copy=True, compress=True,
                  function_style=None,
-                 tlist=None, order=3, boundary_conditions=None):
+                 tlist=None, order=3, boundary_conditions=None,
+                 compile_opt=None):
         if isinstance(Q_object, QobjEvo):
             self._dims = Q_object._dims
             self.shape = Q_object.shape
@@ -218,12 +226,22 @@ cdef class QobjEvo:
             Q_object = [Q_object]
 
         if isinstance(Q_object, list):
+            str_coeffs = [
+                op[1] for op in Q_object
+                if isinstance(op, list) and isinstance(op[1], str)
+            ]
+            if len(str_coeffs) > 1:
+                # Compile all string coefficients in one module.
+                compile_coefficients(
+                    str_coeffs, args=args, compile_opt=compile_opt
+                )
             for op in Q_object:
                 self.elements.append(
                     self._read_element(
                         op, copy=copy, tlist=tlist, args=args, order=order,
                         function_style=function_style,
-                        boundary_conditions=boundary_conditions
+                        boundary_conditions=boundary_conditions,
+                        compile_opt=compile_opt,
                     )
                 )
         else:
@@ -231,7 +249,8 @@ cdef class QobjEvo:
                 self._read_element(
                     Q_object, copy=copy, tlist=tlist, args=args, order=order,
                     function_style=function_style,
-                    boundary_conditions=boundary_conditions
+                    boundary_conditions=boundary_conditions,
+                    compile_opt=compile_opt,
                 )
             )
 
@@ -261,7 +280,7 @@ cdef class QobjEvo:
         return repr_str
 
     def _read_element(self, op, copy, tlist, args, order, function_style,
-                      boundary_conditions):
+                      boundary_conditions, compile_opt=None):
         """ Read a Q_object item and return an element for that item. """
         if isinstance(op, Qobj):
             out = _ConstantElement(op.copy() if copy else op)
@@ -270,7 +289,8 @@ cdef class QobjEvo:
             out = _EvoElement(
                 op[0].copy() if copy else op[0],
                 coefficient(op[1], tlist=tlist, args=args, order=order,
-                            boundary_conditions=boundary_conditions)
+                            boundary_conditions=boundary_conditions,
+                            compile_opt=compile_opt)
             )
             qobj = op[0]
         elif isinstance(op, _BaseElement):
@@ -824,7 +844,11 @@ cdef class QobjEvo:
                 qobjs.append(element.qobj(0))
                 coeffs.append(element._coefficient)
         for qobj, coeff in zip(qobjs, coeffs):
-            cleaned_elements.append(_EvoElement(qobj, coeff))
+            coeff = coeff.optimize()
+            if isinstance(coeff, ConstantCoefficient):
+                cleaned_elements.append(_ConstantElement(coeff(0) * qobj))
+            else:
+                cleaned_elements.append(_EvoElement(qobj, coeff))
         return cleaned_elements
 
     def compress(self):
@@ -834,6 +858,8 @@ cdef class QobjEvo:
         Constant parts, (:obj:`.Qobj` without :obj:`Coefficient`) will be
         summed.
         Pairs ``[Qobj, Coefficient]`` with the same :obj:`.Qobj` are merged.
+        Coefficients are simplified with :meth:`.Coefficient.optimize`, pairs
+        whose coefficient is constant become constant parts.
 
         Example:
         ``[[sigmax(), f1], [sigmax(), f2]] -> [[sigmax(), f1+f2]]``
@@ -855,6 +881,16 @@ cdef class QobjEvo:
             else:
                 func_elements.append(element)
 
+        coeff_elements = self._compress_merge_qobj(coeff_elements)
+        cte_elements += [
+            element for element in coeff_elements
+            if type(element) is _ConstantElement
+        ]
+        coeff_elements = [
+            element for element in coeff_elements
+            if type(element) is _EvoElement
+        ]
+
         cleaned_elements = []
         if len(cte_elements) >= 2:
             # Multiple constant parts
@@ -863,7 +899,6 @@ cdef class QobjEvo:
         else:
             cleaned_elements += cte_elements
 
-        coeff_elements = self._compress_merge_qobj(coeff_elements)
         cleaned_elements += coeff_elements + func_elements
 
         self.elements = cleaned_elements
@@ -897,6 +932,63 @@ cdef class QobjEvo:
                 out.append([element, {}])
         return out
 
+    def _map_coefficients(QobjEvo self, f, keep_constant):
+        """
+        Return a copy with ``f`` applied to each coefficient. Constant parts
+        are kept if ``keep_constant``, dropped otherwise.
+        """
+        cdef QobjEvo res = self.copy()
+        elements = []
+        for element in self.elements:
+            if isinstance(element, _ConstantElement):
+                if keep_constant:
+                    elements.append(element)
+            elif isinstance(element, _EvoElement):
+                elements.append(_EvoElement(
+                    element.qobj(0), f(element._coefficient)
+                ))
+            else:
+                raise NotImplementedError(
+                    "Only supported for QobjEvo built from the list format "
+                    "with Coefficient."
+                )
+        if not elements:
+            elements = [_ConstantElement(self(0) * 0)]
+        res.elements = elements
+        return res
+
+    def derivative(QobjEvo self, arg=None):
+        """
+        Return the :obj:`.QobjEvo` of the derivative of this operator with
+        respect to time, or to the argument ``arg`` if given.
+
+        Only available for :obj:`.QobjEvo` in list format, whose coefficients
+        support :meth:`.Coefficient.derivative`.
+
+        Parameters
+        ----------
+        arg : str, optional
+            Name of the argument, in ``args``, with respect to which to take
+            the derivative. The time derivative is returned by default.
+
+        Returns
+        -------
+        :obj:`.QobjEvo`
+            The derivative.
+        """
+        return self._map_coefficients(
+            lambda coeff: coeff.derivative(arg), False
+        )
+
+    def _time_reversed(QobjEvo self, double t_end):
+        """
+        Return the operator evaluated backward from ``t_end``:
+        ``out(t) = self(t_end - t)``.
+        """
+        return self._map_coefficients(
+            lambda coeff: _ReversedCoefficient(coeff, t_end), True
+        )
+
     ###########################################################################
     # properties                                                              #
     ###########################################################################
@@ -7,21 +7,26 @@
 # make unnecessary extra allocations, or calculate extra factors.
 
 from libc.math cimport sqrt
+import numpy as np
+import scipy.sparse
 
 cdef extern from "<complex>" namespace "std" nogil:
     double complex conj(double complex x)
 
 from qutip.core.data.base cimport idxint, Data
+from qutip.core.data.base import idxint_dtype
 from qutip.core.data cimport csr, CSR, Dense, Dia
 from .inner import inner
 from .trace import trace, trace_oper_ket
 from .matmul import matmul
+from .convert import to as _to
 
 __all__ = [
     'expect', 'expect_csr', 'expect_dense', 'expect_dia', 'expect_data',
     'expect_csr_dense', 'expect_dia_dense',
     'expect_super', 'expect_super_csr', 'expect_super_dia', 'expect_super_dense',
     'expect_super_csr_dense', 'expect_super_dia_dense', 'expect_super_data',
+    'ExpectMany', 'expect_many',
 ]
 
 cdef int _check_shape_ket(Data op, Data state) except -1 nogil:
@@ -465,3 +470,180 @@ cdef double complex expect_super_data_dense(Data op, Dense state) except *:
     else:
         out = expect_super(op, state)
     return out
+
+
+cdef class ExpectMany:
+    """
+    Operators prepared to compute all their expectation values over a state
+    in a single pass over the state.
+
+    The operators are stacked in one CSR-like structure where each entry
+    remembers the operator it belongs to. If all the operators are diagonal,
+    only their diagonals are kept and the expectation values are obtained
+    from one product with the populations of the state, ``|psi|**2`` or the
+    diagonal of the density matrix.
+
+    Parameters
+    ----------
+    ops : list of :obj:`.Data`
+        Square operators of the same shape.
+
+    Attributes
+    ----------
+    diagonal : bool
+        Whether all the operators are diagonal.
+    """
+    cdef readonly bint diagonal
+    cdef readonly object shape
+    cdef Py_ssize_t n_ops
+    cdef object ops
+    cdef object diagonals
+    cdef idxint[::1] row_index
+    cdef idxint[::1] col_index
+    cdef idxint[::1] op_index
+    cdef double complex[::1] values
+
+    def __init__(self, ops):
+        if not ops:
+            raise ValueError("No operators")
+        self.shape = ops[0].shape
+        if self.shape[0] != self.shape[1]:
+            raise ValueError("The operators must be square")
+        self.n_ops = len(ops)
+        self.ops = list(ops)
+        rows, cols, values, op_index = [], [], [], []
+        for i, op in enumerate(ops):
+            if op.shape != self.shape:
+                raise ValueError("The operators must have the same shape")
+            if isinstance(op, Dense):
+                coo = scipy.sparse.coo_matrix(op.as_ndarray())
+            else:
+                coo = op.as_scipy().tocoo()
+            rows.append(coo.row)
+            cols.append(coo.col)
+            values.append(coo.data)
+            op_index.append(np.full(coo.nnz, i))
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        values = np.concatenate(values).astype(np.complex128)
+        op_index = np.concatenate(op_index)
+        self.diagonal = bool(np.all(rows == cols))
+        if self.diagonal:
+            self.diagonals = np.zeros((self.n_ops, self.shape[0]), complex)
+            np.add.at(self.diagonals, (op_index, rows), values)
+            return
+        order = np.lexsort((cols, rows))
+        self.row_index = np.concatenate([
+            [0], np.cumsum(np.bincount(rows, minlength=self.shape[0]))
+        ]).astype(idxint_dtype)
+        self.col_index = cols[order].astype(idxint_dtype)
+        self.op_index = op_index[order].astype(idxint_dtype)
+        self.values = values[order]
+
+    def __reduce__(self):
+        return (ExpectMany, (self.ops,))
+
+    cdef void _ket(self, double complex[:] psi, double complex[::1] out) nogil:
+        cdef idxint row, ptr
+        cdef double complex cpsi
+        for row in range(self.row_index.shape[0] - 1):
+            cpsi = conj(psi[row])
+            if cpsi == 0:
+                continue
+            for ptr in range(self.row_index[row], self.row_index[row + 1]):
+                out[self.op_index[ptr]] += (
+                    cpsi * self.values[ptr] * psi[self.col_index[ptr]]
+                )
+
+    cdef void _dm(
+        self, double complex[:, :] rho, double complex[::1] out
+    ) nogil:
+        cdef idxint row, ptr
+        for row in range(self.row_index.shape[0] - 1):
+            for ptr in range(self.row_index[row], self.row_index[row + 1]):
+                out[self.op_index[ptr]] += (
+                    self.values[ptr] * rho[self.col_index[ptr], row]
+                )
+
+    cdef void _dm_csr(self, CSR rho, double complex[::1] out) nogil:
+        # Walk the non-zero entries ``rho[col, row]`` of the state and find
+        # the entries ``(row, col)`` of the operators, sorted by column within
+        # each row, with a binary search.
+        cdef idxint row, col, ptr, lo, hi, mid
+        cdef double complex value
+        for col in range(rho.shape[0]):
+            for ptr in range(rho.row_index[col], rho.row_index[col + 1]):
+                row = rho.col_index[ptr]
+                value = rho.data[ptr]
+                lo = self.row_index[row]
+                hi = self.row_index[row + 1]
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if self.col_index[mid] < col:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                hi = self.row_index[row + 1]
+                while lo < hi and self.col_index[lo] == col:
+                    out[self.op_index[lo]] += self.values[lo] * value
+                    lo += 1
+
+    def populations(self, Data state):
+        """
+        Return the populations of the ``state``: ``|psi|**2`` for a ket or
+        the diagonal of a density matrix. Sparse density matrices are not
+        converted to dense.
+        """
+        if state.shape[1] == 1:
+            if isinstance(state, Dense):
+                psi = state.as_ndarray()[:, 0]
+            else:
+                psi = state.to_array()[:, 0]
+            return psi.real**2 + psi.imag**2
+        if isinstance(state, Dense):
+            return np.diagonal(state.as_ndarray())
+        if isinstance(state, (CSR, Dia)):
+            return state.as_scipy().diagonal()
+        return np.diagonal(state.to_array())
+
+    def __call__(self, Data state):
+        """
+        Return the array of the expectation values of the operators over the
+        ``state``, a ket or a density matrix.
+        """
+        if state.shape[1] == 1:
+            if state.shape[0] != self.shape[1]:
+                raise ValueError("incorrect input shapes " + str(self.shape)
+                                 + " and " + str(state.shape))
+        elif state.shape != self.shape:
+            raise ValueError("incorrect input shapes " + str(self.shape)
+                             + " and " + str(state.shape))
+        if self.diagonal:
+            return self.diagonals @ self.populations(state)
+        out = np.zeros(self.n_ops, dtype=np.complex128)
+        if isinstance(state, Dense):
+            array = state.as_ndarray()
+        elif state.shape[1] == 1:
+            # A ket has the size of a single column: densifying it is cheap.
+            array = state.to_array()
+        else:
+            # Sparse density matrices stay sparse.
+            self._dm_csr(_to(CSR, state), out)
+            return out
+        if state.shape[1] == 1:
+            self._ket(array[:, 0], out)
+        else:
+            self._dm(array, out)
+        return out
+
+
+def expect_many(ops, Data state):
+    """
+    Get the expectation values of all the operators in ``ops`` over the state
+    ``state``, a ket or a density matrix, in a single pass over the state.
+    Returns an array of complex numbers.
+
+    To compute the expectation values of the same operators over many states,
+    create an :obj:`ExpectMany` once and call it with each state.
+    """
+    return ExpectMany(ops)(state)
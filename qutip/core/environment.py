@@ -364,7 +364,9 @@ class BosonicEnvironment(abc.ABC):
         else:
             wMax = max(np.abs(w[0]), np.abs(w[-1]))
 
-        mirrored_result = _fft(self.correlation_function, wMax, tMax=tMax)
+        mirrored_result = self._cached_fft(
+            ("ps", tMax), self.correlation_function, wMax, tMax
+        )
         result = np.real(mirrored_result(-w))
         return result.item() if w.ndim == 0 else result
 
@@ -377,11 +379,29 @@ class BosonicEnvironment(abc.ABC):
         else:
             tMax = max(np.abs(t[0]), np.abs(t[-1]))
 
-        result_fct = _fft(lambda w: self.power_spectrum(w, **ps_kwargs),
-                          tMax, tMax=wMax)
+        result_fct = self._cached_fft(
+            ("cf", wMax, *sorted(ps_kwargs.items())),
+            lambda w: self.power_spectrum(w, **ps_kwargs), tMax, wMax
+        )
         result = result_fct(t) / (2 * np.pi)
         return result.item() if t.ndim == 0 else result
 
+    def _cached_fft(self, key, f, wMax, tMax):
+        """
+        Return ``_fft(f, wMax, tMax)``, reusing the transform computed by a
+        previous call with the same ``key`` if it covers frequencies up to
+        ``wMax``. A new transform covers at least twice the range of the
+        previous one, so that growing ranges need few transforms. The cache is
+        kept with the environment, and pickled with it.
+        """
+        cache = self.__dict__.setdefault("_fft_cache", {})
+        if key in cache and cache[key][0] >= wMax:
+            return cache[key][1]
+        if key in cache:
+            wMax = max(wMax, 2 * cache[key][0])
+        cache[key] = (wMax, _fft(f, wMax, tMax))
+        return cache[key][1]
+
     # --- fitting
 
     def approx_by_cf_fit(
@@ -403,7 +423,8 @@ class BosonicEnvironment(abc.ABC):
         Generates an approximation to this environment by fitting its
         correlation function with a multi-exponential ansatz. The number of
         exponents is determined iteratively based on reducing the normalized
-        root mean squared error below a given threshold.
+        root mean squared error below a given threshold. Each fit starts from
+        the parameters found with one exponent fewer.
 
         Specifically, the real and imaginary parts are fit by the following
         model functions:
@@ -562,7 +583,7 @@ class BosonicEnvironment(abc.ABC):
         rmse_real, params_real = iterated_fit(
             _cf_real_fit_model, num_params, tlist, np.real(clist), target_rsme,
             Nr_min, Nr_max, guess=guess_re, lower=lower_re, upper=upper_re,
-            sigma=sigma, maxfev=maxfev
+            sigma=sigma, maxfev=maxfev, jac=_cf_real_fit_jac, warm_start=True
         )
         end_real = time()
         fit_time_real = end_real - start_real
@@ -572,7 +593,7 @@ class BosonicEnvironment(abc.ABC):
         rmse_imag, params_imag = iterated_fit(
             _cf_imag_fit_model, num_params, tlist, np.imag(clist), target_rsme,
             Ni_min, Ni_max, guess=guess_im, lower=lower_im, upper=upper_im,
-            sigma=sigma, maxfev=maxfev
+            sigma=sigma, maxfev=maxfev, jac=_cf_imag_fit_jac, warm_start=True
         )
         end_imag = time()
         fit_time_imag = end_imag - start_imag
@@ -638,7 +659,8 @@ class BosonicEnvironment(abc.ABC):
         exponential decomposition of the underdamped environment, keeping `Nk`
         Matsubara terms for each. The number of underdamped terms is determined
         iteratively based on reducing the normalized root mean squared error
-        below a given threshold.
+        below a given threshold. Each fit starts from the parameters found
+        with one underdamped term fewer.
 
         Specifically, the spectral density is fit by the following model
         function:
@@ -735,7 +757,8 @@ class BosonicEnvironment(abc.ABC):
         start = time()
         rmse, params = iterated_fit(
             _sd_fit_model, 3, wlist, jlist, target_rmse, Nmin, Nmax,
-            guess=guess, lower=lower, upper=upper, sigma=sigma, maxfev=maxfev
+            guess=guess, lower=lower, upper=upper, sigma=sigma, maxfev=maxfev,
+            jac=_sd_fit_jac, warm_start=True
         )
         end = time()
         fit_time = end - start
@@ -767,6 +790,124 @@ class BosonicEnvironment(abc.ABC):
             ckAR, vkAR, ckAI, vkAI, combine=combine, T=self.T, tag=tag)
         return approx_env, fit_info
 
+    def approx_by_esprit(
+        self,
+        tlist: ArrayLike,
+        target_rmse: float = 2e-5,
+        Nr_max: int = 10,
+        Ni_max: int = 10,
+        combine: bool = True,
+        tag: Any = None,
+    ) -> tuple[ExponentialBosonicEnvironment, dict[str, Any]]:
+        r"""
+        Generates an approximation to this environment by decomposing its
+        correlation function into exponentials with the ESPRIT method.
+
+        The real and imaginary parts of the correlation function are sampled
+        on the evenly spaced `tlist`. For each part, the frequencies of the
+        exponents are found from the dominant singular vectors of the Hankel
+        matrix of the samples and the coefficients by linear least squares.
+        Unlike :meth:`approx_by_cf_fit`, this requires no initial guesses or
+        bounds, the result is deterministic and only uses linear algebra.
+        The number of exponents is the smallest one for which the
+        normalized root mean squared error is below the given threshold.
+
+        Parameters
+        ----------
+        tlist : array_like
+            The evenly spaced times at which the correlation function is
+            sampled. It should extend until the correlation function has
+            decayed.
+        target_rmse : optional, float
+            Desired normalized root mean squared error (default `2e-5`). Can be
+            set to `None` to use the maximum number of exponents (`Nr_max`,
+            `Ni_max`).
+        Nr_max : optional, int
+            The maximum number of exponents to use for the real part
+            (default 10).
+        Ni_max : optional, int
+            The maximum number of exponents to use for the imaginary part
+            (default 10).
+        combine : optional, bool (default True)
+            Whether to combine exponents with the same frequency. See
+            :meth:`combine <.ExponentialBosonicEnvironment.combine>` for
+            details.
+        tag : optional, str, tuple or any other object
+            An identifier (name) for the approximated environment. If not
+            provided, a tag will be generated from the tag of this environment.
+
+        Returns
+        -------
+        approx_env : :class:`ExponentialBosonicEnvironment`
+            The approximated environment with multi-exponential correlation
+            function.
+        fit_info : dictionary
+            A dictionary containing the following information about the
+            decomposition.
+
+            "Nr"
+                The number of exponents used for the real part of the
+                correlation function.
+            "Ni"
+                The number of exponents used for the imaginary part of the
+                correlation function.
+            "fit_time"
+                The time the decomposition took in seconds.
+            "rmse_real"
+                Normalized mean squared error obtained for the real part of
+                the correlation function.
+            "rmse_imag"
+                Normalized mean squared error obtained for the imaginary part
+                of the correlation function.
+            "summary"
+                A string that summarizes the information about the
+                decomposition.
+        """
+        if tag is None and self.tag is not None:
+            tag = (self.tag, "ESPRIT")
+        if target_rmse is None:
+            target_rmse = 0
+
+        tlist = np.asarray(tlist, dtype=float)
+        dt = np.diff(tlist)
+        if len(tlist) < 3 or not np.allclose(dt, dt[0]):
+            raise ValueError(
+                "The times for the ESPRIT decomposition must be evenly spaced"
+                " and at least 3."
+            )
+
+        start = time()
+        clist = self.correlation_function(tlist)
+        if not np.all(np.isfinite(clist)):
+            raise ValueError(
+                "The correlation function is not finite at the given times."
+            )
+        ckAR, vkAR, rmse_real = _esprit(
+            tlist, np.real(clist), Nr_max, target_rmse
+        )
+        ckAI, vkAI, rmse_imag = _esprit(
+            tlist, np.imag(clist), Ni_max, target_rmse
+        )
+        fit_time = time() - start
+
+        Nr, Ni = len(ckAR), len(ckAI)
+        summary = (
+            f"ESPRIT decomposition of the correlation function with {Nr}"
+            f" exponents for the real part and {Ni} for the imaginary part.\n"
+            f"Normalized RMSE of {rmse_real: .2e} for the real part and"
+            f" {rmse_imag: .2e} for the imaginary part.\n"
+            f"The decomposition took {fit_time: 2f} seconds."
+        )
+        fit_info = {
+            "Nr": Nr, "Ni": Ni, "fit_time": fit_time,
+            "rmse_real": rmse_real, "rmse_imag": rmse_imag,
+            "summary": summary,
+        }
+
+        approx_env = ExponentialBosonicEnvironment(
+            ckAR, vkAR, ckAI, vkAI, combine=combine, T=self.T, tag=tag)
+        return approx_env, fit_info
+
 
 class _BosonicEnvironment_fromCF(BosonicEnvironment):
     def __init__(self, C, tlist, tMax, T, tag, args):
@@ -1871,10 +2012,30 @@ def system_terminator(Q: Qobj, delta: float) -> Qobj:
 
 # --- utility functions ---
 
+class _FunctionWithArgs:
+    # Picklable equivalent of ``lambda x: fun(x, **args)``.
+    def __init__(self, fun, args):
+        self.fun = fun
+        self.args = args
+
+    def __call__(self, x):
+        return self.fun(x, **self.args)
+
+
+class _ComplexSpline:
+    # Cubic spline interpolation of complex values.
+    def __init__(self, xlist, ylist):
+        self.real = CubicSpline(xlist, np.real(ylist))
+        self.imag = CubicSpline(xlist, np.imag(ylist))
+
+    def __call__(self, x):
+        return self.real(x) + 1j * self.imag(x)
+
+
 def _real_interpolation(fun, xlist, name, args=None):
     args = args or {}
     if callable(fun):
-        return lambda w: fun(w, **args)
+        return _FunctionWithArgs(fun, args)
     else:
         if xlist is None or len(xlist) != len(fun):
             raise ValueError("A list of x-values with the same length must be "
@@ -1885,11 +2046,12 @@ def _real_interpolation(fun, xlist, name, args=None):
 def _complex_interpolation(fun, xlist, name, args=None):
     args = args or {}
     if callable(fun):
-        return lambda t: fun(t, **args)
+        return _FunctionWithArgs(fun, args)
     else:
-        real_interp = _real_interpolation(np.real(fun), xlist, name)
-        imag_interp = _real_interpolation(np.imag(fun), xlist, name)
-        return lambda x: real_interp(x) + 1j * imag_interp(x)
+        if xlist is None or len(xlist) != len(fun):
+            raise ValueError("A list of x-values with the same length must be "
+                             f"provided for the discretized function ({name})")
+        return _ComplexSpline(xlist, fun)
 
 
 def _fft(f, wMax, tMax):
@@ -1946,12 +2108,42 @@ def _cf_real_fit_model(tlist, a, b, c, d=0):
     return np.real((a + 1j * d) * np.exp((b + 1j * c) * np.abs(tlist)))
 
 
+def _cf_real_fit_jac(tlist, a, b, c, d=None):
+    # Derivatives of _cf_real_fit_model with respect to a, b, c (and d)
+    abs_t = np.abs(tlist)
+    decay = np.exp(b * abs_t)
+    cos, sin = np.cos(c * abs_t), np.sin(c * abs_t)
+    if d is None:
+        model = a * decay * cos
+        return [decay * cos, abs_t * model, -abs_t * decay * a * sin]
+    model = decay * (a * cos - d * sin)
+    return [
+        decay * cos, abs_t * model,
+        -abs_t * decay * (a * sin + d * cos), -decay * sin,
+    ]
+
+
 def _cf_imag_fit_model(tlist, a, b, c, d=0):
     return np.sign(tlist) * np.imag(
         (a + 1j * d) * np.exp((b + 1j * c) * np.abs(tlist))
     )
 
 
+def _cf_imag_fit_jac(tlist, a, b, c, d=None):
+    # Derivatives of _cf_imag_fit_model with respect to a, b, c (and d)
+    abs_t = np.abs(tlist)
+    decay = np.sign(tlist) * np.exp(b * abs_t)
+    cos, sin = np.cos(c * abs_t), np.sin(c * abs_t)
+    if d is None:
+        model = a * decay * sin
+        return [decay * sin, abs_t * model, abs_t * decay * a * cos]
+    model = decay * (a * sin + d * cos)
+    return [
+        decay * sin, abs_t * model,
+        abs_t * decay * (a * cos - d * sin), decay * cos,
+    ]
+
+
 def _default_guess_cfreal(tlist, clist, full_ansatz):
     corr_abs = np.abs(clist)
     corr_max = np.max(corr_abs)
@@ -2001,6 +2193,51 @@ def _sd_fit_model(wlist, a, b, c):
     )
 
 
+def _sd_fit_jac(wlist, a, b, c):
+    # Derivatives of _sd_fit_model with respect to a, b and c
+    plus = (wlist + c)**2 + b**2
+    minus = (wlist - c)**2 + b**2
+    d_a = 2 * b * wlist / plus / minus
+    model = a * d_a
+    return [
+        d_a,
+        2 * a * wlist / plus / minus - model * (2 * b / plus + 2 * b / minus),
+        -model * (2 * (wlist + c) / plus - 2 * (wlist - c) / minus),
+    ]
+
+
+def _esprit(tlist, ylist, Nmax, target_rmse):
+    # ESPRIT decomposition ``y(t) = sum_k ck exp(-vk t)`` of real samples on
+    # the evenly spaced ``tlist``, with the fewest exponents (up to Nmax)
+    # reaching the target normalized rmse.
+    # Returns the lists of ck and vk, and the rmse.
+    span = np.max(ylist) - np.min(ylist)
+    if span == 0 and ylist[0] == 0:
+        return [], [], 0.
+    dt = tlist[1] - tlist[0]
+    n_rows = len(ylist) // 2
+    hankel = np.lib.stride_tricks.sliding_window_view(ylist, n_rows).T
+    U, _, _ = np.linalg.svd(hankel, full_matrices=False)
+    Nmax = min(Nmax, n_rows - 1)
+    steps = np.arange(len(ylist))
+
+    for N in range(1, Nmax + 1):
+        signal = U[:, :N]
+        roots = np.linalg.eigvals(np.linalg.pinv(signal[:-1]) @ signal[1:])
+        vandermonde = roots[None, :] ** steps[:, None]
+        amplitudes = np.linalg.lstsq(vandermonde, ylist, rcond=None)[0]
+        yhat = np.real(vandermonde @ amplitudes)
+        rmse = np.sqrt(np.mean((yhat - ylist) ** 2) / len(ylist))
+        rmse = rmse / span if span else rmse
+        if rmse <= target_rmse:
+            break
+
+    vk = -np.log(roots.astype(complex)) / dt
+    # The samples start at tlist[0] rather than 0.
+    ck = amplitudes * np.exp(vk * tlist[0])
+    return list(ck), list(vk), rmse
+
+
 def _default_guess_sd(wlist, jlist):
     sd_abs = np.abs(jlist)
     sd_max = np.max(sd_abs)
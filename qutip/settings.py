@@ -140,6 +140,7 @@ class Settings:
             self.tmproot = os.path.join(os.path.expanduser("~"), '.qutip')
         except OSError:
             self._tmproot = "."
+        self._coeff_cache = os.environ.get("QUTIP_COEFF_CACHE", None)
         self.core = None  # set in qutip.core.options
         self.compile = None  # set in qutip.core.coefficient
         self._debug = False
@@ -259,6 +260,21 @@ class Settings:
             sys.path.insert(0, root)
         self._coeffroot = root
 
+    @property
+    def coeff_cache(self) -> str | None:
+        """
+        Location of a cache of compiled string coefficients shared between
+        machines, e.g. on a network filesystem, or ``None``. Compiled
+        coefficients are stored in a sub-folder specific to the python,
+        Cython, compiler and QuTiP versions. The cache can be read-only.
+        Defaults to the ``QUTIP_COEFF_CACHE`` environment variable.
+        """
+        return self._coeff_cache
+
+    @coeff_cache.setter
+    def coeff_cache(self, root: str | None) -> None:
+        self._coeff_cache = root
+
     @property
     def coeff_write_ok(self) -> bool:
         """ Whether qutip has write acces to ``qutip.settings.coeffroot``."""
@@ -1,6 +1,7 @@
 from .result import *
 from .multitrajresult import *
 from .options import *
+from .events import *
 import qutip.solver.integrator as integrator
 from .integrator import IntegratorException
 from .sesolve import *
@@ -15,6 +15,7 @@ import inspect
 from time import time
 from .. import Qobj, QobjEvo, coefficient, Coefficient
 from ..core.blochredfield import bloch_redfield_tensor, SpectraCoefficient
+from ..core._brtools import _EigenBasisTransform
 from ..core.cy.coefficient import InterCoefficient
 from ..core import data as _data
 from .solver_base import Solver, _solver_deprecation
@@ -286,9 +287,12 @@ class BRSolver(Solver):
         "progress_kwargs": {"chunk_size": 10},
         "store_final_state": False,
         "store_states": None,
+        "state_storage": None,
         "normalize_output": False,
         'method': 'adams',
         'tensor_type': 'sparse',
+        'eigen_cache': 8,
+        'eigen_tol': 0.,
     }
     _avail_integrators = {}
 
@@ -351,8 +355,14 @@ class BRSolver(Solver):
 
     def _prepare_rhs(self):
         _time_start = time()
+        H, a_ops, c_ops = self._system
+        H_transform = _EigenBasisTransform(
+            H,
+            cache_size=self.options['eigen_cache'],
+            eigen_tol=self.options['eigen_tol'],
+        )
         rhs = bloch_redfield_tensor(
-            *self._system,
+            H_transform, a_ops, c_ops,
             fock_basis=True,
             sec_cutoff=self.sec_cutoff,
             sparse_eigensolver=False,
@@ -370,10 +380,19 @@ class BRSolver(Solver):
             Whether or not to store the final state of the evolution in the
             result class.
 
-        store_states: bool, default: None
+        store_states: bool, int, default: None
             Whether or not to store the state vectors or density matrices.
             On `None` the states will be saved if no expectation operators are
-            given.
+            given. If an integer ``k``, only every ``k``-th state is stored,
+            starting with the initial state.
+
+        state_storage: str, default: None
+            Folder where the stored states are written, in memory-mapped
+            files, as they are produced. The states of the result are then
+            read from the disk when accessed. A file is deleted when its
+            result is garbage collected or when ``result.close()`` is called,
+            but kept once the result is pickled. When ``None``, the states are
+            kept in memory.
 
         normalize_output: bool, default: False
             Normalize output state to hide ODE numerical errors.
@@ -391,6 +410,20 @@ class BRSolver(Solver):
             Which data type to use when computing the brtensor.
             With a cutoff 'sparse' is usually the most efficient.
 
+        eigen_cache: int, default: 8
+            For time-dependent Hamiltonians, number of its
+            eigen-decompositions kept in memory, keyed by time, so they are
+            not recomputed when the integrator comes back to a previous time.
+
+        eigen_tol: float, default: 0.
+            When positive, the eigen-decomposition of a time-dependent
+            Hamiltonian is updated by perturbation from a cached one at a
+            close time instead of being recomputed, when the couplings
+            between its eigenstates are smaller than ``eigen_tol`` times
+            their energy difference. The error on the eigenstates is of the
+            order ``eigen_tol**2``. Useful for smoothly varying Hamiltonians
+            where the diagonalization dominates the computation time.
+
         method: str, default: "adams"
             Which ODE integrator methods are supported.
         """
@@ -402,16 +435,20 @@ class BRSolver(Solver):
 
     def _apply_options(self, keys):
         need_new_rhs = self.rhs is not None and not self.rhs.isconstant
-        need_new_rhs &= 'tensor_type' in keys
+        need_new_rhs &= bool(
+            {'tensor_type', 'eigen_cache', 'eigen_tol'} & set(keys)
+        )
         if need_new_rhs:
             self.rhs = self._prepare_rhs()
 
         if self._integrator is None or not keys:
             pass
-        elif 'method' in keys or need_new_rhs:
+        elif ('method' in keys or need_new_rhs) and self._integrator._is_set:
             state = self._integrator.get_state()
             self._integrator = self._get_integrator()
             self._integrator.set_state(*state)
+        elif 'method' in keys or need_new_rhs:
+            self._integrator = self._get_integrator()
         else:
             self._integrator.options = self._options
             self._integrator.reset(hard=True)
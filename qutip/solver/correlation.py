@@ -446,8 +446,10 @@ def correlation_3op(solver, state0, tlist, taulist, A=None, B=None, C=None):
 
     Parameters
     ----------
-    solver : :class:`.MESolver`, :class:`.BRSolver`
-        Qutip solver for an open system.
+    solver : :class:`.MESolver`, :class:`.BRSolver`, :class:`.HEOMSolver`
+        Qutip solver for an open system. With a :class:`.HEOMSolver`, the
+        operators are applied to every ADO of the hierarchy, which is then
+        propagated as a whole.
     state0 : :obj:`.Qobj`
         Initial state density matrix :math:`\rho(t_0)` or state vector
         :math:`\psi(t_0)`.
@@ -484,8 +486,7 @@ def correlation_3op(solver, state0, tlist, taulist, A=None, B=None, C=None):
         raise TypeError("Monte Carlo support for correlation was removed. "
                         "Please, tell us on GitHub issues if you need it!")
     elif isinstance(solver, HEOMSolver):
-        raise TypeError("HEOM is not supported by correlation. "
-                        "Please, tell us on GitHub issues if you need it!")
+        out = _correlation_3op_heom(solver, state0, tlist, taulist, A, B, C)
     else:
         raise TypeError("Only solvers able to evolve density matrices"
                         " are supported.")
@@ -522,3 +523,39 @@ def _correlation_3op_dm(solver, state0, tlist, taulist, A, B, C):
         solver.options = old_opt
 
     return corr_mat
+
+
+def _correlation_3op_heom(solver, state0, tlist, taulist, A, B, C):
+    old_opt = solver.options.copy()
+    try:
+        solver.options["normalize_output"] = False
+        solver.options["progress_bar"] = False
+
+        progress_bar = progress_bars[old_opt['progress_bar']](
+            np.size(tlist) + 1, **old_opt['progress_kwargs']
+        )
+        solver.options["store_states"] = True
+        solver.options["store_ados"] = True
+        ado_t = solver.run(state0, tlist).ado_states
+        solver.options["store_states"] = False
+        solver.options["store_ados"] = False
+        corr_mat = np.zeros([np.size(tlist), np.size(taulist)], dtype=complex)
+        progress_bar.update()
+
+        for t_idx, ado_state in enumerate(ado_t):
+            t = tlist[t_idx]
+            # The ADOs are stored transposed: C @ rho @ A becomes
+            # A.T @ rho.T @ C.T, applied to all the ADOs at once.
+            ados = (
+                A(t).full().T @ ado_state._ado_state @ C(t).full().T
+            )
+            corr_mat[t_idx, :] = solver.run(
+                ados, taulist + t, e_ops=B
+            ).expect[0]
+            progress_bar.update()
+        progress_bar.finished()
+
+    finally:
+        solver.options = old_opt
+
+    return corr_mat
@@ -0,0 +1,131 @@
+""" Conditions monitored during an evolution. """
+
+# Required for Sphinx to follow autodoc_type_aliases
+from __future__ import annotations
+
+__all__ = ["Event"]
+
+from typing import Callable
+from ..core import Qobj, QobjEvo, expect
+
+
+class Event:
+    """
+    Condition monitored during the evolution of a :class:`.Solver`.
+
+    An event occurs each time the monitored quantity crosses ``value``. The
+    time of the crossing is located using the dense output of the ODE
+    integrator and recorded in the ``events`` attribute of the result. A
+    terminal event stops the evolution at the time it occurs.
+
+    Parameters
+    ----------
+    condition : :obj:`.Qobj`, :obj:`.QobjEvo`, callable
+        Quantity to monitor. If an operator is given, the real part of its
+        expectation value is used. Otherwise it must be a function with
+        signature ``f(t: float, state: Qobj) -> float``.
+
+    value : float, default: 0.
+        Value at which the event occurs.
+
+    direction : {-1, 0, 1}, default: 0
+        If ``1``, only crossings where the monitored quantity is increasing
+        are events. If ``-1``, only decreasing ones. If ``0``, both.
+
+    terminal : bool, default: False
+        Whether to stop the evolution at the first occurrence of the event.
+
+    t_tol : float, default: 1e-8
+        Tolerance on the time of the event.
+
+    Examples
+    --------
+    Stop the evolution once the mean photon number drops below ``0.01``::
+
+        Event(num(N), 0.01, direction=-1, terminal=True)
+    """
+
+    # Maximum number of dense output evaluations used to locate an event.
+    _max_iter = 100
+
+    def __init__(
+        self,
+        condition: Qobj | QobjEvo | Callable[[float, Qobj], float],
+        value: float = 0.,
+        *,
+        direction: int = 0,
+        terminal: bool = False,
+        t_tol: float = 1e-8,
+    ):
+        if isinstance(condition, Qobj):
+            self._func = lambda t, state: expect(condition, state).real
+        elif isinstance(condition, QobjEvo):
+            self._func = lambda t, state: condition.expect(t, state).real
+        elif callable(condition):
+            self._func = condition
+        else:
+            raise TypeError(
+                f"{condition!r} has unsupported type {type(condition)!r}."
+            )
+        if direction not in [-1, 0, 1]:
+            raise ValueError("direction must be one of -1, 0 or 1.")
+        self.condition = condition
+        self.value = value
+        self.direction = direction
+        self.terminal = terminal
+        self.t_tol = t_tol
+
+    def __call__(self, t: float, state: Qobj) -> float:
+        """
+        Return the distance of the monitored quantity to ``value``. The event
+        occurs when it changes sign.
+        """
+        return self._func(t, state) - self.value
+
+    def crossed(self, g_old: float, g_new: float) -> bool:
+        """
+        Whether an event occurred between two values returned by
+        :meth:`__call__`.
+        """
+        if g_old < 0 <= g_new:
+            return self.direction != -1
+        if g_old > 0 >= g_new:
+            return self.direction != 1
+        return False
+
+    def _locate(self, evaluate, t_old, g_old, t_new, g_new):
+        """
+        Find the time of the event between ``t_old`` and ``t_new`` using the
+        Illinois variant of the regula falsi.
+
+        ``evaluate(t)`` must return the value of :meth:`__call__` at time
+        ``t``, usually from the dense output of the integrator. The returned
+        time is after the crossing, within ``t_tol`` of it.
+        """
+        side = 0
+        for _ in range(self._max_iter):
+            if t_new - t_old <= self.t_tol:
+                break
+            t_guess = (t_old * g_new - t_new * g_old) / (g_new - g_old)
+            # Keep the guess inside the bracket, away from its ends.
+            t_guess = min(
+                max(t_guess, t_old + self.t_tol / 2), t_new - self.t_tol / 2
+            )
+            g_guess = evaluate(t_guess)
+            if g_guess != 0 and (g_guess > 0) == (g_old > 0):
+                t_old, g_old = t_guess, g_guess
+                if side == -1:
+                    g_new /= 2
+                side = -1
+            else:
+                t_new, g_new = t_guess, g_guess
+                if side == 1:
+                    g_old /= 2
+                side = 1
+        return t_new
+
+    def __repr__(self):
+        return (
+            f"Event({self.condition!r}, {self.value!r}, "
+            f"direction={self.direction}, terminal={self.terminal})"
+        )
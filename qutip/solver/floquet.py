@@ -623,6 +623,7 @@ def fsesolve(
     result_options = {
         "store_final_state": False,
         "store_states": None,
+        "state_storage": None,
         "normalize_output": True,
     }
     result_options.update(options or {})
@@ -865,6 +866,7 @@ class FMESolver(MESolver):
         "progress_kwargs": {"chunk_size": 10},
         "store_final_state": False,
         "store_states": None,
+        "state_storage": None,
         "normalize_output": True,
         "method": "adams",
         "store_floquet_states": False,
@@ -1061,6 +1063,78 @@ class FMESolver(MESolver):
         # stats.update(_integrator.stats)
         return results
 
+    def run_iter(
+        self,
+        state0: Qobj,
+        tlist: ArrayLike,
+        *,
+        floquet: bool = False,
+        args: dict[str, Any] = None,
+        e_ops: EopsLike | list[EopsLike] | dict[Any, EopsLike] = None,
+    ):
+        """
+        Do the evolution of the quantum system, yielding the output at each
+        time of ``tlist`` as soon as it is reached. See
+        :meth:`.Solver.run_iter`.
+
+        Parameters
+        ----------
+        state0 : :obj:`.Qobj`
+            Initial state of the evolution.
+
+        tlist : list of double
+            Times at which to yield the output. The first element of the list
+            is the initial time of the evolution.
+
+        floquet : bool, optional {False}
+            Whether the initial state in the floquet basis or laboratory basis.
+
+        args : dict, optional
+            Not supported
+
+        e_ops : list or dict, optional
+            List or dict of Qobj, QobjEvo or callable to compute the
+            expectation values. Function[s] must have the signature
+            ``f(t : float, state : Qobj) -> expect``.
+
+        Yields
+        ------
+        t : float
+            Time of the output.
+
+        state_or_expect : :obj:`.Qobj`, value, list or dict
+            The state at ``t`` in the laboratory basis if no ``e_ops`` are
+            given, the expectation values otherwise.
+        """
+        if args:
+            raise ValueError("FMESolver cannot update arguments")
+        if not floquet:
+            state0 = self.floquet_basis.to_floquet_basis(state0, tlist[0])
+        return super().run_iter(state0, tlist, e_ops=e_ops)
+
+    def _streaming_result(self, e_ops):
+        options = {
+            **self.options,
+            "store_states": None,
+            "store_final_state": False,
+            "state_storage": None,
+            "store_floquet_states": False,
+        }
+        return self._resultclass(
+            e_ops, options, solver=self.name, floquet_basis=self.floquet_basis
+        )
+
+    def gradient(self, *args, **kwargs):
+        """
+        Gradient of an expectation value with respect to the args.
+
+        Not implemented for FMESolver: the Floquet basis used by the solver
+        also depends on the args.
+        """
+        raise NotImplementedError(
+            "Gradients are not implemented for floquet solver."
+        )
+
     @classmethod
     def ExpectFeedback(cls):
         """
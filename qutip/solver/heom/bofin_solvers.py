@@ -13,7 +13,9 @@ implementation in QuTiP itself.
 from time import time
 
 import numpy as np
+import scipy.linalg
 import scipy.sparse as sp
+import scipy.sparse.linalg as splinalg
 from scipy.sparse.linalg import spsolve
 
 from qutip.settings import settings
@@ -77,6 +79,15 @@ class HierarchyADOs:
         The maximum depth of the hierarchy (i.e. the maximum sum of
         "excitations" in the hierarchy ADO labels or maximum ADO level).
 
+    threshold : float, optional
+        If given, ADOs whose estimated importance is below ``threshold`` are
+        dropped from the hierarchy. The importance of an ADO is estimated as
+        the product over the exponents of ``|ck / vk| ** n_k``, where
+        ``n_k`` is the number of excitations of the ``k``-th exponent in its
+        label (``|ck| + |ck2|`` is used for exponents of type "RI"). ADOs
+        whose previous labels were dropped are also dropped, so that the
+        remaining hierarchy stays connected to the system density matrix.
+
     Attributes
     ----------
     exponents : list of :class:`.BathExponent`
@@ -87,6 +98,10 @@ class HierarchyADOs:
         The maximum depth of the hierarchy (i.e. the maximum sum of
         "excitations" in the hierarchy ADO labels).
 
+    threshold : float or None
+        The threshold on the estimated importance of the ADOs kept in the
+        hierarchy, if any.
+
     dims : list of int
         The dimensions of each exponent within the bath(s).
 
@@ -109,9 +124,10 @@ class HierarchyADOs:
         A list of the ADO labels within the hierarchy.
     """
 
-    def __init__(self, exponents, max_depth):
+    def __init__(self, exponents, max_depth, threshold=None):
         self.exponents = exponents
         self.max_depth = max_depth
+        self.threshold = threshold
 
         self.dims = [exp.dim or (max_depth + 1) for exp in self.exponents]
         self.vk = [exp.vk for exp in self.exponents]
@@ -122,6 +138,8 @@ class HierarchyADOs:
         ]
 
         self.labels = list(state_number_enumerate(self.dims, max_depth))
+        if threshold is not None:
+            self.labels = self._filter_labels(self.labels, threshold)
         self._label_idx = {s: i for i, s in enumerate(self.labels)}
         self.idx = self._label_idx.__getitem__
 
@@ -149,11 +167,38 @@ class HierarchyADOs:
         """
         return self._label_idx[label]
 
+    def _filter_labels(self, labels, threshold):
+        """
+        Return the labels whose estimated importance is above ``threshold``
+        and whose previous labels are all kept, in the original order.
+        """
+        weights = []
+        for exp in self.exponents:
+            ck = abs(exp.ck) + (abs(exp.ck2) if exp.ck2 is not None else 0)
+            weights.append(ck / abs(exp.vk) if exp.vk != 0 else np.inf)
+        weights = np.array(weights)
+        importance = np.prod(
+            weights ** np.array(labels).reshape(len(labels), len(weights)),
+            axis=1,
+        )
+        kept = set()
+        for i in np.argsort([sum(label) for label in labels], kind="stable"):
+            label = labels[i]
+            if any(label) and not importance[i] >= threshold:
+                continue
+            if all(
+                label[:k] + (label[k] - 1,) + label[k + 1:] in kept
+                for k in range(len(label)) if label[k]
+            ):
+                kept.add(label)
+        return [label for label in labels if label in kept]
+
     def next(self, label, k):
         """
         Return the ADO label with one more excitation in the k'th exponent
         dimension or ``None`` if adding the excitation would exceed the
-        dimension or maximum depth of the hierarchy.
+        dimension or maximum depth of the hierarchy, or if the label was
+        dropped from the hierarchy by the ``threshold``.
 
         Parameters
         ----------
@@ -171,7 +216,10 @@ class HierarchyADOs:
             return None
         if sum(label) >= self.max_depth:
             return None
-        return label[:k] + (label[k] + 1,) + label[k + 1:]
+        label = label[:k] + (label[k] + 1,) + label[k + 1:]
+        if self.threshold is not None and label not in self._label_idx:
+            return None
+        return label
 
     def prev(self, label, k):
         """
@@ -195,6 +243,49 @@ class HierarchyADOs:
             return None
         return label[:k] + (label[k] - 1,) + label[k + 1:]
 
+    def _neighbours(self):
+        """
+        Return the labels as an integer array of shape
+        ``(n_ados, n_exponents)`` and the tables, of the same shape, of the
+        indices of the next and previous ADOs of each ADO for each exponent.
+        Entries are ``-1`` where :meth:`next` or :meth:`prev` would return
+        ``None``.
+
+        The neighbours are found by sorting and searching the labels, without
+        looping over them in Python.
+        """
+        n_ados, n_exps = len(self.labels), len(self.exponents)
+        labels = np.array(self.labels, dtype=np.int64).reshape(n_ados, n_exps)
+        # Each label is viewed as a single opaque value to sort and search.
+        key_dtype = np.dtype((np.void, labels.itemsize * n_exps))
+
+        def keys(array):
+            return np.ascontiguousarray(array).view(key_dtype).ravel()
+
+        order = np.argsort(keys(labels))
+        sorted_keys = keys(labels)[order]
+
+        def lookup(array):
+            array_keys = keys(array)
+            pos = np.searchsorted(sorted_keys, array_keys)
+            pos = np.minimum(pos, n_ados - 1)
+            return np.where(sorted_keys[pos] == array_keys, order[pos], -1)
+
+        level = labels.sum(axis=1)
+        next_idx = np.full((n_ados, n_exps), -1, dtype=np.int64)
+        prev_idx = np.full((n_ados, n_exps), -1, dtype=np.int64)
+        for k in range(n_exps):
+            shifted = labels.copy()
+            shifted[:, k] += 1
+            valid = (
+                (labels[:, k] < self.dims[k] - 1) & (level < self.max_depth)
+            )
+            next_idx[valid, k] = lookup(shifted[valid])
+            shifted[:, k] -= 2
+            valid = labels[:, k] > 0
+            prev_idx[valid, k] = lookup(shifted[valid])
+        return labels, next_idx, prev_idx
+
     def exps(self, label):
         """
         Converts an ADO label into a tuple of exponents, with one exponent
@@ -418,6 +509,11 @@ class HEOMResult(Result):
         if self.store_ados:
             self._final_ado_state = ado_state
 
+    def _pop(self):
+        if self.store_ados:
+            self.ado_states.pop()
+        return super()._pop()
+
     @property
     def final_ado_state(self):
         if self._final_ado_state is not None:
@@ -609,6 +705,21 @@ class HEOMSolver(Solver):
         The maximum depth of the hierarchy (i.e. the maximum number of bath
         exponent "excitations" to retain).
 
+    matrix_free : bool, default: False
+        Whether to apply the RHS without building it as a sparse matrix.
+        The ADOs are then evolved as a stack of density matrices, each term
+        of the hierarchy being applied to all the ADOs it couples with
+        batched products with the small coupling operators. The memory used
+        by the RHS no longer grows with the number of ADOs times the size of
+        the system superoperators. ADOs can then also be filtered during the
+        evolution, see the ``ado_filter`` option. Keyword only.
+
+    ado_threshold : float, optional
+        Drop the ADOs whose importance, estimated from the ratios
+        ``|ck / vk|`` of the bath exponents, is below this threshold when
+        constructing the hierarchy. See :class:`HierarchyADOs` for
+        details. Keyword only.
+
     options : dict, optional
         Generic solver options.
         If set to None the default options will be used. Keyword only.
@@ -624,7 +735,9 @@ class HEOMSolver(Solver):
         The right-hand side (RHS) of the hierarchy evolution ODE. Internally
         the system and bath coupling operators are converted to
         :class:`qutip.data.CSR` instances during construction of the RHS,
-        so the operators in the ``rhs`` will all be sparse.
+        so the operators in the ``rhs`` will all be sparse. When
+        ``matrix_free`` is set, the matrix is only built when the ``rhs`` is
+        called.
     """
 
     name = "heomsolver"
@@ -635,16 +748,23 @@ class HEOMSolver(Solver):
         "progress_kwargs": {"chunk_size": 10},
         "store_final_state": False,
         "store_states": None,
+        "state_storage": None,
         "normalize_output": False,
         "method": "adams",
         "store_ados": False,
         "state_data_type": "dense",
+        "ado_filter": None,
     }
 
-    def __init__(self, H, bath, max_depth, *, odd_parity=False, options=None):
+    def __init__(
+        self, H, bath, max_depth, *,
+        odd_parity=False, matrix_free=False, ado_threshold=None,
+        options=None,
+    ):
         _time_start = time()
         # we call bool here because odd_parity will be used in arithmetic
         self.odd_parity = bool(odd_parity)
+        self._matrix_free = bool(matrix_free)
         if not isinstance(H, (Qobj, QobjEvo)):
             raise TypeError("The Hamiltonian (H) must be a Qobj or QobjEvo")
 
@@ -660,6 +780,7 @@ class HEOMSolver(Solver):
 
         self.ados = HierarchyADOs(
             self._combine_bath_exponents(bath), max_depth,
+            threshold=ado_threshold,
         )
         self._n_ados = len(self.ados.labels)
         self._n_exponents = len(self.ados.exponents)
@@ -698,11 +819,19 @@ class HEOMSolver(Solver):
             self._init_superop_cache_time = time() - _time_start
             _time_start = time()
 
-            rhs = self._calculate_rhs()
+            if matrix_free:
+                rhs = _HEOMMatrixFreeRHS(self)
+            else:
+                rhs = self._calculate_rhs()
 
         self._init_rhs_time = time() - _time_start
 
         super().__init__(rhs, options=options)
+        if matrix_free:
+            # The base solver stores a plain copy of the rhs.
+            self.rhs = rhs
+            self.rhs._register_feedback({}, solver=self.name)
+            self._integrator = self._get_integrator()
 
     @property
     def sys_dims(self):
@@ -901,26 +1030,121 @@ class HEOMSolver(Solver):
             )
         return op
 
-    def _rhs(self):
-        """ Make the RHS for the HEOM. """
-        ops = _GatherHEOMRHS(
-            self.ados.idx, block=self._sup_shape, nhe=self._n_ados
+    def _rhs_terms(self):
+        """
+        Return the terms of the RHS coupling the ADOs, without the system
+        Liouvillian, as ``(vk_sum, terms)``.
+
+        The diagonal block of the ADO ``i`` is ``-vk_sum[i]`` times the
+        identity. Each term ``(rows, cols, k, dag, pre, post)`` adds
+        ``pre[j] * spre(Q) + post[j] * spost(Q)`` to the block
+        ``(rows[j], cols[j])``, where ``Q`` is the coupling operator of the
+        exponent ``k``, or its adjoint if ``dag``. The coefficients are
+        computed for all ADOs at once.
+        """
+        labels, next_idx, prev_idx = self.ados._neighbours()
+        ados = np.arange(self._n_ados)
+        vk_sum = labels @ np.array(self.ados.vk, dtype=complex)
+        terms = []
+
+        def add(row_ados, col_ados, k, dag, pre, post):
+            keep = (pre != 0) | (post != 0)
+            terms.append((
+                row_ados[keep], col_ados[keep], k, dag, pre[keep], post[keep]
+            ))
+
+        fermionic = np.array([exp.fermionic for exp in self.ados.exponents])
+        fermionic_labels = labels * fermionic
+        sign1 = (-1.) ** (fermionic_labels.sum(axis=1) + 1 - self.odd_parity)
+        n_excite_before = (
+            np.cumsum(fermionic_labels, axis=1) - fermionic_labels
         )
 
-        for he_n in self.ados.labels:
-            op = self._grad_n(he_n)
-            ops.add_op(he_n, he_n, op)
-            for k in range(len(self.ados.dims)):
-                next_he = self.ados.next(he_n, k)
-                if next_he is not None:
-                    op = self._grad_next(he_n, k)
-                    ops.add_op(he_n, next_he, op)
-                prev_he = self.ados.prev(he_n, k)
-                if prev_he is not None:
-                    op = self._grad_prev(he_n, k)
-                    ops.add_op(he_n, prev_he, op)
-
-        return ops.gather()
+        types = BathExponent.types
+        for k, exp in enumerate(self.ados.exponents):
+            has_next = next_idx[:, k] >= 0
+            has_prev = prev_idx[:, k] >= 0
+            next_ados = (ados[has_next], next_idx[has_next, k])
+            prev_ados = (ados[has_prev], prev_idx[has_prev, k])
+            n_k = labels[has_prev, k]
+            ck = self.ados.ck[k]
+
+            if not exp.fermionic:
+                # -1j * (spre(Q) - spost(Q))
+                ones = np.ones(len(next_ados[0]))
+                add(*next_ados, k, False, -1j * ones, 1j * ones)
+                if exp.type == types.R:
+                    coeff = -1j * n_k * ck
+                    add(*prev_ados, k, False, coeff, -coeff)
+                elif exp.type == types.I:
+                    coeff = n_k * ck
+                    add(*prev_ados, k, False, coeff, coeff)
+                elif exp.type == types.RI:
+                    coeff_minus = -1j * n_k * ck
+                    coeff_plus = n_k * self.ados.ck2[k]
+                    add(
+                        *prev_ados, k, False,
+                        coeff_minus + coeff_plus, coeff_plus - coeff_minus,
+                    )
+                else:
+                    raise ValueError(
+                        f"Unsupported type {exp.type} for exponent {k}"
+                    )
+                continue
+
+            if exp.type not in (types["+"], types["-"]):
+                raise ValueError(
+                    f"Unsupported type {exp.type} for exponent {k}"
+                )
+            # "+" exponents use Q^dag to go down the hierarchy and Q to go up,
+            # "-" exponents the opposite.
+            prev_dag = exp.type == types["+"]
+            sign2 = (-1.) ** (n_excite_before[:, k] + self.odd_parity)
+            sign1_next, sign2_next = sign1[has_next], sign2[has_next]
+            add(
+                *next_ados, k, not prev_dag,
+                -1j * sign2_next, -1j * sign2_next * sign1_next,
+            )
+            ck_bar = self.ados.ck[k + self.ados.sigma_bar_k_offset[k]]
+            sign1_prev, sign2_prev = sign1[has_prev], sign2[has_prev]
+            add(
+                *prev_ados, k, prev_dag,
+                -1j * sign2_prev * ck,
+                1j * sign2_prev * sign1_prev * np.conj(ck_bar),
+            )
+        return vk_sum, terms
+
+    def _rhs(self):
+        """
+        Make the RHS for the HEOM, without the system Liouvillian.
+
+        The entries of the superoperators of each term of :meth:`_rhs_terms`
+        are scattered to all their blocks, giving the CSR matrix in one pass.
+        """
+        vk_sum, terms = self._rhs_terms()
+        block = self._sup_shape
+        size = block * self._n_ados
+        rows = [np.arange(size)]
+        cols = [np.arange(size)]
+        values = [np.repeat(-vk_sum, block)]
+
+        for row_ados, col_ados, k, dag, pre, post in terms:
+            spre_op = self._spreQdag[k] if dag else self._spreQ[k]
+            spost_op = self._spostQdag[k] if dag else self._spostQ[k]
+            for coeffs, op in [(pre, spre_op), (post, spost_op)]:
+                op = op.as_scipy().tocoo()
+                rows.append((row_ados[:, None] * block + op.row).ravel())
+                cols.append((col_ados[:, None] * block + op.col).ravel())
+                values.append((coeffs[:, None] * op.data).ravel())
+
+        matrix = sp.csr_matrix(
+            (
+                np.concatenate(values),
+                (np.concatenate(rows), np.concatenate(cols)),
+            ),
+            shape=(size, size),
+        )
+        return _csr.CSR(matrix)
 
     def _calculate_rhs(self):
         """ Make the full RHS required by the solver. """
@@ -967,7 +1191,8 @@ class HEOMSolver(Solver):
 
     def steady_state(
         self,
-        use_mkl=True, mkl_max_iter_refine=100, mkl_weighted_matching=False
+        use_mkl=True, mkl_max_iter_refine=100, mkl_weighted_matching=False,
+        *, method="direct", state0=None, use_precond=True, **kwargs
     ):
         """
         Compute the steady state of the system.
@@ -976,22 +1201,54 @@ class HEOMSolver(Solver):
         ----------
         use_mkl : bool, default=False
             Whether to use mkl or not. If mkl is not installed or if
-            this is false, use the scipy splu solver instead.
+            this is false, use the scipy splu solver instead. Only used by
+            the "direct" method.
 
         mkl_max_iter_refine : int
             Specifies the the maximum number of iterative refinement steps that
             the MKL PARDISO solver performs.
 
-            For a complete description, see iparm(7) in
-            https://www.intel.com/content/www/us/en/docs/onemkl/developer-reference-c/2023-0/pardiso-iparm-parameter.html
+            For a complete description, see iparm(7) in the `PARDISO
+            documentation <https://www.intel.com/content/www/us/en/docs/
+            onemkl/developer-reference-c/2023-0/
+            pardiso-iparm-parameter.html>`_.
 
         mkl_weighted_matching : bool
             MKL PARDISO can use a maximum weighted matching algorithm to
             permute large elements close the diagonal. This strategy adds an
             additional level of reliability to the factorization methods.
 
-            For a complete description, see iparm(12) in
-            https://www.intel.com/content/www/us/en/docs/onemkl/developer-reference-c/2023-0/pardiso-iparm-parameter.html
+            For a complete description, see iparm(12) in the `PARDISO
+            documentation <https://www.intel.com/content/www/us/en/docs/
+            onemkl/developer-reference-c/2023-0/
+            pardiso-iparm-parameter.html>`_.
+
+        method : str {"direct", "gmres", "lgmres", "bicgstab"}, \
+default: "direct"
+            How to solve the linear system for the steady state. "direct"
+            factorizes the RHS of the hierarchy. The other methods are the
+            iterative solvers of ``scipy.sparse.linalg`` of the same name.
+            They only apply the RHS to vectors, so they do not need the
+            memory of the factorization and also work with a ``matrix_free``
+            solver. Keyword only.
+
+        state0 : :obj:`.Qobj`, :class:`HierarchyADOsState` or array-like
+            Initial guess for the iterative methods, for example the steady
+            state of a previous, similar, hierarchy. Either a system density
+            matrix or the full state of the ADO hierarchy, as accepted by
+            :meth:`run`. Keyword only.
+
+        use_precond : bool, default: True
+            Whether to use a block-Jacobi preconditioner with the iterative
+            methods. The preconditioner inverts the diagonal blocks of the
+            RHS, i.e. the system Liouvillian shifted by the sum of the
+            frequencies of each ADO, using one eigendecomposition of the
+            system Liouvillian. Keyword only.
+
+        **kwargs
+            Extra options for the iterative solver, such as ``rtol``,
+            ``atol``, ``maxiter`` or ``restart``. See the documentation of
+            the solver in ``scipy.sparse.linalg``.
 
         Returns
         -------
@@ -1009,33 +1266,61 @@ class HEOMSolver(Solver):
                 " system"
             )
         n = self._sys_shape
+        size = n ** 2 * self._n_ados
+        # The first row of the RHS is replaced by the trace of the density
+        # matrix, which must be one.
+        trace_idx = np.arange(n) * (n + 1)
 
-        b_mat = np.zeros(n ** 2 * self._n_ados, dtype=complex)
+        b_mat = np.zeros(size, dtype=complex)
         b_mat[0] = 1.0
 
-        L = self.rhs(0).to("CSR").data.copy().as_scipy()
-        L = L.tolil()
-        L[0, 0: n ** 2 * self._n_ados] = 0.0
-        L = L.tocsr()
-        L += sp.csr_matrix((
-            np.ones(n),
-            (np.zeros(n), [num * (n + 1) for num in range(n)])
-        ), shape=(n ** 2 * self._n_ados, n ** 2 * self._n_ados))
-
-        if mkl_spsolve is not None and use_mkl:
-            L.sort_indices()
-            solution = mkl_spsolve(
-                L,
-                b_mat,
-                perm=None,
-                verbose=False,
-                max_iter_refine=mkl_max_iter_refine,
-                scaling_vectors=True,
-                weighted_matching=mkl_weighted_matching,
+        if method == "direct":
+            L = self.rhs(0).to("CSR").data.copy().as_scipy()
+            L.data[L.indptr[0]:L.indptr[1]] = 0.0
+            L = L + sp.csr_matrix(
+                (np.ones(n), (np.zeros(n), trace_idx)), shape=(size, size)
             )
+            if mkl_spsolve is not None and use_mkl:
+                L.sort_indices()
+                solution = mkl_spsolve(
+                    L,
+                    b_mat,
+                    perm=None,
+                    verbose=False,
+                    max_iter_refine=mkl_max_iter_refine,
+                    scaling_vectors=True,
+                    weighted_matching=mkl_weighted_matching,
+                )
+            else:
+                L = L.tocsc()
+                solution = spsolve(L, b_mat)
+        elif method in ("gmres", "lgmres", "bicgstab"):
+            def matvec(x):
+                x = np.asarray(x, dtype=complex).reshape(size, 1)
+                out = self.rhs.matmul_data(0, _data.Dense(x)).to_array()
+                out[0] = x[trace_idx].sum()
+                return out.ravel()
+
+            L = splinalg.LinearOperator(
+                (size, size), matvec=matvec, dtype=complex
+            )
+            if use_precond:
+                kwargs["M"] = self._block_jacobi(trace_idx)
+            if state0 is not None:
+                kwargs["x0"] = self._prepare_state(state0).to_array().ravel()
+            solution, info = getattr(splinalg, method)(L, b_mat, **kwargs)
+            if info > 0:
+                raise RuntimeError(
+                    f"scipy.sparse.linalg.{method} error: Tolerance was not"
+                    f" reached. Error code: {info}"
+                )
+            elif info < 0:
+                raise RuntimeError(
+                    f"scipy.sparse.linalg.{method} error: Bad input. "
+                    f"Error code: {info}"
+                )
         else:
-            L = L.tocsc()
-            solution = spsolve(L, b_mat)
+            raise ValueError(f"Unknown steady state method {method!r}.")
 
         data = _data.Dense(solution[:n ** 2].reshape((n, n), order='F'))
         data = _data.mul(_data.add(data, data.adjoint()), 0.5)
@@ -1046,6 +1331,41 @@ class HEOMSolver(Solver):
 
         return steady_state, steady_ados
 
+    def _block_jacobi(self, trace_idx):
+        """
+        Return the block-Jacobi preconditioner of the steady state problem
+        as a ``LinearOperator``.
+
+        The diagonal block of each ADO is ``L_sys - vk_sum * I``. With the
+        eigendecomposition ``L_sys = V diag(w) V^-1``, all these blocks are
+        inverted at once by two matrix products. The block of the system
+        density matrix, with the trace condition, can be singular without the
+        bath, so it is shifted like the block of the slowest ADO before being
+        inverted.
+        """
+        n_ados, block = self._n_ados, self._sup_shape
+        L_sys = self.L_sys(0).full()
+        eigvals, V = scipy.linalg.eig(L_sys)
+        V_inv = scipy.linalg.inv(V)
+        labels = self.ados._neighbours()[0]
+        vk_sum = labels @ np.array(self.ados.vk, dtype=complex)
+        shifts = eigvals[:, None] - vk_sum[None, :]
+        shifts[:, 0] = 1.
+        shift_0 = np.min(vk_sum[1:].real) if n_ados > 1 else 1.
+        L_sys[0] = 0.
+        L_sys[0, trace_idx] = 1.
+        block_0_inv = scipy.linalg.inv(L_sys - shift_0 * np.eye(block))
+
+        def apply(x):
+            x = np.asarray(x).reshape(n_ados, block).T
+            y = V @ ((V_inv @ x) / shifts)
+            y[:, 0] = block_0_inv @ x[:, 0]
+            return y.T.ravel()
+
+        size = n_ados * block
+        return splinalg.LinearOperator((size, size), matvec=apply,
+                                       dtype=complex)
+
     def run(self, state0, tlist, *, args=None, e_ops=None):
         """
         Solve for the time evolution of the system.
@@ -1197,10 +1517,19 @@ class HEOMSolver(Solver):
             Whether or not to store the final state of the evolution in the
             result class.
 
-        store_states: bool, default: None
+        store_states: bool, int, default: None
             Whether or not to store the state vectors or density matrices.
             On `None` the states will be saved if no expectation operators are
-            given.
+            given. If an integer ``k``, only every ``k``-th state is stored,
+            starting with the initial state.
+
+        state_storage: str, default: None
+            Folder where the stored states are written, in memory-mapped
+            files, as they are produced. The states of the result are then
+            read from the disk when accessed. A file is deleted when its
+            result is garbage collected or when ``result.close()`` is called,
+            but kept once the result is pickled. When ``None``, the states are
+            kept in memory.
 
         normalize_output: bool, default: False
             Normalize output state to hide ODE numerical errors.
@@ -1225,11 +1554,31 @@ class HEOMSolver(Solver):
         store_ados : bool, default: False
             Whether or not to store the HEOM ADOs. Only relevant when using
             the HEOM solver.
+
+        ado_filter : float, default: None
+            Tolerance of the ADO filtering. At each evaluation of the RHS,
+            the ADOs whose elements are all smaller than this tolerance in
+            absolute value are treated as zero, and the terms coupling from
+            them are skipped. Their derivatives are still computed, so they
+            rejoin the evolution once they grow. Only supported when the
+            solver is ``matrix_free``, a ``ValueError`` is raised otherwise.
+            A tolerance far above the ``atol`` of the integrator makes ADOs
+            switch on and off often, which slows down the adaptive step
+            integrators.
         """
         return self._options
 
     @options.setter
     def options(self, new_options):
+        if (
+            isinstance(new_options, dict)
+            and new_options.get("ado_filter", None) is not None
+            and not self._matrix_free
+        ):
+            raise ValueError(
+                "The ado_filter option is only supported by matrix_free"
+                " HEOM solvers."
+            )
         Solver.options.fset(self, new_options)
 
 
@@ -1400,3 +1749,120 @@ class _GatherHEOMRHS:
             ops["row"], ops["col"], ops["op"],
             self._n_blocks, self._block_size,
         )
+
+
+class _HEOMMatrixFreeRHS(QobjEvo):
+    """
+    Right-hand side of the HEOM applied without building its matrix.
+
+    The ADO state is viewed as an array of shape ``(n_ados, n, n)`` of the
+    transposed ADO density matrices. Each term of
+    :meth:`HEOMSolver._rhs_terms` is applied to all the ADOs it couples at
+    once, as batched products with the ``n x n`` coupling operator, and the
+    system Liouvillian is applied to all the ADOs with one product.
+
+    The elements of this :obj:`.QobjEvo` are those of the system Liouvillian
+    with empty matrices of the size of the hierarchy, so the time
+    dependence, arguments and feedback are handled as usual.
+
+    Parameters
+    ----------
+    solver : :class:`HEOMSolver`
+        The solver whose RHS is represented.
+    """
+
+    def __init__(self, solver):
+        n_ados = solver._n_ados
+        size = solver._sup_shape * n_ados
+        rhs_dims = [[size], [size]]
+        empty = Qobj(_data.zeros["csr"](size, size), dims=rhs_dims)
+        super().__init__(
+            solver.L_sys.linear_map(lambda _: empty, _skip_check=True)
+        )
+        self._solver = solver
+        self._L_sys = solver.L_sys
+        self._n = solver._sys_shape
+        self._n_ados = n_ados
+        self._bath_rhs = None
+        vk_sum, terms = solver._rhs_terms()
+        self._vk_sum = vk_sum[:, None, None]
+        self._terms = []
+        for rows, cols, k, dag, pre, post in terms:
+            Q = solver.ados.exponents[k].Q
+            # Transposed operator: spre(Q) acts as ``T @ Q.T`` and spost(Q)
+            # as ``Q.T @ T`` on transposed density matrices ``T``.
+            op_T = (Q.dag() if dag else Q).full().T
+            self._terms.append((
+                rows, cols, op_T, pre[:, None, None], post[:, None, None]
+            ))
+
+    def arguments(self, _args=None, **kwargs):
+        super().arguments(_args, **kwargs)
+        self._L_sys.arguments(_args, **kwargs)
+
+    def _register_feedback(self, solvers_feeds, solver):
+        super()._register_feedback(solvers_feeds, solver)
+        self._L_sys._register_feedback(solvers_feeds, solver)
+
+    def matmul_data(self, t, state, out=None):
+        n, n_ados = self._n, self._n_ados
+        if isinstance(state, _data.Dense):
+            array = state.as_ndarray()
+        else:
+            array = state.to_array()
+        ados = array.reshape(n_ados, n, n)
+        tol = self._solver.options["ado_filter"]
+        if tol:
+            # Filtered ADOs are treated as zero: only the active ones are
+            # propagated and coupled to their neighbours.
+            is_active = np.abs(ados).max(axis=(1, 2)) >= tol
+            is_active[0] = True
+            active = np.flatnonzero(is_active)
+        else:
+            active = slice(None)
+        result = np.zeros_like(ados)
+        result[active] = -self._vk_sum[active] * ados[active]
+        # The system Liouvillian acts on each column-stacked ADO.
+        n_active = result[active].shape[0]
+        columns = _data.Dense(
+            ados[active].reshape(n_active, n * n).T, copy=False
+        )
+        result[active] += self._L_sys.matmul_data(
+            t, columns
+        ).to_array().T.reshape(n_active, n, n)
+        # Products on the left are done on the transposed ADOs, so that all
+        # the products of a term are a single matrix product.
+        ados_T = np.ascontiguousarray(ados.transpose(0, 2, 1))
+        result_T = np.zeros_like(ados)
+        for rows, cols, op_T, pre, post in self._terms:
+            if tol:
+                keep = is_active[cols]
+                rows, cols = rows[keep], cols[keep]
+                pre, post = pre[keep], post[keep]
+            m = len(cols)
+            result[rows] += pre * (
+                ados[cols].reshape(m * n, n) @ op_T
+            ).reshape(m, n, n)
+            result_T[rows] += post * (
+                ados_T[cols].reshape(m * n, n) @ op_T.T
+            ).reshape(m, n, n)
+        result += result_T.transpose(0, 2, 1)
+        result = _data.Dense(result.reshape(n_ados * n * n, 1), copy=False)
+        if out is None:
+            return result
+        return _data.add(out, result)
+
+    def _build(self, L_sys):
+        """ Build the matrix of the RHS for the system Liouvillian given. """
+        if self._bath_rhs is None:
+            self._bath_rhs = self._solver._rhs()
+        h_identity = _data.identity(self._n_ados, dtype="csr")
+        L_sys = _data.to("csr", L_sys)
+        return _data.add(self._bath_rhs, _data.kron(h_identity, L_sys))
+
+    def __call__(self, t, _args=None, **kwargs):
+        L_sys = self._L_sys(t, _args, **kwargs)
+        return Qobj(self._build(L_sys.data), dims=self._dims, copy=False)
+
+    def _call(self, t):
+        return self._build(self._L_sys._call(t))
@@ -2,3 +2,4 @@ from .integrator import *
 from .scipy_integrator import *
 from .qutip_integrator import *
 from .krylov import *
+from .auto import *
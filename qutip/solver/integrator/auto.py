@@ -0,0 +1,261 @@
+"""
+Integrator selecting the most efficient ODE method for the system at hand.
+"""
+from time import perf_counter
+import numpy as np
+from qutip.core import data as _data
+from ..integrator import Integrator, IntegratorException
+from ..solver_base import Solver
+from .scipy_integrator import IntegratorScipyAdams, IntegratorScipyBDF
+from .qutip_integrator import IntegratorVern7, IntegratorDiag
+
+
+__all__ = ['IntegratorAuto']
+
+
+class IntegratorAuto(Integrator):
+    """
+    Integrator choosing which ODE method to use from a short pilot
+    integration.
+
+    When the initial state is set, the system is characterized by:
+
+    - Whether it is constant and its size: small constant systems are
+      diagonalized (``diag``), large constant Hamiltonians use a Krylov
+      subspace method (``krylov``).
+    - Estimates of the spectral radius and fastest decay rate obtained from a
+      few Arnoldi iterations.
+    - A pilot integration of a few internal steps with ``adams``. A large
+      fraction of rejected steps, or a state changing much slower than the
+      fastest decay rate of the system at the end of the pilot, indicates a
+      stiff system, for which ``bdf`` is used.
+    - For non-stiff systems, the pilot is repeated with ``vern7`` and the
+      fastest of ``adams`` and ``vern7`` is kept.
+
+    The selected method and the data used to select it are available in the
+    ``selection`` attribute and are reported in the result's ``stats``. The
+    method is selected again when the ``args`` of the system change.
+
+    Usable with ``method="auto"``
+    """
+    integrator_options = {
+        'atol': 1e-8,
+        'rtol': 1e-6,
+        'nsteps': 2500,
+        'first_step': 0,
+        'max_step': 0,
+        'min_step': 0,
+        'pilot_time': 0,
+        'diag_max_size': 256,
+    }
+    support_time_dependant = True
+    supports_blackbox = False
+    method = 'auto'
+
+    # Fraction of rejected steps in the pilot above which the system is
+    # considered stiff.
+    _stiff_rejection = 0.2
+    # Ratio of the fastest decay rate of the system over the rate of change
+    # of the state above which the system is considered stiff.
+    _stiff_ratio = 10.
+    # Number of Arnoldi iterations used to estimate the spectral radius.
+    _arnoldi_dim = 8
+    # Number of internal steps of the pilot integration.
+    _pilot_steps = 100
+
+    def _prepare(self):
+        self._integrator = None
+        self.selection = {}
+        self.name = "auto"
+
+    def _sub_options(self):
+        # Only pass non-default values so that each method keeps its own
+        # defaults for options not set by the user.
+        return {
+            key: val for key, val in self.options.items()
+            if val and key not in ['pilot_time', 'diag_max_size']
+        }
+
+    def _ritz_values(self, t, state0):
+        """
+        Estimate the extremal eigenvalues of the system with a few iterations
+        of the Arnoldi algorithm.
+        """
+        N = state0.shape[0]
+        rng = np.random.default_rng(0)
+        vec = rng.normal(size=N) + 1j * rng.normal(size=N)
+        vec /= np.linalg.norm(vec)
+        dim = min(self._arnoldi_dim, N)
+        basis = [vec]
+        hess = np.zeros((dim + 1, dim), dtype=complex)
+        for j in range(dim):
+            w = self.system.matmul_data(
+                t, _data.Dense(basis[j].reshape((N, 1)))
+            ).to_array().ravel()
+            for i, v in enumerate(basis):
+                hess[i, j] = np.vdot(v, w)
+                w = w - hess[i, j] * v
+            hess[j + 1, j] = np.linalg.norm(w)
+            if hess[j + 1, j] < 1e-12:
+                dim = j + 1
+                break
+            basis.append(w / hess[j + 1, j])
+        return np.linalg.eigvals(hess[:dim, :dim])
+
+    def _pilot(self, integrator_class, t, state0, t_end, nsteps=0):
+        """
+        Integrate from ``t`` toward ``t_end`` with the given method. If
+        ``nsteps`` is given, stop after that number of internal steps.
+
+        Return the reached time and state, the elapsed time and the fraction
+        of rejected steps when available.
+        """
+        integrator = integrator_class(self.system, self._sub_options())
+        start = perf_counter()
+        integrator.set_state(t, state0)
+        try:
+            if nsteps:
+                for _ in range(nsteps):
+                    t_out, state = integrator.mcstep(t_end, copy=False)
+                    if t_out >= t_end:
+                        break
+            else:
+                t_out, state = integrator.integrate(t_end, copy=False)
+        except IntegratorException:
+            return t, state0, np.inf, 1.
+        elapsed = perf_counter() - start
+        rejected = 0.
+        if isinstance(integrator, IntegratorScipyAdams):
+            iwork = integrator._ode_solver._integrator.iwork
+            # zvode's IWORK(11): number of steps,
+            # IWORK(21), IWORK(22): error test and convergence failures.
+            rejected = (iwork[20] + iwork[21]) / max(iwork[10], 1)
+        return t_out, state.copy(), elapsed, rejected
+
+    def _select(self, t, state0):
+        """
+        Characterize the system and return the class of the integrator to use.
+        """
+        N = state0.shape[0]
+        hermitian = False
+        if self.system.isconstant and not self.system.issuper:
+            hermitian = (1j * self.system(t)).isherm
+        self.selection = {"size": N, "constant": self.system.isconstant}
+
+        if hermitian and N <= self.options['diag_max_size']:
+            self.selection["reason"] = "small constant system"
+            return IntegratorDiag
+        if hermitian and state0.shape[1] == 1:
+            from .krylov import IntegratorKrylov
+            self.selection["reason"] = "large constant Hamiltonian"
+            return IntegratorKrylov
+
+        ritz = self._ritz_values(t, state0)
+        radius = np.max(np.abs(ritz))
+        decay = max(np.max(-ritz.real), 0.)
+        self.selection["spectral radius"] = radius
+        pilot_time = self.options['pilot_time']
+        if not pilot_time:
+            pilot_time = 1e3 / radius if radius > 0 else 1.
+
+        # The pilot run with adams, a non-stiff method, covers the first
+        # ``_pilot_steps`` internal steps.
+        t_end, state, adams_time, rejected = self._pilot(
+            IntegratorScipyAdams, t, state0, t + pilot_time, self._pilot_steps
+        )
+        # Stiffness ratio: fastest decay rate of the system over the rate at
+        # which the state is changing at the end of the pilot. Oscillating
+        # modes do not make the system stiff.
+        norm = _data.norm.frobenius(state)
+        rate = _data.norm.frobenius(self.system.matmul_data(t_end, state))
+        if decay == 0:
+            stiffness = 0.
+        elif rate == 0:
+            stiffness = np.inf
+        else:
+            stiffness = decay * norm / rate
+        self.selection["rejected steps"] = rejected
+        self.selection["stiffness ratio"] = stiffness
+        if (
+            rejected > self._stiff_rejection
+            or stiffness > self._stiff_ratio
+        ):
+            self.selection["reason"] = "stiff system"
+            return IntegratorScipyBDF
+
+        _, _, vern_time, _ = self._pilot(IntegratorVern7, t, state0, t_end)
+        self.selection["pilot times"] = {
+            "adams": adams_time, "vern7": vern_time
+        }
+        self.selection["reason"] = "fastest pilot"
+        if vern_time < adams_time:
+            return IntegratorVern7
+        return IntegratorScipyAdams
+
+    def set_state(self, t, state0):
+        if self._integrator is None:
+            integrator_class = self._select(t, state0)
+            self._integrator = integrator_class(
+                self.system, self._sub_options()
+            )
+            self.selection["method"] = self._integrator.method
+            self.name = "auto: " + self._integrator.name
+        self._integrator.set_state(t, state0)
+        self._is_set = True
+
+    def get_state(self, copy=True):
+        return self._integrator.get_state(copy)
+
+    def integrate(self, t, copy=True):
+        return self._integrator.integrate(t, copy)
+
+    def mcstep(self, t, copy=True):
+        return self._integrator.mcstep(t, copy)
+
+    def arguments(self, args):
+        self.system.arguments(args)
+        # New args can change the nature of the system: drop the selected
+        # integrator so that the method is selected again.
+        self.reset(hard=True)
+
+    @property
+    def options(self):
+        """
+        Supported options by the "auto" method:
+
+        atol : float, default: 1e-8
+            Absolute tolerance.
+
+        rtol : float, default: 1e-6
+            Relative tolerance.
+
+        nsteps : int, default: 2500
+            Max. number of internal steps/call.
+
+        first_step : float, default: 0
+            Size of initial step (0 = automatic).
+
+        min_step : float, default: 0
+            Minimum step size (0 = automatic).
+
+        max_step : float, default: 0
+            Maximum step size (0 = automatic)
+            When using pulses, change to half the thinest pulse otherwise it
+            may be skipped.
+
+        pilot_time : float, default: 0
+            Maximum length of the pilot integration used to select the method.
+            If ``0``, a thousand times the inverse of the estimated spectral
+            radius of the system is used.
+
+        diag_max_size : int, default: 256
+            Largest constant system that is solved by diagonalization.
+        """
+        return self._options
+
+    @options.setter
+    def options(self, new_options):
+        Integrator.options.fset(self, new_options)
+
+
+Solver.add_integrator(IntegratorAuto, 'auto')
@@ -19,6 +19,9 @@ cdef class Explicit_RungeKutta:
     cdef Data _y_temp, _y, _y_prev, _y_front
     cdef double _norm_front, _norm_prev, _dt_safe, _dt_int
     cdef double _t, _t_prev, _t_front
+    # Whether the extra derivatives for the dense output of the last step are
+    # computed.
+    cdef bint _dense_ready
     cdef Status _status
     cdef dict status_messages
 
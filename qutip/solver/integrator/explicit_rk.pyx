@@ -219,6 +219,7 @@ cdef class Explicit_RungeKutta:
         self._y = y0
         self._norm_prev = frobenius_data(self._y)
         self._norm_front = self._norm_prev
+        self._dense_ready = False
 
         #prepare the buffers
         for i in range(self.rk_extra_step):
@@ -298,6 +299,8 @@ cdef class Explicit_RungeKutta:
             return
 
         if self.interpolate and t < self._t_front:
+             if not self._dense_ready:
+                 self._prep_dense_out()
              self._y = self._interpolate_step(t, self._y)
              self._t = t
 
@@ -318,7 +321,8 @@ cdef class Explicit_RungeKutta:
             return
 
         if self._t_front > t:
-            self._prep_dense_out()
+            if not self._dense_ready:
+                self._prep_dense_out()
             self._status = Status.INTERPOLATED
             self._t = t
             self._y = self._interpolate_step(t, self._y)
@@ -355,6 +359,7 @@ cdef class Explicit_RungeKutta:
         Use (_t_prev, _y_prev) to create (_t_front, _y_front)
         """
         cdef int i
+        self._dense_ready = False
         for i in range(self.rk_step):
             self.k[i] = imul_data(<Data> self.k[i], 0.)
 
@@ -401,6 +406,44 @@ cdef class Explicit_RungeKutta:
             self._y_temp = self._accumulate(self._y_temp, self.a[i,:], dt, i)
             self.k[i] = self.qevo.matmul_data(self._t_prev + self.c[i]*dt,
                                               self._y_temp, <Data> self.k[i])
+        self._dense_ready = True
+
+    def dense_output(self, tlist):
+        """
+        Compute the states at many times within the last step at once.
+
+        Parameters
+        ----------
+        tlist : array_like of double
+            Times at which to compute the state. They must be between
+            ``t_prev`` and ``t_front``.
+
+        Returns
+        -------
+        states : np.ndarray
+            Array of shape ``(len(tlist), *state.shape)`` with the state at
+            each time.
+        """
+        cdef double dt = self._dt_int
+        if not self.interpolate:
+            raise ValueError("The method does not support interpolation.")
+        tlist = np.asarray(tlist, dtype=np.float64)
+        y_prev = self._y_prev.to_array()
+        if dt == 0 or self._t_front == self._t_prev:
+            # No step done yet.
+            return np.repeat(y_prev[np.newaxis], tlist.shape[0], axis=0)
+        if not self._dense_ready:
+            self._prep_dense_out()
+        taus = (tlist - self._t_prev) / dt
+        # Same polynomial as `_interpolate_step`, for all times at once.
+        factors = (
+            taus[:, np.newaxis]**np.arange(1, self.denseout_order + 1)
+            @ np.asarray(self.bi).T
+        ) * dt
+        ks = np.stack([
+            (<Data> self.k[i]).to_array() for i in range(self.rk_extra_step)
+        ])
+        return y_prev + np.tensordot(factors, ks, axes=1)
 
     cdef Data _interpolate_step(self, double t, Data out):
         """
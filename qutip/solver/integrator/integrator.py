@@ -200,6 +200,27 @@ class Integrator:
         for t in tlist[1:]:
             yield self.integrate(t, False)
 
+    def run_batches(self, tlist):
+        """
+        Integrate the system yielding the states for the times in tlist in
+        batches. Integrators with dense output may compute all the states
+        within one internal step at once.
+
+        Parameters
+        ----------
+        tlist : *list* / *array*
+            List of times to yield the state.
+
+        Yields
+        ------
+        (times, states) : (np.ndarray, np.ndarray)
+            Times of the batch and the states at those times as an array of
+            shape ``(len(times), *state.shape)``.
+        """
+        for t in tlist[1:]:
+            t, state = self.integrate(t, False)
+            yield np.array([t]), state.to_array()[np.newaxis]
+
     def reset(self, hard=False):
         """Reset internal state of the ODE solver."""
         if self._is_set:
@@ -31,15 +31,18 @@ class IntegratorVern7(Integrator):
         'max_step': 0,
         'min_step': 0,
         'interpolate': True,
+        'batch_output': False,
     }
     support_time_dependant = True
     supports_blackbox = True
     method = 'vern7'
 
     def _prepare(self):
+        options = self.options.copy()
+        del options['batch_output']
         self._ode_solver = Explicit_RungeKutta(
             self.system, method=self.method,
-            **self.options
+            **options
         )
         self.name = self.method
 
@@ -61,6 +64,27 @@ class IntegratorVern7(Integrator):
         self._check_failed_integration()
         return self.get_state(copy)
 
+    def run_batches(self, tlist):
+        if not self._ode_solver.interpolate:
+            yield from super().run_batches(tlist)
+            return
+        tlist = np.asarray(tlist, dtype=np.float64)
+        i = 1
+        while i < len(tlist):
+            self._ode_solver.integrate(tlist[i], step=False)
+            self._check_failed_integration()
+            # All times up to the end of the last step can be obtained from
+            # the dense output without further steps.
+            j = max(i + 1, np.searchsorted(
+                tlist, self._ode_solver.t_front, side="right"
+            ))
+            times = tlist[i:j]
+            states = self._ode_solver.dense_output(times)
+            # Leave the solver at the last output time.
+            self._ode_solver.integrate(times[-1], step=False)
+            yield times, states
+            i = j
+
     def _check_failed_integration(self):
         if self._ode_solver.successful():
             return
@@ -93,6 +117,13 @@ class IntegratorVern7(Integrator):
 
         interpolate : bool, default: True
             Whether to use interpolation step, faster most of the time.
+
+        batch_output : bool, default: False
+            When only expectation values of :obj:`.Qobj` are computed, obtain
+            the states for all times of ``tlist`` within one internal step at
+            once from the dense output and compute their expectation values
+            together. Makes fine ``tlist`` about as cheap as coarse ones.
+            Requires ``interpolate=True``.
         """
         return self._options
 
@@ -124,6 +155,7 @@ class IntegratorVern9(IntegratorVern7):
         'max_step': 0,
         'min_step': 0,
         'interpolate': True,
+        'batch_output': False,
     }
     method = 'vern9'
 
@@ -446,6 +446,7 @@ class MCSolver(MultiTrajSolver):
         "progress_kwargs": {"chunk_size": 10},
         "store_final_state": False,
         "store_states": None,
+        "state_storage": None,
         "keep_runs_results": False,
         "map": "serial",
         "mpi_options": {},
@@ -545,7 +546,7 @@ class MCSolver(MultiTrajSolver):
             # zeroes. This also ensures that the final multi-trajectory
             # result will contain the requested number of trajectories.
             zero = qzero_like(self._restore_state(state, copy=False))
-            result = self._trajectory_resultclass(e_ops, self.options)
+            result = self._new_trajectory_result(e_ops)
             result.collapse = []
             for t in tlist:
                 result.add(t, zero)
@@ -796,10 +797,20 @@ class MCSolver(MultiTrajSolver):
             Whether or not to store the final state of the evolution in the
             result class.
 
-        store_states: bool, default: None
+        store_states: bool, int, default: None
             Whether or not to store the state vectors or density matrices.
             On `None` the states will be saved if no expectation operators are
-            given.
+            given. If an integer ``k``, only every ``k``-th state is stored,
+            starting with the initial state.
+
+        state_storage: str, default: None
+            Folder where the stored states are written, in memory-mapped
+            files, as they are produced. The states of the result are then
+            read from the disk when accessed. The states of the trajectories
+            kept with ``keep_runs_results`` and the average states are
+            written. A file is deleted when its result is garbage collected
+            or when ``result.close()`` is called, but kept once the result is
+            pickled. When ``None``, the states are kept in memory.
 
         progress_bar: str {'text', 'enhanced', 'tqdm', ''}, default: "text"
             How to present the solver progress.
@@ -208,6 +208,7 @@ class MESolver(SESolver):
         "progress_kwargs": {"chunk_size":10},
         "store_final_state": False,
         "store_states": None,
+        "state_storage": None,
         "normalize_output": True,
         'method': 'adams',
     }
@@ -5,7 +5,7 @@ from .result import Result
 from .multitrajresult import MultiTrajResult
 from .parallel import _get_map
 from time import time
-from .solver_base import Solver
+from .solver_base import Solver, _format_e_data
 from ..core import QobjEvo, Qobj
 from ..core.numpy_backend import np
 from numpy.typing import ArrayLike
@@ -70,6 +70,7 @@ class MultiTrajSolver(Solver):
         "progress_kwargs": {"chunk_size": 10},
         "store_final_state": False,
         "store_states": None,
+        "state_storage": None,
         "keep_runs_results": False,
         "normalize_output": False,
         "method": "",
@@ -90,6 +91,7 @@ class MultiTrajSolver(Solver):
         self.seed_sequence = SeedSequence()
         self._integrator = self._get_integrator()
         self._state_metadata = {}
+        self._expect_cache = {}
         self.stats = self._initialize_stats()
 
     def start(self, state0: Qobj, t0: float, seed: int | SeedSequence = None):
@@ -259,7 +261,7 @@ class MultiTrajSolver(Solver):
 
     def _initialize_run_one_traj(self, seed, state, tlist, e_ops,
                                  **integrator_kwargs):
-        result = self._trajectory_resultclass(e_ops, self.options)
+        result = self._new_trajectory_result(e_ops)
         if "generator" in integrator_kwargs:
             generator = integrator_kwargs.pop("generator")
         else:
@@ -278,9 +280,115 @@ class MultiTrajSolver(Solver):
         return *self._integrate_one_traj(seed, tlist, result), 1
 
     def _integrate_one_traj(self, seed, tlist, result):
+        for _ in self._iter_one_traj(tlist, result):
+            pass
+        return seed, result
+
+    def _iter_one_traj(self, tlist, result):
+        """
+        Evolve the trajectory through ``tlist``, adding the state to
+        ``result`` and yielding at each time.
+        """
         for t, state in self._integrator.run(tlist):
             result.add(t, self._restore_state(state, copy=False))
-        return seed, result
+            yield
+
+    def run_iter(
+        self,
+        state: Qobj,
+        tlist: ArrayLike,
+        ntraj: int = 1,
+        *,
+        args: dict[str, Any] = None,
+        e_ops: dict[Any, Qobj | QobjEvo | Callable[[float, Qobj], Any]] = None,
+        seeds: int | SeedSequence | list[int | SeedSequence] = None,
+    ):
+        """
+        Compute trajectories of the evolution, yielding the output at each
+        time of ``tlist`` as soon as it is reached.
+
+        The trajectories are computed one after the other in this process.
+        Nothing is kept between times, so the memory used does not grow
+        with ``ntraj`` or the length of ``tlist``.
+
+        Parameters
+        ----------
+        state : :obj:`.Qobj`
+            Initial state of the evolution.
+
+        tlist : list of double
+            Times at which to yield the output. The first element of the list
+            is the initial time of the evolution.
+
+        ntraj : int
+            Number of trajectories to compute.
+
+        args : dict, optional
+            Change the ``args`` of the rhs for the evolution.
+
+        e_ops : list
+            list of Qobj or QobjEvo to compute the expectation values.
+            Alternatively, function[s] with the signature f(t, state) -> expect
+            can be used.
+
+        seeds : {int, SeedSequence, list}, optional
+            Seed or list of seeds for each trajectories.
+
+        Yields
+        ------
+        trajectory : int
+            Index of the trajectory.
+
+        t : float
+            Time of the output.
+
+        state_or_expect : :obj:`.Qobj`, value, list or dict
+            The state of the trajectory at ``t`` if no ``e_ops`` are given.
+            Otherwise the expectation values at ``t``, in the same form as
+            ``e_ops``: a single value, a list or a dict.
+        """
+        self._argument(args)
+        seeds = self._read_seed(seeds, ntraj)
+        state0 = self._prepare_state(state)
+        for trajectory, seed in enumerate(seeds):
+            result = self._streaming_result(e_ops)
+            self._integrator.set_state(
+                tlist[0], state0, self._get_generator(seed)
+            )
+            result.add(tlist[0], self._restore_state(state0, copy=False))
+            t, out = result._pop()
+            if result.e_ops:
+                out = _format_e_data(e_ops, out)
+            yield trajectory, t, out
+            for _ in self._iter_one_traj(tlist, result):
+                t, out = result._pop()
+                if result.e_ops:
+                    out = _format_e_data(e_ops, out)
+                yield trajectory, t, out
+
+    def _new_trajectory_result(self, e_ops):
+        """
+        Create the result of one trajectory. Its states are only written to
+        the ``state_storage`` folder if the trajectories are kept in the
+        final result: the others are only used for the averages.
+        """
+        options = self.options
+        if not options["keep_runs_results"]:
+            options = {**options, "state_storage": None}
+        return self._trajectory_resultclass(
+            e_ops, options, expect_cache=self._expect_cache
+        )
+
+    def _streaming_result(self, e_ops):
+        options = {
+            **self.options,
+            "store_states": None,
+            "store_final_state": False,
+            "state_storage": None,
+        }
+        return self._trajectory_resultclass(
+            e_ops, options, expect_cache=self._expect_cache
+        )
 
     def _run_one_traj_mixed(self, id, seeds, ics,
                             tlist, e_ops, **integrator_kwargs):
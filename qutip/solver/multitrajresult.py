@@ -11,7 +11,7 @@ from ..core.numpy_backend import np
 
 from copy import copy
 
-from .result import _BaseResult
+from .result import _BaseResult, _MemmapStates, _combine_states
 from ..core import qzero_like
 
 __all__ = [
@@ -67,7 +67,9 @@ class MultiTrajResult(_BaseResult):
 
     average_states : list of :obj:`.Qobj`
         The state at each time ``t`` (if the recording of the state was
-        requested) averaged over all trajectories as a density matrix.
+        requested) averaged over all trajectories as a density matrix. When
+        the ``state_storage`` option is set, this is a read-only sequence of
+        states stored on the disk.
 
     runs_states : list of list of :obj:`.Qobj`
         The state for each trajectory and each time ``t`` (if the recording of
@@ -200,6 +202,9 @@ class MultiTrajResult(_BaseResult):
         # added.
         self._sum_rel = None
         self._sum_det = None
+        # Averages of the states stored on the disk, reused until more
+        # trajectories are added.
+        self._average_states_cache = None
         # Needed for merging results
         self._trajectories_weight_info = []
         self._deterministic_weight_info = []
@@ -230,6 +235,10 @@ class MultiTrajResult(_BaseResult):
 
     def _store_trajectory(self, trajectory, *, abs=None, rel=None):
         if abs is None:
+            if isinstance(trajectory.states, _MemmapStates):
+                # Trajectories computed in other processes are received
+                # pickled: this result is now the owner of their file.
+                trajectory.states._own()
             self.trajectories.append(trajectory)
 
     def _reduce_states(self, trajectory, *, abs=None, rel=None):
@@ -287,14 +296,16 @@ class MultiTrajResult(_BaseResult):
                 self._sum_det = _TrajectorySum(
                     trajectory,
                     self._store_average_density_matrices,
-                    self._store_final_density_matrix)
+                    self._store_final_density_matrix,
+                    self.options.get("state_storage", None))
         else:
             self.num_trajectories += 1
             if self._sum_rel is None:
                 self._sum_rel = _TrajectorySum(
                     trajectory,
                     self._store_average_density_matrices,
-                    self._store_final_density_matrix)
+                    self._store_final_density_matrix,
+                    self.options.get("state_storage", None))
 
     def _no_end(self):
         """
@@ -528,14 +539,26 @@ class MultiTrajResult(_BaseResult):
             ):
                 self._reduce_states(trajectory, rel=weight)
 
-        if self._sum_det and self._sum_rel:
-            return [a + r / self.num_trajectories for a, r in zip(
-                self._sum_det.sum_states, self._sum_rel.sum_states)
-            ]
-        if self._sum_rel:
-            return [r / self.num_trajectories
-                    for r in self._sum_rel.sum_states]
-        return self._sum_det.sum_states
+        if not (self._sum_rel and self._sum_rel.sum_states):
+            return self._sum_det.sum_states
+        key = (self.num_trajectories, len(self._deterministic_weight_info))
+        if (
+            self._average_states_cache is not None
+            and self._average_states_cache[0] == key
+        ):
+            return self._average_states_cache[1]
+        if self._sum_det:
+            states = _combine_states(
+                1., self._sum_det.sum_states,
+                1 / self.num_trajectories, self._sum_rel.sum_states
+            )
+        else:
+            states = _combine_states(
+                1 / self.num_trajectories, self._sum_rel.sum_states
+            )
+        if isinstance(states, _MemmapStates):
+            self._average_states_cache = (key, states)
+        return states
 
     @property
     def states(self):
@@ -663,10 +686,30 @@ class MultiTrajResult(_BaseResult):
         N = len(self.times) if N > len(self.times) else N
         states = self.average_states
         if states is not None:
-            return sum(states[-N:]) / N
+            # One state at a time, the states can be stored on the disk.
+            return sum(
+                states[i] for i in range(len(states) - N, len(states))
+            ) / N
         else:
             return None
 
+    def close(self):
+        """
+        Delete the files of the states written to the ``state_storage``
+        folder, for the kept trajectories and the averages. These states are
+        no longer available afterwards. Does nothing when the states are kept
+        in memory.
+        """
+        for trajectory in self.trajectories + self.deterministic_trajectories:
+            trajectory.close()
+        for sum_ in [self._sum_det, self._sum_rel]:
+            if sum_ and isinstance(sum_.sum_states, _MemmapStates):
+                sum_.sum_states._delete()
+                sum_.sum_states = None
+        if self._average_states_cache is not None:
+            self._average_states_cache[1]._delete()
+            self._average_states_cache = None
+
     def __repr__(self):
         lines = [
             f"<{self.__class__.__name__}",
@@ -821,8 +864,14 @@ class _TrajectorySum:
 
     store_final_state : bool
         Whether the final states of the trajectories will be summed.
+
+    state_storage : str, optional
+        Folder in which the sums of the states are kept, in memory-mapped
+        files, instead of in memory.
     """
-    def __init__(self, example_trajectory, store_states, store_final_state):
+    def __init__(self, example_trajectory, store_states, store_final_state,
+                 state_storage=None):
+        self._state_storage = state_storage
         if example_trajectory.states and store_states:
             self._initialize_sum_states(example_trajectory)
         else:
@@ -841,6 +890,13 @@ class _TrajectorySum:
         ]
 
     def _initialize_sum_states(self, example_trajectory):
+        if self._state_storage is not None:
+            self.sum_states = _MemmapStates._zeros(
+                self._state_storage,
+                _to_dm(example_trajectory.states[0]),
+                len(example_trajectory.states),
+            )
+            return
         self.sum_states = [
             qzero_like(_to_dm(state)) for state in example_trajectory.states]
 
@@ -855,7 +911,14 @@ class _TrajectorySum:
         `sum_states`. Takes account of the trajectory's total weight if
         present.
         """
-        if td_weight is not None:
+        if isinstance(self.sum_states, _MemmapStates):
+            if td_weight is None:
+                td_weight = [1.] * len(self.sum_states)
+            for i, (state, weight_t) in enumerate(
+                zip(trajectory.states, td_weight)
+            ):
+                self.sum_states._add(i, _to_dm(state), weight * weight_t)
+        elif td_weight is not None:
             self.sum_states = [
                 accu + weight * weight_t * _to_dm(state)
                 for accu, state, weight_t in zip(
@@ -901,9 +964,7 @@ class _TrajectorySum:
 
         if sum2 is None:
             if sum1.sum_states:
-                new.sum_states = [
-                    weight1 * state1 for state1 in sum1.sum_states
-                ]
+                new.sum_states = _combine_states(weight1, sum1.sum_states)
             if sum1.sum_final_state:
                 new.sum_final_state = weight1 * sum1.sum_final_state
             new.sum_expect = [weight1 * e1 for e1 in sum1.sum_expect]
@@ -911,11 +972,9 @@ class _TrajectorySum:
             return new
 
         if sum1.sum_states and sum2.sum_states:
-            new.sum_states = [
-                weight1 * state1 + weight2 * state2 for state1, state2 in zip(
-                    sum1.sum_states, sum2.sum_states
-                )
-            ]
+            new.sum_states = _combine_states(
+                weight1, sum1.sum_states, weight2, sum2.sum_states
+            )
         else:
             new.sum_states = None
 
@@ -991,7 +1050,9 @@ class McResult(_McBaseResult):
 
     average_states : list of :obj:`.Qobj`
         The state at each time ``t`` (if the recording of the state was
-        requested) averaged over all trajectories as a density matrix.
+        requested) averaged over all trajectories as a density matrix. When
+        the ``state_storage`` option is set, this is a read-only sequence of
+        states stored on the disk.
 
     runs_states : list of list of :obj:`.Qobj`
         The state for each trajectory and each time ``t`` (if the recording of
@@ -1162,7 +1223,9 @@ class NmmcResult(_McBaseResult):
 
     average_states : list of :obj:`.Qobj`
         The state at each time ``t`` (if the recording of the state was
-        requested) averaged over all trajectories as a density matrix.
+        requested) averaged over all trajectories as a density matrix. When
+        the ``state_storage`` option is set, this is a read-only sequence of
+        states stored on the disk.
 
     runs_states : list of list of :obj:`.Qobj`
         The state for each trajectory and each time ``t`` (if the recording of
@@ -1299,10 +1362,13 @@ class NmmcResult(_McBaseResult):
         self.add_processor(self._add_trace)
 
     def _reduce_states(self, trajectory, *, abs=None, rel=None):
+        # The trace is recorded at every time, the states only at the stored
+        # ones.
+        trace = trajectory.trace[::trajectory._store_every]
         if abs is not None:
-            self._sum_det.reduce_states(trajectory, abs, trajectory.trace)
+            self._sum_det.reduce_states(trajectory, abs, trace)
         else:
-            self._sum_rel.reduce_states(trajectory, rel, trajectory.trace)
+            self._sum_rel.reduce_states(trajectory, rel, trace)
 
     def _reduce_final_state(self, trajectory, *, abs=None, rel=None):
         if abs is not None:
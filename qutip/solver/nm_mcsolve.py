@@ -360,6 +360,7 @@ class NonMarkovianMCSolver(MCSolver):
         "progress_kwargs": {"chunk_size": 10},
         "store_final_state": False,
         "store_states": None,
+        "state_storage": None,
         "keep_runs_results": False,
         "map": "serial",
         "mpi_options": {},
@@ -591,6 +592,38 @@ class NonMarkovianMCSolver(MCSolver):
 
         return result
 
+    def run_iter(
+        self,
+        state: Qobj,
+        tlist: ArrayLike,
+        ntraj: int = 1,
+        *,
+        args: dict[str, Any] = None,
+        **kwargs
+    ):
+        # The states are yielded as density matrices with trace equal to the
+        # martingale and the expectation values are multiplied by it, so
+        # that their averages match the output of `run`.
+        self._argument(args)
+
+        self._martingale.initialize(tlist[0], cache=tlist)
+        try:
+            for trajectory, t, out in super().run_iter(
+                state, tlist, ntraj, **kwargs
+            ):
+                mu = self._martingale.value(t)
+                if isinstance(out, Qobj):
+                    out = (ket2dm(out) if isket(out) else out) * mu
+                elif isinstance(out, dict):
+                    out = {key: value * mu for key, value in out.items()}
+                elif isinstance(out, list):
+                    out = [value * mu for value in out]
+                else:
+                    out = out * mu
+                yield trajectory, t, out
+        finally:
+            self._martingale.reset()
+
     @property
     def options(self) -> dict[str, Any]:
         """
@@ -600,10 +633,20 @@ class NonMarkovianMCSolver(MCSolver):
             Whether or not to store the final state of the evolution in the
             result class.
 
-        store_states: bool, default: None
+        store_states: bool, int, default: None
             Whether or not to store the state vectors or density matrices.
             On `None` the states will be saved if no expectation operators are
-            given.
+            given. If an integer ``k``, only every ``k``-th state is stored,
+            starting with the initial state.
+
+        state_storage: str, default: None
+            Folder where the stored states are written, in memory-mapped
+            files, as they are produced. The states of the result are then
+            read from the disk when accessed. The states of the trajectories
+            kept with ``keep_runs_results`` and the average states are
+            written. A file is deleted when its result is garbage collected
+            or when ``result.close()`` is called, but kept once the result is
+            pickled. When ``None``, the states are kept in memory.
 
         progress_bar: str {'text', 'enhanced', 'tqdm', ''}, default: "text"
             How to present the solver progress.
@@ -3,10 +3,17 @@
 # Required for Sphinx to follow autodoc_type_aliases
 from __future__ import annotations
 
+import os
+import tempfile
+import weakref
+from collections.abc import Sequence
 from typing import TypedDict, Any, Callable
+import numpy
 from ..core.numpy_backend import np
 from numpy.typing import ArrayLike
 from ..core import Qobj, QobjEvo, expect
+from ..core import data as _data
+from .. import settings
 
 __all__ = ["Result"]
 
@@ -29,6 +36,235 @@ class _QobjExpectEop:
         return expect(self.op, state)
 
 
+class _ExpectManyEop:
+    """
+    Processor computing the expectation values of many :obj:`.Qobj` e_ops
+    with a single pass over the state using :obj:`.data.ExpectMany`.
+
+    Diagonal operators, such as occupation numbers and projectors on basis
+    states, are evaluated together from the populations of the state.
+
+    Parameters
+    ----------
+    e_ops : list of :obj:`ExpectOp`
+        The e_ops, whose operators are :obj:`.Qobj` with the same dimensions.
+
+    cache : dict, optional
+        Storage for the last operators prepared and their kernels, reused
+        when the same operators are given again. Multi-trajectory solvers
+        share one with the results of all their trajectories.
+    """
+
+    def __init__(self, e_ops, cache=None):
+        self.e_ops = e_ops
+        ops = [e_op.op for e_op in e_ops]
+        self._dims = ops[0]._dims
+        cached_ops, kernels = (cache or {}).get("expect_many", ((), None))
+        if len(cached_ops) != len(ops) or any(
+            op is not cached for op, cached in zip(ops, cached_ops)
+        ):
+            kernels = self._prepare(ops)
+            if cache is not None:
+                cache["expect_many"] = (tuple(ops), kernels)
+        self._groups = [
+            (
+                kernel,
+                [e_ops[i] for i in indices],
+                [ops[i].isherm for i in indices],
+            )
+            for kernel, indices in kernels
+        ]
+
+    @staticmethod
+    def _prepare(ops):
+        """
+        Split the operators in diagonal and general ones and return the
+        kernels evaluating each group with the indices of their operators.
+        """
+        diagonal = [_data.isdiag(op.data) for op in ops]
+        kernels = []
+        for is_diag in [True, False]:
+            indices = [i for i, diag in enumerate(diagonal) if diag == is_diag]
+            if indices:
+                kernel = _data.ExpectMany([ops[i].data for i in indices])
+                kernels.append((kernel, indices))
+        return kernels
+
+    def __call__(self, t, state):
+        if (
+            not (state.isket or state.isoper)
+            or state._dims[0] != self._dims[1]
+        ):
+            # Let ``expect`` raise the appropriate error.
+            for e_op in self.e_ops:
+                e_op._store(t, state)
+            return
+        real = settings.core["auto_real_casting"] and (
+            state.isket or state.isherm
+        )
+        for kernel, e_ops, isherm in self._groups:
+            values = kernel(state.data)
+            for e_op, herm, value in zip(e_ops, isherm, values):
+                e_op._append(value.real if real and herm else value)
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        # Already removed, or still mapped on platforms refusing it.
+        pass
+
+
+class _MemmapStates(Sequence):
+    """
+    List-like storage of states writing each added state to a file in
+    ``directory``. The states are read back lazily through a memory-map: the
+    :obj:`.Qobj` returned share their memory with the file, with changes
+    kept in memory only.
+
+    The file is deleted when the storage is garbage collected or
+    :meth:`_delete` is called. Once pickled, e.g. when sent from another
+    process or saved, the file is kept so that the copies remain readable.
+    A copy only deletes it if it takes ownership with :meth:`_own`.
+
+    Parameters
+    ----------
+    directory : str
+        Folder in which the file is created.
+    """
+
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        fd, self.path = tempfile.mkstemp(suffix=".qstates", dir=directory)
+        os.close(fd)
+        self._length = 0
+        self._shape = None
+        self._dims = None
+        self._map = None
+        self._file = None
+        self._finalizer = None
+        self._own()
+
+    @classmethod
+    def _zeros(cls, directory, example, length):
+        """
+        Storage of ``length`` zero states like ``example``, in which states
+        are summed in place with :meth:`_add`.
+        """
+        out = cls(directory)
+        out._shape = example.shape
+        out._dims = example._dims
+        out._length = length
+        with open(out.path, "r+b") as f:
+            f.truncate(length * example.shape[0] * example.shape[1] * 16)
+        return out
+
+    def _own(self):
+        """Delete the file when this storage is garbage collected."""
+        if self._finalizer is None or not self._finalizer.alive:
+            self._finalizer = weakref.finalize(self, _remove_file, self.path)
+
+    def _close(self):
+        """Close the file used to write the states, flushing them."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._map is not None and self._map.mode == "r+":
+            self._map.flush()
+
+    def _delete(self):
+        """Delete the file: the states are no longer available."""
+        self._close()
+        self._map = None
+        self._length = 0
+        if self._finalizer is not None:
+            self._finalizer.detach()
+        _remove_file(self.path)
+
+    def _memmap(self, mode):
+        if self._map is None or self._map.mode != mode:
+            self._close()
+            self._map = numpy.memmap(
+                self.path, dtype=numpy.complex128, mode=mode,
+                shape=(self._length,) + self._shape,
+            )
+        return self._map
+
+    def _add(self, index, state, weight=1.):
+        """Add ``weight * state`` to the state at ``index``, in the file."""
+        self._memmap("r+")[index] += weight * state.full()
+
+    def append(self, state):
+        array = numpy.asarray(state.full(), dtype=numpy.complex128)
+        if self._shape is None:
+            self._shape = array.shape
+            self._dims = state._dims
+        elif array.shape != self._shape:
+            raise ValueError(
+                f"State of shape {array.shape} can not be stored with states "
+                f"of shape {self._shape}."
+            )
+        if self._map is not None:
+            self._close()
+            self._map = None
+        if self._file is None:
+            self._file = open(self.path, "ab")
+        self._file.write(numpy.ascontiguousarray(array).tobytes())
+        self._length += 1
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("State index out of range.")
+        if self._map is not None and self._map.mode == "r+":
+            # States being summed: return a copy, not a view of the file.
+            array = numpy.array(self._map[index])
+        else:
+            array = self._memmap("c")[index]
+        return Qobj(
+            _data.Dense(array, copy=False), dims=self._dims, copy=False
+        )
+
+    def __getstate__(self):
+        self._close()
+        # The pickled copy refers to the file: it must outlive this storage.
+        if self._finalizer is not None:
+            self._finalizer.detach()
+        state = self.__dict__.copy()
+        state["_map"] = None
+        state["_file"] = None
+        state["_finalizer"] = None
+        return state
+
+
+def _combine_states(weight1, states1, weight2=0., states2=None):
+    """
+    Return ``weight1 * states1 + weight2 * states2`` for sequences of states.
+    Sums stored on the disk give a new storage in the same folder, computed
+    one state at a time.
+    """
+    if states2 is None:
+        combined = (weight1 * state for state in states1)
+    else:
+        combined = (
+            weight1 * state1 + weight2 * state2
+            for state1, state2 in zip(states1, states2)
+        )
+    if isinstance(states1, _MemmapStates):
+        out = _MemmapStates(os.path.dirname(states1.path))
+        for state in combined:
+            out.append(state)
+        return out
+    return list(combined)
+
+
 class ExpectOp:
     """
     A result e_op (expectation operation).
@@ -127,8 +363,9 @@ class _BaseResult:
 
 
 class ResultOptions(TypedDict):
-    store_states: bool | None
+    store_states: bool | int | None
     store_final_state: bool
+    state_storage: str | None
 
 
 class Result(_BaseResult):
@@ -159,6 +396,11 @@ class Result(_BaseResult):
         The stats generated by the solver while producing these results. Note
         that the solver may update the stats directly while producing results.
 
+    expect_cache : dict or None
+        Storage shared between results to reuse the preparation of the
+        ``e_ops`` when the same operators are used again, as done for the
+        trajectories of multi-trajectory solvers.
+
     kw : dict
         Additional parameters specific to a result sub-class.
 
@@ -170,7 +412,10 @@ class Result(_BaseResult):
 
     states : list of :obj:`.Qobj`
         The state at each time ``t`` (if the recording of the state was
-        requested).
+        requested). When the ``store_states`` option is an integer ``k``,
+        ``states[i]`` is the state at time ``times[i * k]``. When the
+        ``state_storage`` option is set, this is a read-only sequence of
+        states stored on the disk.
 
     final_state : :obj:`.Qobj`:
         The final state (if the recording of the final state was requested).
@@ -195,6 +440,12 @@ class Result(_BaseResult):
         The lists of expectation values returned are the *same* lists as
         those returned by ``.expect``.
 
+    events : dict
+        A dictionary containing the list of times at which each of the
+        ``events`` passed to the solver occurred. The keys are the same as in
+        the supplied ``events`` if it is a dictionary, otherwise the index of
+        the event.
+
     e_ops : dict
         A dictionary containing the supplied e_ops as ``ExpectOp`` instances.
         The keys of the dictionary are the same as for ``.e_data``.
@@ -218,6 +469,9 @@ class Result(_BaseResult):
     options: ResultOptions
     e_data: dict[Any, list[Any]]
 
+    _store_every = 1
+    _n_added = 0
+
     def __init__(
         self,
         e_ops: dict[Any, Qobj | QobjEvo | Callable[[float, Qobj], Any]],
@@ -225,6 +479,7 @@ class Result(_BaseResult):
         *,
         solver: str = None,
         stats: dict[str, Any] = None,
+        expect_cache: dict = None,
         **kw,
     ):
         super().__init__(options, solver=solver, stats=stats)
@@ -234,10 +489,30 @@ class Result(_BaseResult):
         for k, op in raw_ops.items():
             f = self._e_op_func(op)
             self.e_ops[k] = ExpectOp(op, f, self.e_data[k].append)
-            self.add_processor(self.e_ops[k]._store)
+
+        # Operators acting on the same space are evaluated together.
+        grouped = []
+        for e_op in self.e_ops.values():
+            if (
+                isinstance(e_op._f, _QobjExpectEop)
+                and e_op.op.isoper
+                and (not grouped or e_op.op._dims == grouped[0].op._dims)
+            ):
+                grouped.append(e_op)
+        # A single operator is only worth preparing if it is diagonal.
+        if len(grouped) == 1 and not _data.isdiag(grouped[0].op.data):
+            grouped = []
+        self._expect_many = None
+        if grouped:
+            self._expect_many = _ExpectManyEop(grouped, expect_cache)
+            self.add_processor(self._expect_many)
+        for e_op in self.e_ops.values():
+            if e_op not in grouped:
+                self.add_processor(e_op._store)
 
         self.times = []
         self.states = []
+        self.events = {}
         self._final_state = None
 
         self._post_init(**kw)
@@ -274,17 +549,77 @@ class Result(_BaseResult):
         store_states = store_states or (
             len(self.e_ops) == 0 and store_states is None
         )
-        if store_states:
-            self.add_processor(self._store_state, requires_copy=True)
+        # An integer ``store_states`` is the interval between stored states.
+        self._store_every = int(store_states)
+        self._n_added = 0
+        storage = self.options.get("state_storage", None)
+        if store_states and storage is not None:
+            self.states = _MemmapStates(storage)
+        if self._store_every > 1:
+            # Copies only the stored states.
+            self.add_processor(self._store_state_every)
+        elif store_states:
+            # States written to the disk are not kept: no copy needed.
+            self.add_processor(
+                self._store_state, requires_copy=storage is None
+            )
 
         store_final_state = self.options["store_final_state"]
-        if store_final_state and not store_states:
+        if store_final_state and self._store_every != 1:
             self.add_processor(self._store_final_state, requires_copy=True)
 
+    def _batch_e_ops(self):
+        """
+        Return the list of operators of the ``e_ops`` if this result only
+        records expectation values of :obj:`.Qobj` (and possibly the final
+        state). In that case, expectation values can be computed outside the
+        result for many times at once and added with :meth:`_add_batch`.
+        Return ``None`` otherwise.
+        """
+        processors = {e_op._store for e_op in self.e_ops.values()}
+        processors.add(self._store_final_state)
+        if self._expect_many is not None:
+            processors.add(self._expect_many)
+        ops = [e_op.op for e_op in self.e_ops.values()]
+        if (
+            not ops
+            or any(f not in processors for f in self._state_processors)
+            or not all(isinstance(op, Qobj) for op in ops)
+        ):
+            return None
+        return ops
+
+    def _add_batch(self, times, expects):
+        """
+        Add the expectation values of the ``e_ops`` for many times at once.
+
+        Parameters
+        ----------
+        times : list of float
+            The times of the added values.
+
+        expects : list of array_like
+            The expectation values of each ``e_ops`` at each time.
+        """
+        self.times.extend(times)
+        for e_data, values in zip(self.e_data.values(), expects):
+            e_data.extend(values)
+
     def _store_state(self, t, state):
         """Processor that stores a state in ``.states``."""
         self.states.append(state)
 
+    def _store_state_every(self, t, state):
+        """
+        Processor that stores one state every ``store_states`` states in
+        ``.states``.
+        """
+        if self._n_added % self._store_every == 0:
+            if not isinstance(self.states, _MemmapStates):
+                state = self._pre_copy(state)
+            self._store_state(t, state)
+        self._n_added += 1
+
     def _store_final_state(self, t, state):
         """Processor that writes the state to ``._final_state``."""
         self._final_state = state
@@ -331,6 +666,26 @@ class Result(_BaseResult):
         for op in self._state_processors:
             op(t, state)
 
+    def _pop(self):
+        """
+        Remove the last output added and return it as ``(t, state)`` if there
+        are no ``e_ops`` or ``(t, {key: value})`` otherwise. Used to stream
+        the output of a solver without keeping it.
+        """
+        t = self.times.pop()
+        if not self.e_ops:
+            return t, self.states.pop()
+        return t, {k: e_data.pop() for k, e_data in self.e_data.items()}
+
+    def close(self):
+        """
+        Delete the file of the states written to the ``state_storage``
+        folder. The stored states are no longer available afterwards. Does
+        nothing when the states are kept in memory.
+        """
+        if isinstance(self.states, _MemmapStates):
+            self.states._delete()
+
     def __repr__(self):
         lines = [
             f"<{self.__class__.__name__}",
@@ -362,6 +717,9 @@ class Result(_BaseResult):
     def final_state(self) -> Qobj:
         if self._final_state is not None:
             return self._final_state
-        if self.states:
+        if self.states and (
+            self._store_every <= 1
+            or (self._n_added - 1) % self._store_every == 0
+        ):
             return self.states[-1]
         return None
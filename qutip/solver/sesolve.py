@@ -7,11 +7,13 @@ from __future__ import annotations
 
 __all__ = ['sesolve', 'SESolver']
 
+import numpy as np
 from numpy.typing import ArrayLike
+from scipy.integrate import simpson, trapezoid
 from time import time
 from typing import Any, Callable
 from .. import Qobj, QobjEvo
-from ..core import data as _data
+from ..core import data as _data, stack_columns
 from ..typing import QobjEvoLike, EopsLike
 from .solver_base import Solver, _solver_deprecation, _kwargs_migration
 from ._feedback import _QobjFeedback, _DataFeedback
@@ -155,6 +157,7 @@ class SESolver(Solver):
         "progress_kwargs": {"chunk_size":10},
         "store_final_state": False,
         "store_states": None,
+        "state_storage": None,
         "normalize_output": True,
         'method': 'adams',
     }
@@ -186,10 +189,19 @@ class SESolver(Solver):
             Whether or not to store the final state of the evolution in the
             result class.
 
-        store_states: bool, default: None
+        store_states: bool, int, default: None
             Whether or not to store the state vectors or density matrices.
             On `None` the states will be saved if no expectation operators are
-            given.
+            given. If an integer ``k``, only every ``k``-th state is stored,
+            starting with the initial state.
+
+        state_storage: str, default: None
+            Folder where the stored states are written, in memory-mapped
+            files, as they are produced. The states of the result are then
+            read from the disk when accessed. A file is deleted when its
+            result is garbage collected or when ``result.close()`` is called,
+            but kept once the result is pickled. When ``None``, the states are
+            kept in memory.
 
         normalize_output: bool, default: True
             Normalize output state to hide ODE numerical errors.
@@ -212,6 +224,117 @@ class SESolver(Solver):
     def options(self, new_options: dict[str, Any]):
         Solver.options.fset(self, new_options)
 
+    def gradient(
+        self,
+        state0: Qobj,
+        tlist: ArrayLike,
+        e_op: Qobj,
+        params: list[str],
+        *,
+        args: dict[str, Any] = None,
+    ) -> tuple[float | complex, dict[str, float | complex]]:
+        """
+        Compute the expectation value of ``e_op`` at the end of the evolution
+        and its derivatives with respect to arguments of the system with the
+        adjoint method.
+
+        The state is evolved forward and stored at each time of ``tlist``.
+        Then the adjoint state is evolved backward from the last time, using
+        the same integration method. The derivative with respect to each
+        parameter is the integral over time of the overlap of the adjoint
+        state with the derivative of the system applied to the state,
+        computed with Simpson's rule on ``tlist``. The cost is about two
+        evolutions for any number of parameters, but ``tlist`` must be fine
+        enough for the quadrature to be accurate.
+
+        The derivatives of the system are obtained from
+        :meth:`.QobjEvo.derivative`: it must be in the list format with
+        coefficients built from strings, arrays or constants or from sums and
+        products of these.
+
+        Parameters
+        ----------
+        state0 : :obj:`.Qobj`
+            Initial state of the evolution.
+
+        tlist : list of double
+            Times of the evolution, used for the quadrature of the gradient.
+            The first element is the initial time of the evolution and the
+            last one the time at which the expectation value is computed.
+
+        e_op : :obj:`.Qobj`
+            Operator whose expectation value is differentiated. It must be
+            Hermitian when evolving kets.
+
+        params : list of str
+            Names of the ``args`` with respect to which to differentiate.
+
+        args : dict, optional
+            Change the ``args`` of the rhs for the evolution.
+
+        Returns
+        -------
+        value : float or complex
+            The expectation value of ``e_op`` at the last time of ``tlist``.
+
+        gradient : dict
+            The derivative of the expectation value with respect to each of
+            the ``params``.
+        """
+        tlist = np.asarray(tlist, dtype=np.float64)
+        self._argument(args)
+        data0 = self._prepare_state(state0)
+        vectorized = self._state_metadata['dims'] == self.rhs._dims[1]
+        if not vectorized and (data0.shape[1] != 1 or not e_op.isherm):
+            raise ValueError(
+                "The gradient is only available for density matrices or for "
+                "kets with an Hermitian operator."
+            )
+        derivatives = [self.rhs.derivative(param) for param in params]
+
+        self._integrator.set_state(tlist[0], data0)
+        states = [data0.copy()]
+        states += [state.copy() for _, state in self._integrator.run(tlist)]
+        final = states[-1]
+        if vectorized:
+            # tr(e_op @ rho) = <vec(e_op.dag())|vec(rho)>: the expectation
+            # value is linear in the state.
+            adjoint = stack_columns(_data.to(_data.Dense, e_op.dag().data))
+            value = _data.inner(adjoint, final)
+        else:
+            # <psi|e_op|psi>: the derivative is twice the real part of the
+            # overlap of the adjoint with the derivative of the state.
+            adjoint = _data.matmul(e_op.data, final)
+            value = _data.inner(final, adjoint).real
+
+        # The adjoint follows d adj / dt = -rhs.dag() @ adj backward in time,
+        # or d adj / ds = rhs(t_end - s).dag() @ adj forward in s.
+        t_end = tlist[-1]
+        backward = type(self._integrator)(
+            self.rhs.dag()._time_reversed(t_end), self.options
+        )
+        backward.set_state(0., adjoint)
+        adjoints = [adjoint] + [
+            state.copy() for _, state in backward.run(t_end - tlist[::-1])
+        ]
+        adjoints = adjoints[::-1]
+
+        gradient = {}
+        for param, derivative in zip(params, derivatives):
+            integrand = np.array([
+                _data.inner(adj, derivative.matmul_data(t, state))
+                for t, state, adj in zip(tlist, states, adjoints)
+            ])
+            if len(tlist) > 2:
+                grad = simpson(integrand, x=tlist)
+            else:
+                grad = trapezoid(integrand, x=tlist)
+            gradient[param] = grad if vectorized else 2 * grad.real
+        if vectorized and e_op.isherm:
+            value = value.real
+            gradient = {key: val.real for key, val in gradient.items()}
+        return value, gradient
+
     @classmethod
     def StateFeedback(
         cls,
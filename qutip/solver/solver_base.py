@@ -9,8 +9,11 @@ from typing import Any, Callable
 from .. import Qobj, QobjEvo, ket2dm
 from .options import _SolverOptions
 from ..core import stack_columns, unstack_columns
+from ..core import data as _data
+from ..core.dimensions import Dimensions
 from .. import settings
 from .result import Result
+from .events import Event
 from .integrator import Integrator
 from ..ui.progressbar import progress_bars
 from ._feedback import _ExpectFeedback
@@ -20,6 +23,18 @@ import warnings
 import numpy as np
 
 
+def _format_e_data(e_ops, e_data):
+    """
+    Return the values in ``e_data``, keyed as by ``Result._e_ops_to_dict``,
+    in the same form as ``e_ops``: a dict, a list or a single value.
+    """
+    if isinstance(e_ops, dict):
+        return e_data
+    if isinstance(e_ops, (list, tuple)):
+        return list(e_data.values())
+    return e_data[0]
+
+
 class Solver:
     """
     Runner for an evolution.
@@ -47,6 +62,7 @@ class Solver:
         "progress_kwargs": {"chunk_size": 10},
         "store_final_state": False,
         "store_states": None,
+        "state_storage": None,
         "normalize_output": True,
         "method": "adams",
     }
@@ -66,12 +82,16 @@ class Solver:
     def _initialize_stats(self):
         """ Return the initial values for the solver stats.
         """
-        return {
+        stats = {
             "method": self._integrator.name,
             "init time": self._init_integrator_time,
             "preparation time": 0.0,
             "run time": 0.0,
         }
+        if getattr(self._integrator, "selection", None):
+            # The integrator chose the ODE method (``method="auto"``).
+            stats["method selection"] = self._integrator.selection.copy()
+        return stats
 
     def _prepare_state(self, state):
         """
@@ -145,6 +165,7 @@ class Solver:
         *,
         e_ops: EopsLike | list[EopsLike] | dict[Any, EopsLike] = None,
         args: dict[str, Any] = None,
+        events: Event | list[Event] | dict[Any, Event] = None,
     ) -> Result:
         """
         Do the evolution of the Quantum system.
@@ -173,6 +194,14 @@ class Solver:
             expectation values. Function[s] must have the signature
             f(t : float, state : Qobj) -> expect.
 
+        events : :class:`.Event`, list or dict of :class:`.Event`, optional
+            Conditions monitored during the evolution. The times at which they
+            occur are stored in the ``events`` attribute of the result, keyed
+            by the keys of ``events`` if it is a dict, otherwise by the index
+            of each event in the list. If a terminal event occurs, the
+            evolution stops and the state at the time of the event is the last
+            one added to the result.
+
         Returns
         -------
         results : :obj:`.Result`
@@ -194,9 +223,23 @@ class Solver:
         progress_bar = progress_bars[self.options['progress_bar']](
             len(tlist)-1, **self.options['progress_kwargs']
         )
-        for t, state in self._integrator.run(tlist):
-            progress_bar.update()
-            results.add(t, self._restore_state(state, copy=False))
+        events = results._e_ops_to_dict(events)
+        batch_ops = None if events else self._batch_e_ops(results)
+        if events:
+            self._run_events(tlist, results, events, progress_bar)
+        elif batch_ops is not None:
+            for times, states in self._integrator.run_batches(tlist):
+                expects = self._batch_expect(batch_ops, states)
+                results._add_batch(times, expects)
+                for _ in times:
+                    progress_bar.update()
+            if results.options["store_final_state"]:
+                t, state = self._integrator.get_state(copy=False)
+                results._store_final_state(t, self._restore_state(state))
+        else:
+            for t, state in self._integrator.run(tlist):
+                progress_bar.update()
+                results.add(t, self._restore_state(state, copy=False))
         progress_bar.finished()
 
         stats['run time'] = progress_bar.total_time()
@@ -204,6 +247,179 @@ class Solver:
         # stats.update(_integrator.stats)
         return results
 
+    def run_iter(
+        self,
+        state0: Qobj,
+        tlist: ArrayLike,
+        *,
+        e_ops: EopsLike | list[EopsLike] | dict[Any, EopsLike] = None,
+        args: dict[str, Any] = None,
+    ):
+        """
+        Do the evolution of the Quantum system, yielding the output at each
+        time of ``tlist`` as soon as it is reached.
+
+        Nothing is kept between times, so the memory used does not grow
+        with the length of ``tlist``. The ``store_states`` and
+        ``store_final_state`` options are ignored.
+
+        Parameters
+        ----------
+        state0 : :obj:`.Qobj`
+            Initial state of the evolution.
+
+        tlist : list of double
+            Times at which to yield the output. The first element of the list
+            is the initial time of the evolution.
+
+        e_ops : Qobj, QobjEvo, callable, list, or dict optional
+            Single, list or dict of Qobj, QobjEvo or callable to compute the
+            expectation values. Function[s] must have the signature
+            f(t : float, state : Qobj) -> expect.
+
+        args : dict, optional
+            Change the ``args`` of the rhs for the evolution.
+
+        Yields
+        ------
+        t : float
+            Time of the output.
+
+        state_or_expect : :obj:`.Qobj`, value, list or dict
+            The state at ``t`` if no ``e_ops`` are given. Otherwise the
+            expectation values at ``t``, in the same form as ``e_ops``:
+            a single value, a list or a dict.
+
+        Notes
+        -----
+        The evolution advances as the output is consumed. Using :meth:`run`
+        or :meth:`step` before the generator is exhausted changes the state
+        of the evolution it yields from.
+        """
+        _data0 = self._prepare_state(state0)
+        self._integrator.set_state(tlist[0], _data0)
+        self._argument(args)
+        result = self._streaming_result(e_ops)
+        result.add(tlist[0], self._restore_state(_data0, copy=False))
+        t, out = result._pop()
+        yield t, out if not result.e_ops else _format_e_data(e_ops, out)
+        for t, state in self._integrator.run(tlist):
+            result.add(t, self._restore_state(state, copy=False))
+            t, out = result._pop()
+            yield t, out if not result.e_ops else _format_e_data(e_ops, out)
+
+    def _streaming_result(self, e_ops):
+        """
+        Return the result used by :meth:`run_iter` to compute its output. It
+        only stores states when there are no ``e_ops``.
+        """
+        options = {
+            **self.options,
+            "store_states": None,
+            "store_final_state": False,
+            "state_storage": None,
+        }
+        return self._resultclass(e_ops, options, solver=self.name)
+
+    def _run_events(self, tlist, results, events, progress_bar):
+        """
+        Evolve through ``tlist`` one internal step of the integrator at a time,
+        locating the ``events`` occurring in each step from the integrator's
+        dense output. Stop at the first terminal event.
+        """
+        def evaluate(event, t):
+            _, state = self._integrator.mcstep(t, copy=False)
+            return event(t, self._restore_state(state, copy=False))
+
+        t_old, state = self._integrator.get_state(copy=False)
+        qobj = self._restore_state(state, copy=False)
+        g_old = {key: event(t_old, qobj) for key, event in events.items()}
+        for key in events:
+            results.events[key] = []
+
+        for t in tlist[1:]:
+            while t_old < t:
+                t_step, state = self._integrator.mcstep(t, copy=False)
+                qobj = self._restore_state(state, copy=False)
+                g_new = {
+                    key: event(t_step, qobj) for key, event in events.items()
+                }
+                found = []
+                for key, event in events.items():
+                    if event.crossed(g_old[key], g_new[key]):
+                        t_event = event._locate(
+                            lambda t: evaluate(event, t),
+                            t_old, g_old[key], t_step, g_new[key],
+                        )
+                        found.append((float(t_event), key))
+                found.sort()
+                for t_event, key in found:
+                    results.events[key].append(t_event)
+                    if events[key].terminal:
+                        _, state = self._integrator.mcstep(t_event)
+                        # Following ``step`` calls continue from the event.
+                        self._integrator.set_state(t_event, state)
+                        results.add(
+                            t_event, self._restore_state(state, copy=False)
+                        )
+                        return
+                if found:
+                    # Root finding moved the integrator back inside the step.
+                    _, state = self._integrator.mcstep(t_step, copy=False)
+                t_old, g_old = t_step, g_new
+            progress_bar.update()
+            results.add(t, self._restore_state(state, copy=False))
+
+    def _batch_e_ops(self, results):
+        """
+        Return the e_ops operators if the expectation values can be computed
+        for many times at once from the integrator's ``run_batches``,
+        ``None`` otherwise.
+        """
+        if not self._integrator.options.get("batch_output", False):
+            return None
+        ops = results._batch_e_ops()
+        _, state = self._integrator.get_state(copy=False)
+        if ops is None or state.shape[1] != 1:
+            return None
+        # Operators must act on the space of the ket or density matrix.
+        space = self._state_metadata['dims'].to_
+        if any(op._dims != Dimensions(space, space) for op in ops):
+            return None
+        return ops
+
+    def _batch_expect(self, ops, states):
+        """
+        Compute the expectation values of ``ops`` for the states, as given by
+        the integrator, in ``states``. Return a list with an array of values
+        for each operator.
+        """
+        states = states[:, :, 0]
+        if self._state_metadata['dims'] == self.rhs._dims[1]:
+            # Column stacked density matrices: tr(op @ rho) = vec(op.T) @ rho
+            N = self._state_metadata['dims'].shape[0]
+            out = np.stack([
+                states @ op.full().ravel() for op in ops
+            ], axis=1)
+            if self._normalize_output:
+                trace = states[:, ::N + 1].sum(axis=1)
+                out /= trace[:, np.newaxis]
+        else:
+            kets = _data.Dense(states.T)
+            out = np.stack([
+                np.sum(
+                    states.conj() * _data.matmul(op.data, kets).to_array().T,
+                    axis=1,
+                )
+                for op in ops
+            ], axis=1)
+            if self._normalize_output:
+                out /= np.sum(np.abs(states)**2, axis=1)[:, np.newaxis]
+        return [
+            out[:, i].real if op.isherm else out[:, i]
+            for i, op in enumerate(ops)
+        ]
+
     def start(self, state0: Qobj, t0: Number) -> None:
         """
         Set the initial state and time for a step evolution.
@@ -602,6 +602,7 @@ class StochasticSolver(MultiTrajSolver):
         "progress_kwargs": {"chunk_size": 10},
         "store_final_state": False,
         "store_states": None,
+        "state_storage": None,
         "keep_runs_results": False,
         "normalize_output": False,
         "map": "serial",
@@ -621,10 +622,11 @@ class StochasticSolver(MultiTrajSolver):
             heterodyne=self.heterodyne,
         )
 
-    def _trajectory_resultclass(self, e_ops, options):
+    def _trajectory_resultclass(self, e_ops, options, expect_cache=None):
         return StochasticTrajResult(
             e_ops,
             options,
+            expect_cache=expect_cache,
             m_ops=self.m_ops,
             dw_factor=self.dW_factors,
             heterodyne=self.heterodyne,
@@ -741,10 +743,10 @@ class StochasticSolver(MultiTrajSolver):
                 )
         self._dW_factors = new_dW_factors
 
-    def _integrate_one_traj(self, seed, tlist, result):
+    def _iter_one_traj(self, tlist, result):
         for t, state, noise in self._integrator.run(tlist):
             result.add(t, self._restore_state(state, copy=False), noise)
-        return seed, result
+            yield
 
     def run_from_experiment(
         self,
@@ -912,10 +914,20 @@ class StochasticSolver(MultiTrajSolver):
             Whether or not to store the final state of the evolution in the
             result class.
 
-        store_states: None, bool, default: None
+        store_states: None, bool, int, default: None
             Whether or not to store the state vectors or density matrices.
             On `None` the states will be saved if no expectation operators are
-            given.
+            given. If an integer ``k``, only every ``k``-th state is stored,
+            starting with the initial state.
+
+        state_storage: str, default: None
+            Folder where the stored states are written, in memory-mapped
+            files, as they are produced. The states of the result are then
+            read from the disk when accessed. The states of the trajectories
+            kept with ``keep_runs_results`` and the average states are
+            written. A file is deleted when its result is garbage collected
+            or when ``result.close()`` is called, but kept once the result is
+            pickled. When ``None``, the states are kept in memory.
 
         store_measurement: str, {'start', 'middle', 'end', ''}, default: ""
             Whether and how to store the measurement for each trajectories.
@@ -1065,6 +1077,7 @@ class SMESolver(StochasticSolver):
         "progress_kwargs": {"chunk_size": 10},
         "store_final_state": False,
         "store_states": None,
+        "state_storage": None,
         "keep_runs_results": False,
         "normalize_output": False,
         "map": "serial",
@@ -1109,6 +1122,7 @@ class SSESolver(StochasticSolver):
         "progress_kwargs": {"chunk_size": 10},
         "store_final_state": False,
         "store_states": None,
+        "state_storage": None,
         "keep_runs_results": False,
         "normalize_output": False,
         "map": "serial",
@@ -2,6 +2,7 @@
 see `qutip/tests/core/test_expect.py`"""
 
 from .test_mathematics import BinaryOpMixin
+import pickle
 import pytest
 import numpy as np
 from qutip import data
@@ -71,3 +72,49 @@ class TestExpectSuper(BinaryOpMixin):
         pytest.param(data.expect_super_dia_dense, Dia, Dense, complex),
         pytest.param(data.expect_super_data, CSR, Dense, complex),
     ]
+
+
+@pytest.mark.parametrize("diagonal", [True, False], ids=["diag", "general"])
+@pytest.mark.parametrize("state_shape", [(20, 1), (20, 20)], ids=["ket", "dm"])
+def test_expect_many(diagonal, state_shape):
+    np.random.seed(1)
+    ops = []
+    for dtype in [CSR, Dense, Dia, CSR]:
+        if diagonal:
+            op = np.diag(np.random.rand(20) + 1j * np.random.rand(20))
+        else:
+            op = (
+                (np.random.rand(20, 20) < 0.2)
+                * (np.random.rand(20, 20) + 1j * np.random.rand(20, 20))
+            )
+        ops.append(data.to(dtype, data.Dense(op)))
+    state = data.Dense(
+        np.random.rand(*state_shape) + 1j * np.random.rand(*state_shape)
+    )
+    kernel = data.ExpectMany(ops)
+    assert kernel.diagonal == diagonal
+    expected = [data.expect(op, state) for op in ops]
+    np.testing.assert_allclose(kernel(state), expected, rtol=1e-12)
+    for dtype in [CSR, Dia]:
+        np.testing.assert_allclose(
+            data.expect_many(ops, data.to(dtype, state)), expected, rtol=1e-12
+        )
+    np.testing.assert_allclose(
+        pickle.loads(pickle.dumps(kernel))(state), expected, rtol=1e-12
+    )
+    with pytest.raises(ValueError):
+        kernel(data.Dense(np.ones((10, 1))))
+
+
+@pytest.mark.parametrize("dtype", [CSR, Dense, Dia])
+@pytest.mark.parametrize("state_shape", [(20, 1), (20, 20)], ids=["ket", "dm"])
+def test_expect_many_populations(dtype, state_shape):
+    np.random.seed(2)
+    array = np.random.rand(*state_shape) + 1j * np.random.rand(*state_shape)
+    state = data.to(dtype, data.Dense(array))
+    kernel = data.ExpectMany([data.identity(20)])
+    if state_shape[1] == 1:
+        expected = np.abs(array[:, 0])**2
+    else:
+        expected = np.diagonal(array)
+    np.testing.assert_allclose(kernel.populations(state), expected)
@@ -65,6 +65,41 @@ def test_eigen_transform():
                                    rtol=1e-14, atol=1e-14)
 
 
+@pytest.mark.parametrize("cache_size", [0, 4])
+def test_eigen_transform_cache(cache_size):
+    a = qutip.destroy(5)
+    op = qutip.QobjEvo([a*a.dag(), [a+a.dag(), lambda t: t]])
+    eigenT = _EigenBasisTransform(op, cache_size=cache_size)
+    ts = [0, 1, 1.5, 1, 0.5, 0, 1.5]
+    for t in ts:
+        eigenvals, ekets = op(t).eigenstates()
+        np.testing.assert_allclose(eigenvals, eigenT.eigenvalues(t),
+                                   rtol=1e-14, atol=1e-14)
+        np.testing.assert_allclose(
+            np.abs(np.hstack([eket.full() for eket in ekets])),
+            np.abs(eigenT.evecs(t).to_array()),
+            rtol=1e-14, atol=1e-14
+        )
+
+
+def test_eigen_transform_perturbed():
+    a = qutip.destroy(5)
+    op = qutip.QobjEvo([a*a.dag(), [a+a.dag(), lambda t: 0.1 * t]])
+    eigenT = _EigenBasisTransform(op, eigen_tol=0.02)
+    errors = []
+    for t in np.linspace(0, 1, 21):
+        oper = op(t).full()
+        evals = eigenT.eigenvalues(t)
+        evecs = eigenT.evecs(t).to_array()
+        errors.append(np.max(np.abs(evals - np.linalg.eigvalsh(oper))))
+        np.testing.assert_allclose(oper @ evecs, evecs * evals, atol=1e-3)
+        np.testing.assert_allclose(evecs.conj().T @ evecs, np.eye(5),
+                                   atol=1e-3)
+    assert max(errors) < 1e-5
+    # Some decompositions were obtained by perturbation.
+    assert max(errors) > 1e-12
+
+
 def test_eigen_transform_ket():
     N = 5
     a = qutip.destroy(N)
@@ -239,6 +274,27 @@ def test_br_term_format(func, cutoff):
     np.testing.assert_allclose(computed, expected, rtol=1e-14, atol=1e-14)
 
 
+@pytest.mark.parametrize('cutoff', [0, 0.05, 0.3, np.inf])
+def test_br_term_irregular_spectrum(cutoff):
+    # Bohr frequencies which are not multiples of each other, so the secular
+    # windows differ for each pair of states.
+    N = 8
+    np.random.seed(3)
+    diag = np.sort(np.random.rand(N))
+    skew = np.ascontiguousarray(diag[:, np.newaxis] - diag[np.newaxis, :])
+    spectrum = np.ascontiguousarray(np.random.rand(N, N))
+    A = qutip.rand_herm(N, seed=1).data
+    B = qutip.rand_herm(N, seed=2).data
+    expected = _br_term_dense(A, spectrum, skew, cutoff).to_array()
+    for func in [_br_term_sparse, _br_term_data]:
+        computed = func(A, spectrum, skew, cutoff).to_array()
+        np.testing.assert_allclose(computed, expected, rtol=1e-14, atol=1e-14)
+    expected = _br_cterm_dense(A, B, spectrum, skew, cutoff).to_array()
+    for func in [_br_cterm_sparse, _br_cterm_data]:
+        computed = func(A, B, spectrum, skew, cutoff).to_array()
+        np.testing.assert_allclose(computed, expected, rtol=1e-14, atol=1e-14)
+
+
 @pytest.mark.parametrize(
     'func',
     [_br_cterm_dense, _br_cterm_data, _br_cterm_sparse],
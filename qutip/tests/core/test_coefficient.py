@@ -6,6 +6,10 @@ import scipy.interpolate as interp
 from functools import partial
 from qutip.core.coefficient import (coefficient, norm, conj, const,
                                     CompilationOptions, Coefficient,
+                                    CoefficientBank, compile_coefficients,
+                                    StrBytecodeCoefficient,
+                                    StrFunctionCoefficient,
+                                    FusedCoefficient,
                                     clean_compiled_coefficient,
                                     WARN_MISSING_MODULE,
                                     )
@@ -251,6 +255,152 @@ def test_warn_no_cython():
         for module in ["cython", "filelock", "setuptools"]
     )
 
+@pytest.mark.parametrize(['codestring', 'args'], [
+    pytest.param("cos(2*t)*cos(t*w1) + sin(w1*w2/2*t)*sin(t*w2)"
+                 "- abs(exp(w1*w2*pi*0.25j)) ", {"w1": 2, "w2": 2}, id="long"),
+    pytest.param("t*0.5 * (2) + 5j * -0.2j", {}, id="lots_of_ctes"),
+    pytest.param("exp(-t**2 / s**2) * np.cos(w * t)", {"s": 0.3, "w": 3},
+                 id="numpy"),
+    pytest.param("sqrt(t) + log(t + 1) - arg(1j * t + 1) + norm(w * t)"
+                 " + real(w * t) + imag(w) + conj(w) + erf(t)",
+                 {"w": 1 + 2j}, id="functions"),
+    pytest.param("(t + 1)**-2 + t**0.5 + (-t)**3 + 2**t", {}, id="powers"),
+])
+def test_StrBytecodeCoefficient(codestring, args):
+    coeff = coefficient(codestring, args=args,
+                        compile_opt=CompilationOptions(use_cython=False))
+    assert isinstance(coeff, StrBytecodeCoefficient)
+    expected = StrFunctionCoefficient(codestring, args)
+    _assert_eq_over_interval(coeff, expected, inside=True)
+    new_args = {key: 1.5 for key in args}
+    _assert_eq_over_interval(
+        coeff.replace_arguments(new_args),
+        expected.replace_arguments(new_args),
+        inside=True,
+    )
+    _assert_eq_over_interval(pickle.loads(pickle.dumps(coeff)), expected,
+                             inside=True)
+
+
+@pytest.mark.parametrize(['codestring', 'args'], [
+    pytest.param("cos(t*vec[1])", {'vec': np.ones(2)}, id="subscript"),
+    pytest.param("t if t > 0 else 0", {}, id="branch"),
+    pytest.param("func(t)", {'func': np.sin}, id="function_arg"),
+    pytest.param("sin(t * a)", {'a': np.ones(2)}, id="array_arg"),
+])
+def test_StrBytecodeCoefficient_unsupported(codestring, args):
+    with pytest.raises(ValueError):
+        StrBytecodeCoefficient(codestring, args)
+    coeff = coefficient(codestring, args=args,
+                        compile_opt=CompilationOptions(use_cython=False))
+    assert isinstance(coeff, StrFunctionCoefficient)
+
+
+def _assert_derivative(coeff, tlist):
+    derivative = coeff.derivative()
+    assert isinstance(derivative, Coefficient)
+    dt = 1e-6
+    finite_diff = (coeff(tlist + dt) - coeff(tlist - dt)) / (2 * dt)
+    np.testing.assert_allclose(derivative(tlist), finite_diff, atol=1e-7)
+
+
+@pytest.mark.parametrize('base', [
+    pytest.param("sin(w * t) * t**3", id="product"),
+    pytest.param("exp(-t / tau) / (1 + t)", id="quotient"),
+    pytest.param("np.sqrt(1 + t * t) + erf(t) + atan(t)", id="functions"),
+    pytest.param("norm(exp(1j * w * t) * t) + abs(t - 1j)", id="norm"),
+    pytest.param("cos(t)**t + conj(w * t * 1j)", id="power"),
+])
+@pytest.mark.parametrize('use_cython', [
+    pytest.param(False, id="bytecode"),
+    pytest.param(True, id="compiled", marks=pytest.mark.requires_cython),
+])
+def test_derivative_str(base, use_cython):
+    coeff = coefficient(base, args={"w": 2., "tau": 1.5},
+                        compile_opt=CompilationOptions(use_cython=use_cython))
+    _assert_derivative(coeff, np.linspace(0.1, 2.9, 15))
+    coeff = coeff.replace_arguments(w=0.5)
+    _assert_derivative(coeff, np.linspace(0.1, 2.9, 15))
+
+
+@pytest.mark.parametrize('use_cython', [
+    pytest.param(False, id="bytecode"),
+    pytest.param(True, id="compiled", marks=pytest.mark.requires_cython),
+])
+def test_derivative_arg(use_cython):
+    args = {"w": 2., "tau": 1.5}
+    coeff = coefficient("exp(-t / tau) * sin(w * t)", args=args,
+                        compile_opt=CompilationOptions(use_cython=use_cython))
+    tlist = np.linspace(0.1, 2.9, 15)
+    for arg in args:
+        dp = 1e-6
+        finite_diff = (
+            coeff(tlist, {arg: args[arg] + dp})
+            - coeff(tlist, {arg: args[arg] - dp})
+        ) / (2 * dp)
+        np.testing.assert_allclose(
+            coeff.derivative(arg)(tlist), finite_diff, atol=1e-7
+        )
+    inter = coefficient(np.ones(11), tlist=np.linspace(0, 1, 11))
+    assert (coeff * inter).derivative("w")(0.5) == coeff.derivative("w")(0.5)
+
+
+@pytest.mark.parametrize('order', [1, 2, 3])
+def test_derivative_inter(order):
+    tlist = np.linspace(0, 3, 31)
+    coeff = coefficient(np.sin(tlist) * tlist, tlist=tlist, order=order)
+    # Avoid the knots where linear interpolations are not differentiable.
+    _assert_derivative(coeff, tlist[1:-1] + 0.05)
+    assert np.all(coeff.derivative()(np.array([-1., 4.])) == 0)
+
+
+def test_derivative_tree():
+    tlist = np.linspace(0, 3, 31)
+    f = coefficient("sin(w * t)", args={"w": 2.},
+                    compile_opt=CompilationOptions(use_cython=False))
+    g = coefficient(np.cos(tlist), tlist=tlist)
+    tree = conj(f) * g + const(2) * norm(f) + f
+    _assert_derivative(tree, np.linspace(0.1, 2.9, 15))
+    _assert_derivative(tree.optimize(), np.linspace(0.1, 2.9, 15))
+    assert const(3).derivative()(1.) == 0
+    with pytest.raises(NotImplementedError):
+        coefficient(np.sin).derivative()
+
+
+def test_optimize_folding():
+    tlist = np.linspace(0, 1, 11)
+    inter = coefficient(np.sin(tlist), tlist=tlist)
+    assert (const(2) * const(3) + const(1)).optimize()(0.5) == 7
+    assert isinstance((const(2) + const(3)).optimize(), type(const(1)))
+    step = coefficient(np.cos(tlist), tlist=tlist, order=0)
+    for tree in [
+        const(2) * inter,
+        conj(inter) + inter * const(1) + const(0) * step,
+        step * step,
+    ]:
+        optimized = tree.optimize()
+        assert type(optimized) is type(inter)
+        _assert_eq_over_interval(optimized, tree, rtol=1e-12)
+
+
+def test_optimize_fused():
+    opt = CompilationOptions(use_cython=False)
+    f = coefficient("exp(-w * t)", args={"w": 0.5}, compile_opt=opt)
+    g = coefficient("cos(w * t)", args={"w": 2.}, compile_opt=opt)
+    h = coefficient(np.sin, args={})
+    tree = conj(f) * g + const(2) * norm(h) + const(3) * (const(0.5) * f)
+    fused = tree.optimize()
+    assert isinstance(fused, FusedCoefficient)
+    _assert_eq_over_interval(fused, tree, rtol=1e-12)
+    _assert_eq_over_interval(
+        fused.replace_arguments(w=1.), tree.replace_arguments(w=1.),
+        rtol=1e-12
+    )
+    _assert_eq_over_interval(
+        pickle.loads(pickle.dumps(fused)), tree, rtol=1e-12
+    )
+
+
 @pytest.mark.requires_cython
 @pytest.mark.parametrize(['codestring', 'args', 'reference'], [
     pytest.param("cos(2*t)*cos(t*w1) + sin(w1*w2/2*t)*sin(t*w2)"
@@ -362,6 +512,61 @@ def test_Coeffcopy(style, transform):
     _assert_eq_over_interval(coeff, coeff_cp)
 
 
+@pytest.mark.parametrize(['style'], [
+    pytest.param("func", id="func"),
+    pytest.param("array", id="array"),
+    pytest.param("arraylog", id="logarray"),
+    pytest.param("string", id="string"),
+    pytest.param("steparray", id="steparray"),
+    pytest.param("steparraylog", id="steparraylog"),
+    pytest.param("const", id="constant"),
+])
+@pytest.mark.parametrize(['transform'], [
+    pytest.param(_pass, id="single"),
+    pytest.param(_add, id="sum"),
+    pytest.param(conj, id="conj"),
+])
+def test_CoeffCallArray(style, transform):
+    coeff = transform(coeff_generator(style, "f"))
+    times = np.linspace(-0.1, 1.1, 24).reshape(4, 6)
+    values = coeff(times)
+    assert values.shape == times.shape
+    expected = [coeff(t) for t in times.ravel()]
+    np.testing.assert_allclose(values.ravel(), expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize('order', [0, 3])
+def test_CoeffArrayNonMonotonousCalls(order):
+    # The interval search starts from the last interval found.
+    rng = np.random.default_rng(1)
+    tlist = np.sort(np.concatenate([[0, 1], rng.random(500)]))
+    coeff = coefficient(np.sin(5 * tlist), tlist=tlist, order=order)
+    times = np.concatenate([
+        np.linspace(0, 1, 1000), rng.random(1000), np.linspace(1, 0, 100)
+    ])
+    expected = coeff(times)
+    np.testing.assert_allclose([coeff(t) for t in times], expected,
+                               rtol=1e-12, atol=1e-15)
+
+
+@pytest.mark.parametrize('order', [0, 1, 3])
+def test_CoefficientBank(order):
+    arrays = np.array([f_asarraylog, g(tlistlog, **args), tlistlog**2])
+    bank = CoefficientBank(arrays, tlistlog, order=order)
+    assert len(bank) == 3
+    times = np.linspace(-0.1, 1.1, 25)
+    values = bank(times)
+    assert values.shape == (3, 25)
+    for i, array in enumerate(arrays):
+        expected = coefficient(array, tlist=tlistlog, order=order)
+        _assert_eq_over_interval(bank[i], expected)
+        np.testing.assert_allclose(values[i], expected(times), rtol=1e-12)
+    np.testing.assert_allclose(bank(0.5), values[:, 12])
+    # Coefficients of a bank share their time grid but not their values.
+    assert bank[0](0.5) != bank[1](0.5)
+    assert bank[1](0.5) == pytest.approx(values[1, 12], rel=1e-12)
+
+
 @pytest.mark.parametrize('order', [0, 1, 2, 3])
 def test_CoeffArray(order):
     tlist = np.linspace(0, 1, 101)
@@ -422,6 +627,129 @@ def test_CoeffFromScipyBSpline(imag):
     _assert_eq_over_interval(coverted, raw_scipy, rtol=1e-8, inside=True)
 
 
+@pytest.mark.requires_cython
+def test_compile_coefficients(tmp_path):
+    old_root = qutip.settings.coeffroot
+    qutip.settings.coeffroot = str(tmp_path)
+    try:
+        bases = ["cos(w * t) * t * t * t", "sin(w * t) * exp(-t) * t * t",
+                 "t * t * t + w * w * w"]
+        compile_coefficients(bases, args={"w": 2.})
+        # One module is built for all strings.
+        assert len(list(tmp_path.glob("qtcoeff_batch_*.pyx"))) == 1
+        opt = CompilationOptions(recompile=False)
+        for base in bases:
+            coeff = coefficient(base, args={"w": 3.}, compile_opt=opt)
+            assert "qtcoeff_batch_" in type(coeff).__module__
+            expected = coefficient(
+                base, args={"w": 3.},
+                compile_opt=CompilationOptions(use_cython=False)
+            )
+            _assert_eq_over_interval(coeff, expected)
+            coeff_pick = pickle.loads(pickle.dumps(coeff, -1))
+            _assert_eq_over_interval(coeff_pick, expected)
+        assert len(list(tmp_path.glob("qtcoeff_batch_*.pyx"))) == 1
+        assert not list(tmp_path.glob("*.tmp*"))
+    finally:
+        qutip.settings.coeffroot = old_root
+
+
+@pytest.mark.requires_cython
+def test_compile_coefficients_batch_error(tmp_path, monkeypatch):
+    import sys
+    # ``qutip.core.coefficient`` is shadowed by the function of the same name.
+    coeff_module = sys.modules["qutip.core.coefficient"]
+    build = coeff_module._build_extension
+
+    def failing_batch(code, file_name, c_opt):
+        if file_name.startswith("qtcoeff_batch_"):
+            raise Exception("Could not compile")
+        return build(code, file_name, c_opt)
+
+    monkeypatch.setattr(coeff_module, "_build_extension", failing_batch)
+    monkeypatch.setattr(qutip.settings, "coeffroot", str(tmp_path))
+    bases = ["cos(w * t) * t * t * w", "sin(w * t) * exp(-t) * t * w"]
+    compile_coefficients(bases, args={"w": 2.})
+    # Each string is compiled alone instead.
+    assert len(list(tmp_path.glob("qtcoeff_*.pyx"))) == 2
+    for base in bases:
+        coeff = coefficient(base, args={"w": 3.})
+        assert type(coeff).__module__.startswith("qtcoeff_")
+        assert "qtcoeff_batch_" not in type(coeff).__module__
+
+
+def test_qobjevo_compile_opt(tmp_path, monkeypatch):
+    monkeypatch.setattr(qutip.settings, "coeffroot", str(tmp_path))
+    qevo = qutip.QobjEvo(
+        [[qutip.sigmax(), "cos(w * t) * t * t * t * w"],
+         [qutip.sigmaz(), "sin(w * t) * t * t * t * w"]],
+        args={"w": 2.},
+        compile_opt=CompilationOptions(use_cython=False),
+    )
+    assert not list(tmp_path.glob("*.pyx"))
+    expected = (
+        np.cos(2. * 0.5) * 0.5**3 * 2. * qutip.sigmax()
+        + np.sin(2. * 0.5) * 0.5**3 * 2. * qutip.sigmaz()
+    )
+    assert qevo(0.5) == expected
+
+
+_SHARED_CACHE_SCRIPT = """
+import sys, math, qutip
+qutip.settings.coeffroot = sys.argv[1]
+qutip.settings.coeff_cache = sys.argv[2]
+coeff = qutip.coefficient("cos(t) * t * 3.25 + w", args={"w": 1.})
+assert abs(coeff(1.) - 3.25 * math.cos(1.) - 1.) < 1e-12
+print(type(coeff).__module__, sys.modules[type(coeff).__module__].__file__)
+"""
+
+
+@pytest.mark.requires_cython
+def test_shared_coefficient_cache(tmp_path):
+    import os
+    import subprocess
+    import sys
+    # Import the tested qutip in the subprocesses, even if not installed.
+    qutip_root = os.path.dirname(os.path.dirname(qutip.__file__))
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(
+            [qutip_root] + ([os.environ["PYTHONPATH"]]
+                            if os.environ.get("PYTHONPATH") else [])
+        ),
+    }
+    cache = tmp_path / "cache"
+    outputs = []
+    for root in ["root_a", "root_b"]:
+        (tmp_path / root).mkdir()
+        out = subprocess.run(
+            [sys.executable, "-c", _SHARED_CACHE_SCRIPT,
+             str(tmp_path / root), str(cache)],
+            capture_output=True, text=True, check=True, env=env,
+        )
+        # The compiler also writes to stdout.
+        outputs.append(out.stdout.splitlines()[-1].split())
+    # The first process compiles and publishes the coefficient, the second
+    # imports it from the cache without compiling.
+    assert outputs[0][0] == outputs[1][0]
+    assert outputs[1][1].startswith(str(cache))
+    assert not list((tmp_path / "root_b").glob("*.pyx"))
+
+
+def test_shared_coefficient_cache_eviction(tmp_path):
+    from qutip.core.coefficient import _evict_from_cache
+    import os
+    for i in range(4):
+        path = tmp_path / f"qtcoeff_{i}.py"
+        path.write_bytes(b"0" * 1000)
+        os.utime(path, (i, i))
+    _evict_from_cache(tmp_path, 2500)
+    # Least recently used files are removed first.
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "qtcoeff_2.py", "qtcoeff_3.py"
+    ]
+
+
 @pytest.mark.parametrize('map_func', [
     pytest.param(qutip.solver.parallel.parallel_map, id='parallel_map'),
     pytest.param(qutip.solver.parallel.loky_pmap, id='loky_pmap'),
@@ -2,6 +2,7 @@ import pytest
 from importlib.util import find_spec
 
 from numbers import Number
+import pickle
 
 import numpy as np
 from scipy.integrate import quad_vec
@@ -502,6 +503,30 @@ class TestBosonicEnvironment:
         assert_equivalent(env, ref, skip_cf=skip_cf, skip_sd=skip_sd,
                           tol=tol, wMax=wMax)
 
+    def test_cached_fft(self):
+        ref = OhmicReference(3, .75, 10, 1)
+        wlist = np.linspace(0, 15, 200)
+        env = BosonicEnvironment.from_spectral_density(
+            ref.spectral_density(wlist), wlist=wlist, T=ref.T
+        )
+        tlist = np.linspace(0, 5, 50)
+        cf = env.correlation_function(tlist)
+        cache = dict(env._fft_cache)
+        assert len(cache) == 1
+        # A smaller range reuses the same transform.
+        np.testing.assert_allclose(env.correlation_function(tlist[:10]),
+                                   cf[:10])
+        assert env._fft_cache == cache
+        # A larger range computes a transform covering at least twice the
+        # previous range.
+        env.correlation_function(np.linspace(0, 6, 50))
+        (key, (tMax, _)), = env._fft_cache.items()
+        assert tMax == 10
+
+        env = pickle.loads(pickle.dumps(env))
+        np.testing.assert_allclose(env.correlation_function(tlist), cf,
+                                   atol=1e-6)
+
     @pytest.mark.parametrize(["reference", "tMax"], [
         pytest.param(DLReference(.5, .1, .5), 15, id="DL Example"),
     ])
@@ -568,6 +593,38 @@ class TestBosonicEnvironment:
                     "params_real", "params_imag", "summary"]:
             assert key in info
 
+    @pytest.mark.parametrize(["reference", "tMax", "tol", "N"], [
+        pytest.param(DLReference(.5, .1, .5), 15, 1e-2, None, id="DL Example"),
+        pytest.param(SingleExponentReference(1, 2 + .5j, None), 10, 1e-8,
+                     (2, 2), id="Exponential function"),
+    ])
+    def test_esprit(self, reference, tMax, tol, N):
+        env = BosonicEnvironment.from_correlation_function(
+            reference.correlation_function, tag="test"
+        )
+        tlist = np.linspace(0, tMax, 301)[1:]  # exclude t=0
+        fit, info = env.approx_by_esprit(tlist, target_rmse=1e-5)
+
+        assert isinstance(fit, ExponentialBosonicEnvironment)
+        assert fit.T == env.T
+        assert fit.tag == ("test", "ESPRIT")
+        assert_equivalent(
+            fit, env, tol=tol, skip_sd=True, skip_ps=True, tMax=tMax
+        )
+
+        if N is not None:
+            assert (info["Nr"], info["Ni"]) == N
+        assert info["rmse_real"] <= 1e-5
+        assert info["rmse_imag"] <= 1e-5
+        for key in ["fit_time", "summary"]:
+            assert key in info
+
+        with pytest.raises(ValueError):
+            env.approx_by_esprit(tlist**2)
+        if not np.isfinite(env.correlation_function(0)):
+            with pytest.raises(ValueError):
+                env.approx_by_esprit(np.linspace(0, tMax, 300))
+
     @pytest.mark.parametrize(["reference", "wMax", "tol"], [
         pytest.param(OhmicReference(3, .75, 10, 1), 15, 5e-2, id="DL Example"),
     ])
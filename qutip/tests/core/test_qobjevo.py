@@ -469,6 +469,28 @@ def test_compress():
     _assert_qobjevo_equivalent(obj2, obj3)
 
 
+def test_derivative():
+    coeff = coefficient("w * t * t", args={"w": 2.})
+    obj = QobjEvo([qeye(2), [sigmax(), coeff]])
+    assert obj.derivative()(1.5) == sigmax() * 6.
+    assert obj.derivative("w")(1.5) == sigmax() * 2.25
+    with pytest.raises(NotImplementedError):
+        QobjEvo(lambda t: qeye(2)).derivative()
+
+
+def test_compress_constant_coefficients():
+    obj = QobjEvo(
+        [qeye(2), [qeye(2), coefficient(2.)], [sigmax(), "t"],
+         [sigmax(), coefficient(lambda t: -t)]],
+        compress=False,
+    )
+    compressed = obj.copy()
+    compressed.compress()
+    # Constant coefficients are folded in the constant part.
+    assert compressed.num_elements == 2
+    _assert_qobjevo_equivalent(obj, compressed)
+
+
 @pytest.mark.parametrize(['qobjdtype'],
     [pytest.param(dtype, id=dtype.__name__)
      for dtype in _data.to.dtypes])
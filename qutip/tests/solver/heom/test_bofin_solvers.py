@@ -46,6 +46,31 @@ from qutip.solver import (
 )
 
 
+def _rhs_by_labels(hsolver):
+    """
+    Make the RHS of the HEOM by computing each block from its ADO labels.
+    Reference implementation of ``HEOMSolver._rhs``.
+    """
+    ops = _GatherHEOMRHS(
+        hsolver.ados.idx, block=hsolver._sup_shape, nhe=hsolver._n_ados
+    )
+
+    for he_n in hsolver.ados.labels:
+        op = hsolver._grad_n(he_n)
+        ops.add_op(he_n, he_n, op)
+        for k in range(len(hsolver.ados.dims)):
+            next_he = hsolver.ados.next(he_n, k)
+            if next_he is not None:
+                op = hsolver._grad_next(he_n, k)
+                ops.add_op(he_n, next_he, op)
+            prev_he = hsolver.ados.prev(he_n, k)
+            if prev_he is not None:
+                op = hsolver._grad_prev(he_n, k)
+                ops.add_op(he_n, prev_he, op)
+
+    return ops.gather()
+
+
 def fill_options(**kwargs):
     """Fill the options with minimal entries needed by HEOMResult."""
     return {
@@ -116,6 +141,46 @@ class TestHierarchyADOs:
         assert ados.prev((1, 1), 1) == (1, 0)
         assert ados.prev((0, 2), 1) == (0, 1)
 
+    def test_neighbours(self):
+        ados = HierarchyADOs(self.mk_exponents([2, 3, 4]), max_depth=3)
+        labels, next_idx, prev_idx = ados._neighbours()
+        assert [tuple(label) for label in labels] == ados.labels
+        for i, label in enumerate(ados.labels):
+            for k in range(3):
+                next_label = ados.next(label, k)
+                prev_label = ados.prev(label, k)
+                assert next_idx[i, k] == (
+                    -1 if next_label is None else ados.idx(next_label)
+                )
+                assert prev_idx[i, k] == (
+                    -1 if prev_label is None else ados.idx(prev_label)
+                )
+
+    def test_threshold(self):
+        exponents = [
+            BathExponent("I", 3, Q=None, ck=1.0, vk=2.0),
+            BathExponent("I", 3, Q=None, ck=1.0, vk=10.0),
+        ]
+        ados = HierarchyADOs(exponents, max_depth=2, threshold=0.1)
+        # Importances: (0, 1) -> 0.1, (1, 0) -> 0.5, (2, 0) -> 0.25,
+        # (0, 2) -> 0.01, (1, 1) -> 0.05.
+        assert ados.threshold == 0.1
+        assert ados.labels == [(0, 0), (0, 1), (1, 0), (2, 0)]
+        assert ados.next((1, 0), 0) == (2, 0)
+        assert ados.next((1, 0), 1) is None
+        assert ados.next((0, 1), 1) is None
+        _, next_idx, _ = ados._neighbours()
+        assert next_idx.tolist() == [[2, 1], [-1, -1], [3, -1], [-1, -1]]
+
+    def test_threshold_keeps_connected_labels(self):
+        exponents = [
+            BathExponent("I", 3, Q=None, ck=0.1, vk=1.0),
+            BathExponent("I", 3, Q=None, ck=100.0, vk=1.0),
+        ]
+        ados = HierarchyADOs(exponents, max_depth=2, threshold=1.0)
+        # (1, 1) has an importance of 10 but (1, 0) is dropped.
+        assert ados.labels == [(0, 0), (0, 1), (0, 2)]
+
     def test_exps(self):
         ados = HierarchyADOs(self.mk_exponents([3, 3, 2]), max_depth=4)
         assert ados.exps((0, 0, 0)) == ()
@@ -637,6 +702,113 @@ class TestHEOMSolver:
         assert hsolver.ados.exponents == exponents * 3
         assert hsolver.ados.max_depth == 2
 
+    @pytest.mark.parametrize("odd_parity", [False, True])
+    def test_rhs_by_labels(self, odd_parity):
+        Q = sigmaz()
+        H = sigmax()
+        exponents = [
+            BathExponent("+", 2, Q=Q, ck=1.1, vk=2.1, sigma_bar_k_offset=1),
+            BathExponent("-", 2, Q=Q, ck=1.2, vk=2.2, sigma_bar_k_offset=-1),
+            BathExponent("R", None, Q=Q, ck=1.1, vk=2.1),
+            BathExponent("I", None, Q=sigmax(), ck=1.2, vk=2.2),
+            BathExponent("RI", None, Q=Q, ck=1.3, vk=2.3, ck2=3.3),
+        ]
+        hsolver = HEOMSolver(H, Bath(exponents), 3, odd_parity=odd_parity)
+        np.testing.assert_allclose(
+            hsolver._rhs().to_array(),
+            _rhs_by_labels(hsolver).to_array(),
+            atol=1e-14,
+        )
+
+    @pytest.mark.parametrize("odd_parity", [True, False])
+    @pytest.mark.parametrize("td", [True, False])
+    def test_matrix_free(self, odd_parity, td):
+        Q = sigmaz()
+        H = sigmax()
+        if td:
+            H = QobjEvo([H, [sigmaz(), "cos(t)"]])
+        exponents = [
+            BathExponent("+", 2, Q=Q, ck=1.1, vk=2.1, sigma_bar_k_offset=1),
+            BathExponent("-", 2, Q=Q, ck=1.2, vk=2.2, sigma_bar_k_offset=-1),
+            BathExponent("R", None, Q=Q, ck=1.1, vk=2.1),
+            BathExponent("I", None, Q=sigmax(), ck=1.2, vk=2.2),
+            BathExponent("RI", None, Q=Q, ck=1.3, vk=2.3, ck2=3.3),
+        ]
+        hsolver = HEOMSolver(H, Bath(exponents), 3, odd_parity=odd_parity)
+        mf_solver = HEOMSolver(
+            H, Bath(exponents), 3, odd_parity=odd_parity, matrix_free=True
+        )
+        N = hsolver.rhs.shape[0]
+        state = np.random.rand(N, 1) + 1j * np.random.rand(N, 1)
+        state = _data.Dense(state)
+        np.testing.assert_allclose(
+            mf_solver.rhs.matmul_data(0.5, state).to_array(),
+            hsolver.rhs.matmul_data(0.5, state).to_array(),
+            atol=1e-12,
+        )
+        np.testing.assert_allclose(
+            mf_solver.rhs(0.5).full(), hsolver.rhs(0.5).full(), atol=1e-14,
+        )
+
+        rho0 = basis(2, 0) * basis(2, 0).dag()
+        tlist = np.linspace(0, 1, 5)
+        options = {"progress_bar": None}
+        hsolver.options = options
+        mf_solver.options = options
+        np.testing.assert_allclose(
+            mf_solver.run(rho0, tlist, e_ops=[sigmaz()]).expect[0],
+            hsolver.run(rho0, tlist, e_ops=[sigmaz()]).expect[0],
+            atol=1e-6,
+        )
+
+    def test_ado_threshold(self):
+        Q = sigmaz()
+        H = sigmax()
+        exponents = [
+            BathExponent("R", None, Q=Q, ck=1.1, vk=2.1),
+            BathExponent("I", None, Q=sigmax(), ck=0.1, vk=2.2),
+        ]
+        hsolver = HEOMSolver(H, Bath(exponents), 3, ado_threshold=0.01)
+        assert hsolver._n_ados == 7
+        np.testing.assert_allclose(
+            hsolver._rhs().to_array(),
+            _rhs_by_labels(hsolver).to_array(),
+            atol=1e-14,
+        )
+
+    def test_ado_filter(self):
+        Q = sigmaz()
+        H = sigmax()
+        exponents = [
+            BathExponent("R", None, Q=Q, ck=1.1, vk=2.1),
+            BathExponent("I", None, Q=sigmax(), ck=1.2, vk=2.2),
+        ]
+        hsolver = HEOMSolver(H, Bath(exponents), 3)
+        mf_solver = HEOMSolver(
+            H, Bath(exponents), 3, matrix_free=True,
+            options={"ado_filter": 1e-3},
+        )
+        ados = np.random.rand(hsolver._n_ados, 4) + 0.1
+        ados[[2, 5, 7]] *= 1e-4
+        state = _data.Dense(ados.reshape(-1, 1))
+        filtered = ados.copy()
+        filtered[[2, 5, 7]] = 0
+        filtered = _data.Dense(filtered.reshape(-1, 1))
+        np.testing.assert_allclose(
+            mf_solver.rhs.matmul_data(0, state).to_array(),
+            hsolver.rhs.matmul_data(0, filtered).to_array(),
+            atol=1e-12,
+        )
+
+        with pytest.raises(ValueError) as err:
+            HEOMSolver(
+                H, Bath(exponents), 3, options={"ado_filter": 1e-3},
+            )
+        assert "matrix_free" in str(err.value)
+        with pytest.raises(ValueError):
+            hsolver.options = {"ado_filter": 1e-3}
+        assert hsolver.options["ado_filter"] is None
+
     def test_create_bath_errors(self):
         Q = sigmaz()
         H = sigmax()
@@ -768,6 +940,36 @@ class TestHEOMSolver:
         fid = fidelity(rho_final, result.states[-1])
         np.testing.assert_allclose(fid, 1.0, atol=atol)
 
+    @pytest.mark.parametrize("method", ["gmres", "lgmres", "bicgstab"])
+    @pytest.mark.parametrize("matrix_free", [True, False])
+    def test_steady_state_iterative(self, method, matrix_free):
+        H_sys = 0.25 * sigmaz() + 0.5 * sigmay()
+        bath = DrudeLorentzBath(sigmaz(), lam=0.025,
+                                gamma=0.05, T=1/0.95, Nk=2)
+        hsolver = HEOMSolver(H_sys, bath, 5, matrix_free=matrix_free)
+        rho_direct, ado_direct = hsolver.steady_state()
+
+        rho_ss, ado_state = hsolver.steady_state(method=method, rtol=1e-10)
+        np.testing.assert_allclose(
+            rho_ss.full(), rho_direct.full(), atol=1e-7
+        )
+        np.testing.assert_allclose(
+            ado_state._ado_state, ado_direct._ado_state, atol=1e-7
+        )
+
+        rho_warm, _ = hsolver.steady_state(
+            method=method, state0=ado_state, rtol=1e-10, maxiter=1
+        )
+        np.testing.assert_allclose(rho_warm.full(), rho_ss.full(), atol=1e-7)
+
+    def test_steady_state_unknown_method(self):
+        hsolver = HEOMSolver(
+            sigmax(), DrudeLorentzBath(sigmaz(), 0.1, 0.5, 1, 2), 2
+        )
+        with pytest.raises(ValueError) as err:
+            hsolver.steady_state(method="unknown")
+        assert str(err.value) == "Unknown steady state method 'unknown'."
+
     @pytest.mark.parametrize(['terminator'], [
         pytest.param(True, id="terminator"),
         pytest.param(False, id="noterminator"),
@@ -246,6 +246,23 @@ def test_time_dependent_spline_in_c_ops():
     assert np.mean(np.abs(brme.expect[0] - exact) / exact) < 1e-5
 
 
+@pytest.mark.parametrize("options", [
+    pytest.param({"eigen_cache": 0}, id="no cache"),
+    pytest.param({"eigen_tol": 0.02}, id="perturbed"),
+])
+def test_eigen_options(options):
+    N = 5
+    a = qutip.destroy(N)
+    H = [a.dag()*a + 0.1*(a*a + a.dag()*a.dag()), [a + a.dag(), "0.1*sin(t)"]]
+    a_ops = [[a + a.dag(), "0.05 * (w > 0)"]]
+    psi0 = qutip.fock_dm(N, 2)
+    times = np.linspace(0, 5, 11)
+    e_ops = [a.dag()*a]
+    expected = brmesolve(H, psi0, times, a_ops, e_ops=e_ops).expect[0]
+    brme = brmesolve(H, psi0, times, a_ops, e_ops=e_ops, options=options)
+    np.testing.assert_allclose(brme.expect[0], expected, atol=1e-3)
+
+
 @pytest.mark.slow
 def test_nonhermitian_e_ops():
     N = 5
@@ -328,3 +328,35 @@ def test_G2():
     expected = np.ones(11)
     np.testing.assert_allclose(g1, expected, rtol=2e-5)
     np.testing.assert_allclose(G1, expected * scale**4, rtol=2e-5)
+
+
+def test_heom_correlation():
+    from scipy.linalg import expm
+    from qutip.solver.heom import HEOMSolver, DrudeLorentzBath
+
+    H = 0.5 * qutip.sigmaz() + 0.3 * qutip.sigmax()
+    bath = DrudeLorentzBath(qutip.sigmaz(), lam=0.2, gamma=0.5, T=1, Nk=1)
+    solver = HEOMSolver(H, bath, 2, options={"atol": 1e-10, "rtol": 1e-8})
+    rho0 = qutip.basis(2, 0).proj()
+    a = qutip.destroy(2)
+    tlist = [0, 0.5, 1.]
+    taulist = np.linspace(0, 2, 5)
+
+    corr = qutip.correlation_3op(
+        solver, rho0, tlist, taulist, a.dag(), qutip.sigmaz(), a
+    )
+
+    # Propagate the full hierarchy with the exponential of its generator.
+    L = solver.rhs(0).full()
+    n_ados = len(solver.ados.labels)
+    apply_ops = np.kron(np.eye(n_ados), qutip.sprepost(a, a.dag()).full())
+    state = np.zeros(L.shape[0], dtype=complex)
+    state[:4] = rho0.full().ravel("F")
+    expected = np.zeros((len(tlist), len(taulist)), dtype=complex)
+    for i, t in enumerate(tlist):
+        state_t = apply_ops @ expm(L * t) @ state
+        for j, tau in enumerate(taulist):
+            rho = (expm(L * tau) @ state_t)[:4].reshape(2, 2, order="F")
+            expected[i, j] = np.trace(qutip.sigmaz().full() @ rho)
+
+    np.testing.assert_allclose(corr, expected, atol=1e-6)
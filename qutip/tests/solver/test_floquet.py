@@ -341,3 +341,11 @@ def test_fsesolve_fallback():
     ffstate = fmmesolve(H, psi0, [0, 1], T=1.).final_state
     fstate = sesolve(H, psi0, [0, 1]).final_state
     assert (ffstate - fstate).norm() < 1e-5
+
+
+def test_fmesolver_gradient():
+    H = [sigmaz(), [sigmax(), "A * cos(t)"]]
+    fbasis = FloquetBasis(H, 2 * np.pi, args={"A": 0.3})
+    solver = FMESolver(fbasis, [(sigmax(), lambda w: 0.1 * (w > 0))])
+    with pytest.raises(NotImplementedError):
+        solver.gradient(rand_ket(2), [0, 1], sigmaz(), ["A"])
@@ -189,3 +189,62 @@ def test_pickling_vern_methods(integrator):
         result1 = inter.integrate(t)[1].to_array()[0, 0]
         result2 = recreated.integrate(t)[1].to_array()[0, 0]
         assert result1 == result2 == expected
+
+
+@pytest.mark.parametrize(['H', 'c_ops', 'method'], [
+    pytest.param(qutip.num(5), [], 'diag', id="constant"),
+    pytest.param([qutip.num(5), [qutip.qeye(5), "t"]], [], None,
+                 id="time-dependent"),
+    pytest.param(qutip.num(5), [100 * qutip.destroy(5)], 'bdf', id="stiff"),
+])
+def test_auto_method_selection(H, c_ops, method):
+    options = {"method": "auto", "progress_bar": None, "nsteps": 1e5}
+    tlist = np.linspace(0, 1, 11)
+    psi0 = qutip.basis(5, 2)
+    result = qutip.mesolve(H, psi0, tlist, c_ops, e_ops=qutip.num(5),
+                           options=options)
+    selection = result.stats["method selection"]
+    assert selection["method"] in MESolver.avail_integrators()
+    if method is not None:
+        assert selection["method"] == method
+    options = {"method": selection["method"], "progress_bar": None}
+    if selection["method"] != "diag":
+        options["nsteps"] = 1e5
+    expected = qutip.mesolve(H, psi0, tlist, c_ops, e_ops=qutip.num(5),
+                             options=options)
+    assert_allclose(result.expect[0], expected.expect[0], atol=1e-5)
+
+
+def test_auto_method_selection_args():
+    solver = MESolver(
+        qutip.num(10),
+        [qutip.QobjEvo([qutip.destroy(10), "sqrt(g)"], args={"g": 0.1})],
+        options={"method": "auto", "progress_bar": None, "nsteps": 1e5},
+    )
+    tlist = np.linspace(0, 1, 11)
+    psi0 = qutip.coherent(10, 2)
+    result = solver.run(psi0, tlist, args={"g": 0.1})
+    assert result.stats["method selection"]["method"] != "bdf"
+    # The method is selected again for the new args.
+    result = solver.run(psi0, tlist, args={"g": 30})
+    assert result.stats["method selection"]["method"] == "bdf"
+
+
+@pytest.mark.parametrize('method', ['vern7', 'vern9'])
+@pytest.mark.parametrize('c_ops', [[], [qutip.destroy(5)]], ids=["se", "me"])
+def test_batch_output(method, c_ops):
+    H = [qutip.num(5), [qutip.destroy(5) + qutip.create(5), "cos(t)"]]
+    tlist = np.linspace(0, 2, 501)
+    e_ops = [qutip.num(5), qutip.destroy(5)]
+    options = {"method": method, "progress_bar": None,
+               "store_final_state": True}
+    expected = qutip.mesolve(H, qutip.basis(5, 2), tlist, c_ops,
+                             e_ops=e_ops, options=options)
+    options["batch_output"] = True
+    result = qutip.mesolve(H, qutip.basis(5, 2), tlist, c_ops,
+                           e_ops=e_ops, options=options)
+    assert result.times == pytest.approx(tlist)
+    assert result.expect[0].dtype == np.float64
+    for value, ref in zip(result.expect, expected.expect):
+        assert_allclose(value, ref, atol=1e-10)
+    assert result.final_state == expected.final_state
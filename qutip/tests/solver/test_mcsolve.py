@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 import pytest
 import numpy as np
 import qutip
@@ -510,6 +511,55 @@ def test_MCSolver_run():
     assert 1 < res.num_trajectories < 1001
 
 
+def test_MCSolver_run_iter():
+    size = 5
+    H = qutip.num(size)
+    solver = MCSolver(H, [0.5 * qutip.destroy(size)])
+    solver.options = {"keep_runs_results": True, "map": "serial"}
+    tlist = np.linspace(0, 2, 11)
+    psi0 = qutip.basis(size, size - 1)
+    res = solver.run(psi0, tlist, 3, e_ops=[qutip.num(size)], seeds=[1, 2, 3])
+    output = list(solver.run_iter(
+        psi0, tlist, 3, e_ops=[qutip.num(size)], seeds=[1, 2, 3]
+    ))
+    assert len(output) == 3 * len(tlist)
+    for trajectory in range(3):
+        values = [out[0] for i, _, out in output if i == trajectory]
+        np.testing.assert_allclose(values, res.runs_expect[0][trajectory])
+
+
+@pytest.mark.parametrize("keep_runs_results", [True, False])
+def test_MCSolver_state_storage(tmp_path, keep_runs_results):
+    size = 5
+    solver = MCSolver(qutip.num(size), [0.5 * qutip.destroy(size)])
+    solver.options = {
+        "keep_runs_results": keep_runs_results,
+        "state_storage": str(tmp_path),
+        "store_states": True,
+        "progress_bar": False,
+    }
+    tlist = np.linspace(0, 2, 11)
+    psi0 = qutip.basis(size, size - 1)
+    res = solver.run(psi0, tlist, 4, seeds=[1, 2, 3, 4])
+    if keep_runs_results:
+        assert len(list(tmp_path.iterdir())) == 4
+        assert len(res.runs_states[0]) == len(tlist)
+        assert res.runs_states[2][-1].norm() == pytest.approx(1)
+    else:
+        # Only kept trajectories are written to the disk, with the sum of
+        # the states.
+        assert len(list(tmp_path.iterdir())) == 1
+    solver.options = {"state_storage": None}
+    expected = solver.run(psi0, tlist, 4, seeds=[1, 2, 3, 4]).average_states
+    assert isinstance(res.average_states, Sequence)
+    assert not isinstance(res.average_states, list)
+    assert len(res.average_states) == len(tlist)
+    for state, expected_state in zip(res.average_states, expected):
+        assert (state - expected_state).norm() < 1e-12
+    res.close()
+    assert not list(tmp_path.iterdir())
+
+
 def test_MCSolver_stepping():
     size = 10
     a = qutip.QobjEvo([qutip.destroy(size), 'coupling'], args={'coupling': 0})
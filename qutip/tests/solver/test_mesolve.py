@@ -711,3 +711,73 @@ def test_non_normalized_dm(rho0):
     solver = qutip.MESolver(H, c_ops=[qutip.sigmaz()])
     result = solver.run(rho0, np.linspace(0, 1, 10), e_ops=[qutip.qeye(2)])
     np.testing.assert_allclose(result.expect[0], rho0.tr(), atol=1e-7)
+
+
+@pytest.mark.parametrize('method', ['adams', 'bdf', 'vern7', 'diag'])
+def test_terminal_event(method):
+    N = 10
+    a = qutip.destroy(N)
+    solver = MESolver(a.dag() * a, c_ops=[a], options={"method": method})
+    event = qutip.solver.Event(
+        qutip.num(N), 0.01, direction=-1, terminal=True
+    )
+    result = solver.run(
+        qutip.basis(N, 5), np.linspace(0, 20, 21),
+        e_ops=[qutip.num(N)], events=[event],
+    )
+    t_event = np.log(5 / 0.01)
+    assert result.events[0] == pytest.approx([t_event], abs=1e-5)
+    assert result.times[-1] == result.events[0][0]
+    assert result.expect[0][-1] == pytest.approx(0.01, abs=1e-6)
+    # The evolution can be continued from the event.
+    state = solver.step(t_event + 1)
+    assert qutip.expect(qutip.num(N), state) == pytest.approx(
+        0.01 / np.e, abs=1e-6
+    )
+
+
+@pytest.mark.parametrize('direction', [-1, 0, 1])
+def test_event_direction(direction):
+    solver = qutip.SESolver(qutip.sigmax())
+    event = qutip.solver.Event(qutip.sigmaz(), direction=direction)
+    result = solver.run(
+        qutip.basis(2, 0), np.linspace(0, 6, 7),
+        e_ops=[qutip.sigmaz()], events={"z": event},
+    )
+    # <sz> = cos(2t) crosses zero downward at pi/4, upward at 3pi/4...
+    crossings = np.pi / 4 * np.arange(1, 8, 2)
+    if direction == -1:
+        crossings = crossings[::2]
+    elif direction == 1:
+        crossings = crossings[1::2]
+    np.testing.assert_allclose(result.events["z"], crossings, atol=1e-5)
+    assert result.times[-1] == 6
+
+
+def test_gradient():
+    args = {"A": 0.7, "w": 1.3}
+    tlist = np.linspace(0, 5, 201)
+    tlist_coeff = np.linspace(0, 5, 51)
+    # Product of a string coefficient with an interpolated envelope.
+    coeff = qutip.coefficient(
+        "A * cos(w * t)", args=args,
+        compile_opt=qutip.CompilationOptions(use_cython=False)
+    ) * qutip.coefficient(np.exp(-tlist_coeff / 5), tlist=tlist_coeff)
+    H = qutip.QobjEvo([0.5 * qutip.sigmaz(), [qutip.sigmax(), coeff]])
+    c_ops = [np.sqrt(0.1) * qutip.sigmam()]
+    solver = MESolver(H, c_ops, options={"atol": 1e-10, "rtol": 1e-10})
+    rho0 = qutip.ket2dm(qutip.basis(2, 0))
+    e_op = qutip.sigmaz()
+    value, gradient = solver.gradient(rho0, tlist, e_op, ["A", "w"], args=args)
+
+    def final_expect(args):
+        return solver.run(rho0, tlist, e_ops=[e_op], args=args).expect[0][-1]
+
+    assert value == pytest.approx(final_expect(args), abs=1e-7)
+    dp = 1e-5
+    for param in ["A", "w"]:
+        finite_diff = (
+            final_expect({**args, param: args[param] + dp})
+            - final_expect({**args, param: args[param] - dp})
+        ) / (2 * dp)
+        assert gradient[param] == pytest.approx(finite_diff, abs=1e-5)
@@ -652,6 +652,55 @@ def test_NonMarkovianMCSolver_run():
     assert 1 < res.num_trajectories < 1001
 
 
+def test_NonMarkovianMCSolver_run_iter():
+    a = qutip.destroy(2)
+    ops_and_rates = [
+        [a.dag(), 0.5],
+        [a, qutip.coefficient("2 - 4 * exp(-2*t**3) * sin(15*t)**2")],
+    ]
+    solver = NonMarkovianMCSolver(a.dag() * a, ops_and_rates)
+    solver.options = {"map": "serial"}
+    tlist = np.linspace(0, 0.5, 11)
+    psi0 = qutip.basis(2, 1)
+    seeds = list(range(20))
+    e_ops = [a.dag() * a]
+    res = solver.run(psi0, tlist, 20, e_ops=e_ops, seeds=seeds)
+
+    output = list(solver.run_iter(psi0, tlist, 20, e_ops=e_ops, seeds=seeds))
+    expect = np.zeros(len(tlist))
+    for _, t, out in output:
+        expect[np.searchsorted(tlist, t)] += out[0] / 20
+    np.testing.assert_allclose(expect, res.expect[0], rtol=1e-6)
+
+    output = solver.run_iter(psi0, tlist, 20, seeds=seeds)
+    states = [0] * len(tlist)
+    for _, t, state in output:
+        assert state.isoper
+        states[np.searchsorted(tlist, t)] += state / 20
+    np.testing.assert_allclose(
+        qutip.expect(e_ops[0], states), res.expect[0], rtol=1e-6
+    )
+
+
+def test_NonMarkovianMCSolver_store_states_every():
+    a = qutip.destroy(2)
+    ops_and_rates = [
+        [a.dag(), 0.5],
+        [a, qutip.coefficient("2 - 4 * exp(-2*t**3) * sin(15*t)**2")],
+    ]
+    solver = NonMarkovianMCSolver(a.dag() * a, ops_and_rates)
+    tlist = np.linspace(0, 2, 21)
+    psi0 = qutip.basis(2, 1)
+    results = {}
+    for store_states in [True, 2]:
+        solver.options = {"map": "serial", "store_states": store_states}
+        results[store_states] = solver.run(psi0, tlist, 50, seeds=1)
+    full = results[True].states
+    assert len(results[2].states) == len(full[::2])
+    for state, expected in zip(results[2].states, full[::2]):
+        assert (state - expected).norm() < 1e-10
+
+
 def test_NonMarkovianMCSolver_stepping():
     size = 10
     args = {'coupling': 0}
@@ -1,3 +1,6 @@
+import gc
+import pickle
+
 import numpy as np
 import pytest
 
@@ -108,6 +111,120 @@ class TestResult:
                 np.testing.assert_allclose(res.e_data[k], results[k])
                 np.testing.assert_allclose(e_op_call_values, results[k])
 
+    @pytest.mark.parametrize("state_type", ["ket", "dm"])
+    def test_many_e_ops(self, state_type):
+        N = 5
+        e_ops = {
+            "num": qutip.num(N),
+            "x": qutip.create(N) + qutip.destroy(N),
+            "a": qutip.destroy(N),
+            "func": lambda t, state: t,
+            "evo": qutip.QobjEvo(qutip.num(N)),
+            "proj": qutip.fock_dm(N, 1),
+        }
+        res = Result(e_ops, fill_options())
+        # Diagonal and general operators are evaluated separately.
+        assert len(res._expect_many._groups) == 2
+        states = [qutip.rand_ket(N) for _ in range(3)]
+        if state_type == "dm":
+            states = [qutip.ket2dm(state) for state in states]
+        for t, state in enumerate(states):
+            res.add(t, state)
+        for key in ["num", "x", "a", "proj"]:
+            expected = qutip.expect(e_ops[key], states)
+            np.testing.assert_allclose(res.e_data[key], expected)
+            assert isinstance(res.e_data[key][0], type(expected[0]))
+        np.testing.assert_allclose(res.e_data["func"], [0, 1, 2])
+        np.testing.assert_allclose(
+            res.e_data["evo"], qutip.expect(e_ops["num"], states)
+        )
+
+    def test_expect_cache(self):
+        N = 5
+        e_ops = [qutip.num(N), qutip.destroy(N)]
+        cache = {}
+        res1 = Result(e_ops, fill_options(), expect_cache=cache)
+        res2 = Result(e_ops, fill_options(), expect_cache=cache)
+        res3 = Result(e_ops, fill_options())
+        assert (
+            res1._expect_many._groups[0][0] is res2._expect_many._groups[0][0]
+        )
+        assert (
+            res1._expect_many._groups[0][0]
+            is not res3._expect_many._groups[0][0]
+        )
+        res4 = Result(e_ops[::-1], fill_options(), expect_cache=cache)
+        assert cache["expect_many"][0] == tuple(e_ops[::-1])
+        state = qutip.rand_ket(N)
+        for res in [res1, res4]:
+            res.add(0, state)
+        assert res1.expect[0][0] == res4.expect[1][0]
+
+    @pytest.mark.parametrize("dtype", ["CSR", "Dense", "Dia"])
+    def test_diagonal_e_op(self, dtype):
+        N = 6
+        e_op = qutip.num(N, dtype=dtype)
+        res = Result(e_op, fill_options())
+        assert res._expect_many._groups[0][0].diagonal
+        states = [qutip.rand_dm(N, dtype="csr"), qutip.rand_ket(N)]
+        for t, state in enumerate(states):
+            res.add(t, state)
+        np.testing.assert_allclose(res.expect[0], qutip.expect(e_op, states))
+        assert isinstance(res.expect[0][0], float)
+
+    @pytest.mark.parametrize("store_final_state", [True, False])
+    def test_store_states_every(self, store_final_state):
+        N = 9
+        res = Result([], fill_options(
+            store_states=3, store_final_state=store_final_state
+        ))
+        for i in range(N):
+            res.add(i, qutip.basis(N, i))
+        assert res.states == [qutip.basis(N, i) for i in range(0, N, 3)]
+        if store_final_state:
+            assert res.final_state == qutip.basis(N, N - 1)
+        else:
+            # The last state is not one of the stored states.
+            assert res.final_state is None
+
+    def test_state_storage(self, tmp_path):
+        N = 10
+        res = Result([], fill_options(
+            store_states=True, state_storage=str(tmp_path)
+        ))
+        states = [qutip.rand_dm(N) for _ in range(5)]
+        for i, state in enumerate(states):
+            res.add(i, state)
+        assert len(list(tmp_path.iterdir())) == 1
+        assert len(res.states) == 5
+        assert list(res.states) == states
+        assert res.states[-2:] == states[-2:]
+        assert res.final_state == states[-1]
+        assert res.final_state.dims == [[N], [N]]
+        with pytest.raises(IndexError):
+            res.states[5]
+        copy = pickle.loads(pickle.dumps(res))
+        assert list(copy.states) == states
+        with pytest.raises(ValueError):
+            res.add(5, qutip.basis(N, 0))
+        # Once pickled, the file outlives the result.
+        del res
+        gc.collect()
+        assert list(copy.states) == states
+        copy.close()
+        assert len(copy.states) == 0
+        assert not list(tmp_path.iterdir())
+
+    def test_state_storage_deleted(self, tmp_path):
+        res = Result([], fill_options(
+            store_states=True, state_storage=str(tmp_path)
+        ))
+        res.add(0, qutip.basis(3, 0))
+        assert len(list(tmp_path.iterdir())) == 1
+        del res
+        gc.collect()
+        assert not list(tmp_path.iterdir())
+
     def test_add_processor(self):
         res = Result([], fill_options(store_states=False))
         a = []
@@ -337,3 +337,60 @@ def test_feedback():
     solver = qutip.SESolver(H)
     result = solver.run(psi0, np.linspace(0, 30, 301), e_ops=[qutip.num(N)])
     assert np.all(result.expect[0] > 2 - tol)
+
+
+@pytest.mark.parametrize("e_ops", [
+    pytest.param(None, id="states"),
+    pytest.param(qutip.num(5), id="single"),
+    pytest.param([qutip.num(5), qutip.destroy(5)], id="list"),
+    pytest.param({"n": qutip.num(5), "f": lambda t, state: t}, id="dict"),
+])
+def test_run_iter(e_ops):
+    H = qutip.num(5) + 0.3 * (qutip.create(5) + qutip.destroy(5))
+    psi0 = qutip.basis(5, 1)
+    tlist = np.linspace(0, 1, 11)
+    solver = SESolver(H)
+    expected = solver.run(psi0, tlist, e_ops=e_ops)
+    output = list(solver.run_iter(psi0, tlist, e_ops=e_ops))
+    np.testing.assert_allclose([t for t, _ in output], tlist)
+    if e_ops is None:
+        for (_, state), state_expected in zip(output, expected.states):
+            assert state == state_expected
+    elif isinstance(e_ops, dict):
+        for key, values in expected.e_data.items():
+            np.testing.assert_allclose([out[key] for _, out in output], values)
+    elif isinstance(e_ops, list):
+        for i, values in enumerate(expected.expect):
+            np.testing.assert_allclose([out[i] for _, out in output], values)
+    else:
+        np.testing.assert_allclose(
+            [out for _, out in output], expected.expect[0]
+        )
+
+
+@pytest.mark.parametrize('method', ['adams', 'vern7'])
+def test_gradient(method):
+    args = {"A": 0.7, "w": 1.3}
+    tlist = np.linspace(0, 5, 201)
+    coeff = qutip.coefficient(
+        "A * cos(w * t)", args=args,
+        compile_opt=qutip.CompilationOptions(use_cython=False)
+    )
+    H = qutip.QobjEvo([0.5 * qutip.sigmaz(), [qutip.sigmax(), coeff]])
+    options = {"method": method, "atol": 1e-10, "rtol": 1e-10}
+    solver = SESolver(H, options=options)
+    psi0 = qutip.basis(2, 0)
+    e_op = qutip.sigmaz()
+    value, gradient = solver.gradient(psi0, tlist, e_op, ["A", "w"], args=args)
+
+    def final_expect(args):
+        return solver.run(psi0, tlist, e_ops=[e_op], args=args).expect[0][-1]
+
+    assert value == pytest.approx(final_expect(args), abs=1e-7)
+    dp = 1e-5
+    for param in ["A", "w"]:
+        finite_diff = (
+            final_expect({**args, param: args[param] + dp})
+            - final_expect({**args, param: args[param] - dp})
+        ) / (2 * dp)
+        assert gradient[param] == pytest.approx(finite_diff, abs=1e-5)
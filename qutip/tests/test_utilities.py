@@ -142,4 +142,35 @@ class TestFitting:
         assert rmse < 1e-8
         print(params)
         assert (np.all(np.isclose(params, [fparams1, fparams2], atol=1e-3)) or
-                np.all(np.isclose(params, [fparams2, fparams1], atol=1e-3)))
\ No newline at end of file
+                np.all(np.isclose(params, [fparams2, fparams1], atol=1e-3)))
+
+    def jac(self, x, a, b, c):
+        exp = np.exp(-(b + 1j * c) * x)
+        return [
+            np.real(exp), np.real(-x * a * exp), np.real(-1j * x * a * exp)
+        ]
+
+    def test_jacobian(self):
+        x = np.linspace(0, 10, 100)
+        fparams1 = [1, .5, 0]
+        fparams2 = [3, 2, .5]
+        y = self.model(x, *fparams1) + self.model(x, *fparams2)
+
+        rmse, params = utils.iterated_fit(
+            self.model, num_params=3, xdata=x, ydata=y,
+            lower=[-np.inf, -np.inf, 0], target_rmse=1e-8, Nmax=2,
+            jac=self.jac, warm_start=True)
+
+        assert rmse < 1e-8
+        assert (np.all(np.isclose(params, [fparams1, fparams2], atol=1e-3)) or
+                np.all(np.isclose(params, [fparams2, fparams1], atol=1e-3)))
+
+    def test_jacobian_of_sum(self):
+        x = np.linspace(0, 10, 20)
+        params = np.array([[1, .5, 0], [3, 2, .5]])
+        jacobian = utils._jacobian(self.jac, x, params)
+        assert jacobian.shape == (20, 6)
+        np.testing.assert_allclose(jacobian[:, :3], np.array(
+            self.jac(x, *params[0])).T)
+        np.testing.assert_allclose(jacobian[:, 3:], np.array(
+            self.jac(x, *params[1])).T)
\ No newline at end of file
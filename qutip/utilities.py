@@ -8,7 +8,7 @@ from __future__ import annotations
 
 __all__ = ['n_thermal', 'clebsch', 'convert_unit', 'iterated_fit']
 
-from typing import Callable
+from typing import Callable, Sequence
 
 import numpy as np
 from numpy.typing import ArrayLike
@@ -360,7 +360,9 @@ def iterated_fit(
     lower: ArrayLike = None,
     upper: ArrayLike = None,
     sigma: float | ArrayLike = None,
-    maxfev: int = None
+    maxfev: int = None,
+    jac: Callable[..., Sequence[ArrayLike]] = None,
+    warm_start: bool = False,
 ) -> tuple[float, ArrayLike]:
     r"""
     Iteratively tries to fit the given data with a model of the form
@@ -408,6 +410,18 @@ def iterated_fit(
         ``scipy.optimize.curve_fit``.
     maxfev : optional, int
         The maximum number of function evaluations (per value of ``N``).
+    jac : optional, callable
+        The derivatives of the model function. It takes the same arguments
+        as `fun` and returns the list of the `n` derivatives of `fun` with
+        respect to its parameters. It must support broadcasting: it is called
+        with `xdata` as a column and arrays of the parameters of all the
+        terms, so that the jacobian of the full model is computed at once.
+        An exact jacobian cannot separate terms with identical initial
+        guesses, so it is only used for the fits started from the previous
+        parameters with `warm_start`. Other fits use finite differences.
+    warm_start : optional, bool (default False)
+        Whether to start the fit with `N` terms from the parameters found
+        with `N-1` terms, using the initial guess only for the new term.
 
     Returns
     -------
@@ -432,6 +446,7 @@ def iterated_fit(
 
     N = Nmin
     rmse1 = np.inf
+    params = None
 
     while rmse1 > target_rmse and N <= Nmax:
         if guess is None:
@@ -443,12 +458,17 @@ def iterated_fit(
                     "The shape of the provided fit guesses is not consistent")
         else:
             guesses = np.tile(guess, (N, 1))
+        guesses = np.asarray(guesses, dtype=float)
+        fit_jac = None
+        if warm_start and params is not None:
+            guesses[:len(params)] = params
+            fit_jac = jac
 
         lower_repeat = np.tile(lower, N)
         upper_repeat = np.tile(upper, N)
         rmse1, params = _fit(fun, num_params, xdata, ydata,
                              guesses, lower_repeat,
-                             upper_repeat, sigma, maxfev)
+                             upper_repeat, sigma, maxfev, jac=fit_jac)
         N += 1
 
     return rmse1, params
@@ -474,6 +494,14 @@ def _evaluate(fun, x, params):
     return result
 
 
+def _jacobian(jac, x, params):
+    # Jacobian of the sum of terms with respect to the packed parameters,
+    # computed for all the terms at once.
+    x = np.asarray(x)
+    derivatives = np.broadcast_arrays(*jac(x[:, None], *params.T))
+    return np.stack(derivatives, axis=-1).reshape(len(x), -1)
+
+
 def _rmse(fun, xdata, ydata, params):
     """
     The normalized root mean squared error for the fit with the given
@@ -489,7 +517,7 @@ def _rmse(fun, xdata, ydata, params):
 
 
 def _fit(fun, num_params, xdata, ydata, guesses, lower, upper, sigma,
-         maxfev, method='trf'):
+         maxfev, method='trf', jac=None):
     # fun: model function
     # num_params: number of parameters in fun
     # xdata, ydata: data to be fit
@@ -499,6 +527,7 @@ def _fit(fun, num_params, xdata, ydata, guesses, lower, upper, sigma,
     # sigma: data uncertainty (useful to control when values are small)
     # maxfev: how many times the parameters can be altered, lower is faster but
     #         less accurate
+    # jac: derivatives of fun with respect to its parameters, or None
     if (upper <= lower).all():
         return _rmse(fun, xdata, ydata, guesses), guesses
 
@@ -513,6 +542,11 @@ def _fit(fun, num_params, xdata, ydata, guesses, lower, upper, sigma,
     if sigma is not None and not hasattr(sigma, "__len__"):
         sigma = [sigma] * len(xdata)
 
+    if jac is not None:
+        maxfev_arg["jac"] = lambda x, *packed_params: _jacobian(
+            jac, x, _unpack(np.array(packed_params), num_params)
+        )
+
     packed_params, _ = curve_fit(
         lambda x, *packed_params: _evaluate(
             fun, x, _unpack(packed_params, num_params)